@@ -19,6 +19,8 @@ class Chain(object):
         fixed_tau=None,
         tau_window=None,
         block_length=100000,
+        tau_method="online",
+        float32_keys=None,
     ):
         """Object to store a single mcmc chain
 
@@ -47,8 +49,19 @@ class Chain(object):
             Only calculate the autocorrelation time in a trailing window. If
             None (default) this method is not used.
         block_length: int
-            The incremental size to extend the array by when it runs out of
-            space.
+            The number of samples in each block of storage. A new block is
+            allocated when the chain runs out of space: existing samples are
+            not copied.
+        tau_method: str ("online")
+            The method used to estimate the autocorrelation time. Either
+            "online" (an incremental batch-means estimate which falls back to
+            the FFT estimate when it is unreliable) or "fft" (the
+            emcee.autocorr estimate over the full chain at every call).
+        float32_keys: list (None)
+            Keys stored in single precision to reduce the memory use and the
+            size of checkpoint files. The current sample is always kept in
+            double precision, so this only affects stored samples. If None
+            (default) all keys are stored in double precision.
         """
         self.autocorr_c = autocorr_c
         self.min_tau = min_tau
@@ -58,11 +71,16 @@ class Chain(object):
         self.fixed_discard = int(fixed_discard)
         self.fixed_tau = fixed_tau
         self.tau_window = tau_window
+        self.tau_method = tau_method
 
         self.ndim = initial_sample.ndim
         self.current_sample = initial_sample
         self.keys = self.current_sample.keys
         self.parameter_keys = self.current_sample.parameter_keys
+        self.float32_keys = list(float32_keys or [])
+        unknown_keys = set(self.float32_keys) - set(self.keys)
+        if len(unknown_keys) > 0:
+            raise SamplerError(f"Unknown float32_keys {unknown_keys}")
 
         # Initialize chain
         self._chain_array = self._get_zero_chain_array()
@@ -76,19 +94,38 @@ class Chain(object):
         self._minimum_index_adapt = 0
         self._last_minimum_index = (0, 0, "I")
         self.last_full_tau_dict = {key: np.inf for key in self.parameter_keys}
+        self._act_estimator = None
 
         # Append the initial sample
         self.append(self.current_sample)
 
     def _get_zero_chain_array(self):
-        return np.zeros((self.block_length, self.ndim + 2), dtype=np.float64)
+        return ChunkedChainArray(
+            ncolumns=self.ndim + 2,
+            block_length=self.block_length,
+            float32_columns=[self.key_to_idx(key) for key in self.float32_keys],
+        )
 
     def _extend_chain_array(self):
-        self._chain_array = np.concatenate(
-            (self._chain_array, self._get_zero_chain_array()), axis=0
-        )
+        self._chain_array.extend()
         self._chain_array_length = len(self._chain_array)
 
+    def __getstate__(self):
+        # Only store the filled part of the chain
+        state = self.__dict__.copy()
+        state["_chain_array"] = self._chain_array.truncated(self.position + 1)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if isinstance(self._chain_array, np.ndarray):
+            # Convert chains stored as a single array by older versions
+            self.float32_keys = []
+            self._chain_array = ChunkedChainArray.from_array(
+                self._chain_array, block_length=self.block_length
+            )
+            self._chain_array_length = len(self._chain_array)
+
     @property
     def current_sample(self):
         return self._current_sample.copy()
@@ -128,6 +165,10 @@ class Chain(object):
 
         self._chain_array[index] = sample.list
 
+        # Discard any accumulated ACT information which includes this sample
+        if getattr(self, "_act_estimator", None) is not None:
+            self._act_estimator.truncate(index)
+
     def key_to_idx(self, key):
         return self.keys.index(key)
 
@@ -301,10 +342,33 @@ class Chain(object):
         """Calculate a dictionary of tau (ACT) for every parameter"""
         return self._calculate_tau_dict(self.minimum_index)
 
-    def _calculate_tau_dict(self, minimum_index):
+    @property
+    def tau_dict_fft(self):
+        """Calculate a dictionary of tau (ACT) using the full FFT estimate
+
+        This ignores the tau_method and can be used to verify the online
+        estimate.
+        """
+        return self._calculate_tau_dict(self.minimum_index, tau_method="fft")
+
+    @property
+    def act_estimator(self):
+        """The incremental estimator of the ACT used by the online tau_method"""
+        if getattr(self, "_act_estimator", None) is None:
+            self._act_estimator = BatchMeansACT(
+                columns=[self.key_to_idx(key) for key in self.parameter_keys]
+            )
+        return self._act_estimator
+
+    def _calculate_tau_dict(self, minimum_index, tau_method=None):
         """Calculate a dictionary of tau (ACT) for every parameter"""
         logger.debug(f"Calculating tau_dict {self}")
 
+        if tau_method is None:
+            tau_method = getattr(self, "tau_method", "online")
+        if tau_method not in ["online", "fft"]:
+            raise SamplerError(f"Unknown tau_method {tau_method}")
+
         # If there are too few samples to calculate tau
         if (self.position - minimum_index) < 2 * self.autocorr_c:
             return {key: np.inf for key in self.parameter_keys}
@@ -318,12 +382,25 @@ class Chain(object):
         else:
             minimum_index_for_act = minimum_index
 
+        # Update the online estimate: this only uses the new samples
+        if self.fixed_tau is None and tau_method == "online":
+            estimator = self.act_estimator
+            estimator.update(self._chain_array, self.position + 1)
+            online_taus = estimator.integrated_time(
+                minimum_index_for_act, self.autocorr_c
+            )
+        else:
+            online_taus = np.full(self.ndim, np.nan)
+
         # Calculate a dictionary of tau's for each parameter
         taus = {}
-        for key in self.parameter_keys:
+        for key, online_tau in zip(self.parameter_keys, online_taus):
             if self.fixed_tau is None:
-                x = self.get_1d_array(key)[minimum_index_for_act:]
-                tau = calculate_tau(x, self.autocorr_c)
+                if np.isnan(online_tau):
+                    x = self.get_1d_array(key)[minimum_index_for_act:]
+                    tau = calculate_tau(x, self.autocorr_c)
+                else:
+                    tau = online_tau
                 taux = round(tau, 1)
             else:
                 taux = self.fixed_tau
@@ -539,3 +616,320 @@ def calculate_tau(x, autocorr_c=5):
         return tau
     except emcee.autocorr.AutocorrError:
         return np.inf
+
+
+class ChunkedChainArray(object):
+    def __init__(self, ncolumns, block_length, float32_columns=None):
+        """Append-only two-dimensional array stored in fixed-size blocks
+
+        Extending the array allocates a new block instead of copying the
+        existing rows. Rows and columns are indexed as for a numpy array
+        (only integer rows and slices with a positive step are supported) and
+        values are always returned in double precision.
+
+        Parameters
+        ----------
+        ncolumns: int
+            The number of columns
+        block_length: int
+            The number of rows in each block
+        float32_columns: list (None)
+            The indices of columns to store in single precision
+        """
+        self.ncolumns = int(ncolumns)
+        self.block_length = int(block_length)
+        float32_columns = sorted(set(float32_columns or []))
+        float64_columns = [
+            ii for ii in range(self.ncolumns) if ii not in float32_columns
+        ]
+        self._groups = [
+            (dtype, columns)
+            for dtype, columns in [
+                (np.float64, float64_columns),
+                (np.float32, float32_columns),
+            ]
+            if len(columns) > 0
+        ]
+        # The group and position within the group of each column
+        self._column_map = {
+            column: (gg, jj)
+            for gg, (_, columns) in enumerate(self._groups)
+            for jj, column in enumerate(columns)
+        }
+        self._blocks = []
+        self.extend()
+
+    @classmethod
+    def from_array(cls, array, block_length, float32_columns=None):
+        """Create a ChunkedChainArray holding a copy of a 2D array"""
+        array = np.asarray(array)
+        chunked = cls(array.shape[1], block_length, float32_columns=float32_columns)
+        while len(chunked) < len(array):
+            chunked.extend()
+        for start in range(0, len(array), chunked.block_length):
+            stop = min(start + chunked.block_length, len(array))
+            chunked[start:stop] = array[start:stop]
+        return chunked
+
+    def __len__(self):
+        return len(self._blocks) * self.block_length
+
+    @property
+    def nbytes(self):
+        return sum(arr.nbytes for block in self._blocks for arr in block)
+
+    def extend(self):
+        """Add an empty block to the end of the array"""
+        self._blocks.append(
+            [
+                np.zeros((self.block_length, len(columns)), dtype=dtype)
+                for dtype, columns in self._groups
+            ]
+        )
+
+    def truncated(self, length):
+        """A shallow copy containing only the first length rows
+
+        Blocks are shared with this array. Missing rows are restored as zeros
+        when the copy is unpickled.
+        """
+        nblocks = -(-int(length) // self.block_length)
+        truncated = object.__new__(type(self))
+        truncated.__dict__.update(self.__dict__)
+        truncated._blocks = [list(block) for block in self._blocks[:nblocks]]
+        remainder = int(length) - (nblocks - 1) * self.block_length
+        if nblocks > 0 and remainder < self.block_length:
+            truncated._blocks[-1] = [arr[:remainder] for arr in truncated._blocks[-1]]
+        return truncated
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for block in self._blocks:
+            for gg, arr in enumerate(block):
+                if len(arr) < self.block_length:
+                    padded = np.zeros(
+                        (self.block_length, arr.shape[1]), dtype=arr.dtype
+                    )
+                    padded[: len(arr)] = arr
+                    block[gg] = padded
+
+    def _parse_index(self, index):
+        if isinstance(index, tuple):
+            rows, columns = index
+        else:
+            rows, columns = index, slice(None)
+
+        if isinstance(rows, slice):
+            start, stop, step = rows.indices(len(self))
+            if step < 1:
+                raise IndexError("Only slices with a positive step are supported")
+            scalar_row = False
+        else:
+            start = int(rows)
+            if start < 0:
+                start += len(self)
+            if not 0 <= start < len(self):
+                raise IndexError(f"Index {rows} out of bounds")
+            stop, step, scalar_row = start + 1, 1, True
+
+        scalar_column = np.ndim(columns) == 0 and not isinstance(columns, slice)
+        columns = np.atleast_1d(np.arange(self.ncolumns)[columns])
+        return start, stop, step, columns, scalar_row, scalar_column
+
+    def _pieces(self, start, stop, step, columns):
+        """Yield the output rows, block and local slice covering the rows"""
+        groups = {}
+        for kk, column in enumerate(columns):
+            gg, jj = self._column_map[column]
+            groups.setdefault(gg, ([], []))
+            groups[gg][0].append(kk)
+            groups[gg][1].append(jj)
+
+        row = 0
+        index = start
+        while index < stop:
+            block = index // self.block_length
+            offset = block * self.block_length
+            block_stop = min(stop, offset + self.block_length)
+            nrows = -(-(block_stop - index) // step)
+            local = slice(index - offset, block_stop - offset, step)
+            yield slice(row, row + nrows), self._blocks[block], local, groups
+            row += nrows
+            index += nrows * step
+
+    def _row(self, index):
+        """The block and local index of a single row"""
+        index = int(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Index {index} out of bounds")
+        block, local = divmod(index, self.block_length)
+        return self._blocks[block], local
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            # Fast path for reading a single complete row
+            block, local = self._row(index)
+            if len(self._groups) == 1:
+                return block[0][local].astype(np.float64)
+        start, stop, step, columns, scalar_row, scalar_column = self._parse_index(index)
+        nrows = len(range(start, stop, step))
+        out = np.empty((nrows, len(columns)), dtype=np.float64)
+        for rows, block, local, groups in self._pieces(start, stop, step, columns):
+            for gg, (out_columns, block_columns) in groups.items():
+                out[rows, out_columns] = block[gg][local, block_columns]
+
+        if scalar_row:
+            out = out[0]
+        if scalar_column:
+            out = out[..., 0]
+        return out
+
+    def __setitem__(self, index, value):
+        if isinstance(index, (int, np.integer)) and len(self._groups) == 1:
+            # Fast path for writing a single complete row
+            block, local = self._row(index)
+            block[0][local] = value
+            return
+        start, stop, step, columns, _, scalar_column = self._parse_index(index)
+        nrows = len(range(start, stop, step))
+        value = np.asarray(value, dtype=np.float64)
+        if scalar_column:
+            value = value[..., np.newaxis]
+        value = np.broadcast_to(value, (nrows, len(columns)))
+        for rows, block, local, groups in self._pieces(start, stop, step, columns):
+            for gg, (out_columns, block_columns) in groups.items():
+                block[gg][local, block_columns] = value[rows][:, out_columns]
+
+
+class BatchMeansACT(object):
+    def __init__(self, columns, block_length=16, min_batches=20):
+        """Incremental batch-means estimator of the autocorrelation time
+
+        Sums of the samples (and their squares) over consecutive blocks of
+        block_length samples are accumulated as the chain grows, so that an
+        update only costs O(new samples). The ACT of a trailing segment of the
+        chain is then estimated from the variance of the means of batches
+        built from these block sums, without revisiting the samples.
+
+        Parameters
+        ----------
+        columns: list
+            The indices of the columns of the chain array to track
+        block_length: int (16)
+            The number of samples in each block. Segments are rounded to
+            start on a block boundary and a trailing incomplete block is
+            ignored.
+        min_batches: int (20)
+            The minimum number of batches required for an estimate.
+        """
+        self.columns = list(columns)
+        self.block_length = int(block_length)
+        self.min_batches = int(min_batches)
+        self.nblocks = 0
+        self._shift = None
+        self._cumulative_sums = np.zeros((1, 2, len(self.columns)))
+
+    def update(self, chain_array, length):
+        """Accumulate the complete blocks of the first length samples
+
+        Parameters
+        ----------
+        chain_array: array_like
+            The chain array, indexable as chain_array[start:stop, columns]
+        length: int
+            The number of valid samples in the chain array
+        """
+        nblocks = int(length) // self.block_length
+        if nblocks <= self.nblocks:
+            return
+        if self._shift is None:
+            # Subtract a reference value to reduce round-off in the sums
+            self._shift = np.array(chain_array[0, self.columns], dtype=np.float64)
+
+        start = self.nblocks * self.block_length
+        stop = nblocks * self.block_length
+        x = np.asarray(chain_array[start:stop, self.columns], dtype=np.float64)
+        x = (x - self._shift).reshape(
+            nblocks - self.nblocks, self.block_length, len(self.columns)
+        )
+        block_sums = np.stack([x.sum(axis=1), (x**2).sum(axis=1)], axis=1)
+
+        if len(self._cumulative_sums) < nblocks + 1:
+            size = max(nblocks + 1, 2 * len(self._cumulative_sums))
+            extended = np.zeros((size,) + self._cumulative_sums.shape[1:])
+            extended[: self.nblocks + 1] = self._cumulative_sums[: self.nblocks + 1]
+            self._cumulative_sums = extended
+
+        self._cumulative_sums[self.nblocks + 1 : nblocks + 1] = self._cumulative_sums[
+            self.nblocks
+        ] + np.cumsum(block_sums, axis=0)
+        self.nblocks = nblocks
+
+    def truncate(self, index):
+        """Discard all blocks containing samples at or after index"""
+        self.nblocks = min(self.nblocks, max(int(index), 0) // self.block_length)
+
+    def integrated_time(self, minimum_index, autocorr_c=5, max_iterations=10):
+        """Estimate the ACT of the samples from minimum_index onwards
+
+        The batch size starts at roughly the square root of the segment length
+        and is increased until it exceeds autocorr_c times the estimated ACT
+        (the same self-consistency condition as emcee.autocorr).
+
+        Parameters
+        ----------
+        minimum_index: int
+            The start of the segment
+        autocorr_c: float (5)
+            The minimum batch size in units of the estimated ACT
+        max_iterations: int (10)
+            The maximum number of batch-size refinements
+
+        Returns
+        -------
+        taus: np.ndarray
+            The estimated ACT for each column. This is inf for a column which
+            does not move and nan where no reliable estimate is available.
+        """
+        ncolumns = len(self.columns)
+        first = -(-int(minimum_index) // self.block_length)
+        nblocks = self.nblocks - first
+        if nblocks < self.min_batches:
+            return np.full(ncolumns, np.nan)
+
+        sums = self._cumulative_sums
+        nsamples = nblocks * self.block_length
+        total = sums[self.nblocks] - sums[first]
+        mean = total[0] / nsamples
+        mean_square = total[1] / nsamples
+        variance = mean_square - mean**2
+
+        taus = np.full(ncolumns, np.nan)
+        static = mean_square == 0
+        taus[static] = np.inf
+        # Where the variance is swamped by round-off, defer to the FFT estimate
+        valid = variance > 1e-8 * mean_square
+        if not np.any(valid):
+            return taus
+
+        batch_blocks = max(1, int(np.sqrt(nblocks / self.block_length)))
+        for _ in range(max_iterations):
+            nbatches = nblocks // batch_blocks
+            if nbatches < self.min_batches:
+                return taus
+            edges = first + batch_blocks * np.arange(nbatches + 1)
+            batch_length = batch_blocks * self.block_length
+            batch_means = (sums[edges[1:], 0] - sums[edges[:-1], 0]) / batch_length
+            batch_taus = (
+                batch_length
+                * np.var(batch_means[:, valid], axis=0, ddof=1)
+                / variance[valid]
+            )
+            required = int(np.ceil(autocorr_c * np.max(batch_taus) / self.block_length))
+            if batch_blocks >= required:
+                taus[valid] = batch_taus
+                return taus
+            batch_blocks = required
+        return taus
@@ -2,6 +2,7 @@ import datetime
 import os
 import time
 from collections import Counter
+from functools import partial
 from pathlib import Path
 
 import numpy as np
@@ -13,6 +14,7 @@ from ..core.sampler.base_sampler import (
     MCMCSampler,
     ResumeError,
     SamplerError,
+    _initialize_global_variables,
     _sampling_convenience_dump,
     signal_wrapper,
 )
@@ -117,6 +119,11 @@ class Bilby_MCMC(MCMCSampler):
     tau_window: int, None
         Using tau', a previous estimates of tau, calculate the new tau using
         the last tau_window * tau' steps. If None, the entire chain is used.
+    tau_method: str, [online, fft]
+        The method used to estimate the ACT. The default, online, updates a
+        batch-means estimate with only the new samples at each call (falling
+        back to the FFT estimate when this is unreliable). Use fft to compute
+        the emcee.autocorr estimate from the full chain at every call.
     evidence_method: str, [stepping_stone, thermodynamic]
         The evidence calculation method to use. Defaults to stepping_stone, but
         the results of all available methods are stored in the ln_z_dict.
@@ -127,6 +134,29 @@ class Bilby_MCMC(MCMCSampler):
     initial_sample_dict: dict
         A dictionary of the initial sample value. If incomplete, will overwrite
         the initial_sample drawn using initial_sample_method.
+    resident_chains: bool (False)
+        If true and npool > 1, each worker process owns a subset of the chains
+        for the whole run and only small messages (swap proposals, current
+        samples, counters) are communicated between processes. Full chains
+        are only gathered at check point time. This avoids sending every
+        chain through the pool at each step. This cannot be combined with
+        vectorize_chains.
+    vectorize_chains: bool (False)
+        If true, step all chains (temperatures and ensemble members) together
+        in a single process: at each internal step, a proposal is drawn for
+        every chain and the prior and likelihood are evaluated for all of them
+        at once using :code:`priors.ln_prob` and
+        :code:`likelihood.batch_log_likelihood`. This removes the per-chain
+        overhead for cheap (vectorized) likelihoods. The proposals themselves
+        are still drawn one chain at a time, as each chain has its own
+        proposal cycle. Any pool is not used and this cannot be combined with
+        resident_chains.
+    float32_keys: list (None)
+        Keys (parameters, logl or logp) to store in single
+        precision in the chains. This reduces the memory use and the size of
+        the resume file for long runs. The current state of each chain is
+        always held in double precision. Only use this for quantities which do
+        not need more than ~7 significant figures (e.g., not geocent_time).
     verbose: bool
         Whether to print diagnostic output during the run.
 
@@ -157,9 +187,13 @@ class Bilby_MCMC(MCMCSampler):
         stop_after_convergence=False,
         fixed_tau=None,
         tau_window=None,
+        tau_method="online",
         evidence_method="stepping_stone",
         initial_sample_method="prior",
         initial_sample_dict=None,
+        vectorize_chains=False,
+        resident_chains=False,
+        float32_keys=None,
     )
 
     def __init__(
@@ -205,6 +239,9 @@ class Bilby_MCMC(MCMCSampler):
         self.evidence_method = self.kwargs["evidence_method"]
         self.initial_sample_method = self.kwargs["initial_sample_method"]
         self.initial_sample_dict = self.kwargs["initial_sample_dict"]
+        self.vectorize_chains = self.kwargs["vectorize_chains"]
+        self.resident_chains = self.kwargs["resident_chains"]
+        self.float32_keys = self.kwargs["float32_keys"]
 
         self.printdt = self.kwargs["printdt"]
         self.check_point_delta_t = self.kwargs["check_point_delta_t"]
@@ -218,6 +255,12 @@ class Bilby_MCMC(MCMCSampler):
     def verify_configuration(self):
         if self.convergence_inputs.burn_in_nact / self.kwargs["target_nsamples"] > 0.1:
             logger.warning("Burn-in inefficiency fraction greater than 10%")
+        if self.kwargs["vectorize_chains"] and self.kwargs["resident_chains"]:
+            raise SamplerError(
+                "vectorize_chains and resident_chains cannot be used together"
+            )
+        if self.kwargs["vectorize_chains"] and self.npool not in (1, None):
+            logger.warning("vectorize_chains runs in a single process: npool is unused")
 
     def _translate_kwargs(self, kwargs):
         kwargs = super()._translate_kwargs(kwargs)
@@ -290,11 +333,29 @@ class Bilby_MCMC(MCMCSampler):
 
         return result
 
+    def _setup_pool(self):
+        if self.resident_chains and self.npool not in (1, None):
+            # The resident-chain workers are started once the chains exist
+            self.pool = None
+            _initialize_global_variables(
+                likelihood=self.likelihood,
+                priors=self.priors,
+                search_parameter_keys=self._search_parameter_keys,
+                use_ratio=self.use_ratio,
+            )
+            self.kwargs["pool"] = self.pool
+        else:
+            super(Bilby_MCMC, self)._setup_pool()
+
     def setup_chain_set(self):
         if self.read_current_state() and self.resume is True:
             self.ptsampler.pool = self.pool
         else:
             self.init_ptsampler()
+        if self.resident_chains and self.npool not in (1, None):
+            logger.info(f"Distributing chains to {self.npool} resident workers")
+            self.pool = ResidentChainPool(self.ptsampler, processes=self.npool)
+            self.ptsampler.pool = self.pool
 
     def init_ptsampler(self):
 
@@ -309,6 +370,8 @@ class Bilby_MCMC(MCMCSampler):
             evidence_method=self.evidence_method,
             initial_sample_method=self.initial_sample_method,
             initial_sample_dict=self.initial_sample_dict,
+            vectorize_chains=self.vectorize_chains,
+            float32_keys=self.float32_keys,
         )
 
     def get_setup_string(self):
@@ -400,6 +463,7 @@ class Bilby_MCMC(MCMCSampler):
                 raise ResumeError(msg)
             self.ptsampler.set_convergence_inputs(self.convergence_inputs)
             self.ptsampler.pt_rejection_sample = self.pt_rejection_sample
+            self.ptsampler.vectorize_chains = self.vectorize_chains
 
         logger.info(
             f"Loaded resume file {self.resume_file} "
@@ -560,15 +624,19 @@ class BilbyPTMCMCSampler(object):
         evidence_method,
         initial_sample_method,
         initial_sample_dict,
+        vectorize_chains=False,
+        float32_keys=None,
     ):
         self.set_pt_inputs(pt_inputs)
         self.use_ratio = use_ratio
         self.initial_sample_method = initial_sample_method
         self.initial_sample_dict = initial_sample_dict
+        self.float32_keys = float32_keys
         self.setup_sampler_dictionary(convergence_inputs, proposal_cycle)
         self.set_convergence_inputs(convergence_inputs)
         self.pt_rejection_sample = pt_rejection_sample
         self.pool = pool
+        self.vectorize_chains = vectorize_chains
         self.evidence_method = evidence_method
 
         # Initialize counters
@@ -586,6 +654,16 @@ class BilbyPTMCMCSampler(object):
         self.ln_z_dict = dict()
         self.ln_z_err_dict = dict()
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Chains owned by resident workers are gathered to be pickled
+        if any(isinstance(s, _ResidentSampler) for s in self.sampler_list):
+            state["sampler_dictionary"] = _gather_resident_samplers(
+                self.sampler_dictionary
+            )
+            state["pool"] = None
+        return state
+
     def get_initial_betas(self):
         pt_inputs = self.pt_inputs
         if self.ntemps == 1:
@@ -635,6 +713,7 @@ class BilbyPTMCMCSampler(object):
                     use_ratio=self.use_ratio,
                     initial_sample_method=self.initial_sample_method,
                     initial_sample_dict=self.initial_sample_dict,
+                    float32_keys=self.float32_keys,
                 )
                 for Eindex in range(n)
             ]
@@ -768,7 +847,11 @@ class BilbyPTMCMCSampler(object):
         return self.sampler_list[index]
 
     def step_all_chains(self):
-        if self.pool:
+        if getattr(self, "vectorize_chains", False):
+            self.step_all_chains_vectorized()
+        elif isinstance(self.pool, ResidentChainPool):
+            self.pool.step_all_chains()
+        elif self.pool:
             self.sampler_list = self.pool.map(call_step, self.sampler_list)
         else:
             for ii, sampler in enumerate(self.sampler_list):
@@ -795,6 +878,85 @@ class BilbyPTMCMCSampler(object):
         self.swap_counter["L2-ensemble"] += 1
         self.swap_counter["L2-temperature"] += 1
 
+    def step_all_chains_vectorized(self):
+        """Take L1steps internal steps of every chain in a single process
+
+        At each internal step a proposal is drawn for every chain in turn
+        from its own proposal cycle, then the prior and likelihood of all
+        proposals are evaluated together and the
+        acceptance is decided for every chain at once. This is equivalent to
+        calling :code:`BilbyMCMCSampler.step` for each chain.
+        """
+        likelihood = _sampling_convenience_dump.likelihood
+        priors = _sampling_convenience_dump.priors
+
+        samplers = [
+            sampler
+            for sampler in self.sampler_list
+            if not (sampler.stop_after_convergence and sampler.chain.converged)
+        ]
+        nsamplers = len(samplers)
+        if nsamplers == 0:
+            return
+
+        betas = np.array([sampler.beta for sampler in samplers])
+        currents = [sampler.chain.current_sample.copy() for sampler in samplers]
+        keys = currents[0].parameter_keys
+        accepted = np.zeros(nsamplers, dtype=int)
+
+        for _ in range(self.L1steps):
+            proposal_list = []
+            prop_list = []
+            log_factors = np.zeros(nsamplers)
+            for ii, sampler in enumerate(samplers):
+                proposal = sampler.proposal_cycle.get_proposal()
+                prop, log_factors[ii] = proposal(
+                    sampler.chain, likelihood=likelihood, priors=priors
+                )
+                proposal_list.append(proposal)
+                prop_list.append(prop)
+
+            parameters = {
+                key: np.array([prop[key] for prop in prop_list]) for key in keys
+            }
+            logp = np.atleast_1d(priors.ln_prob(parameters, axis=0))
+            logl = np.full(nsamplers, -np.inf)
+            valid = np.isfinite(logp)
+            if np.any(valid):
+                valid_parameters = {key: val[valid] for key, val in parameters.items()}
+                if self.use_ratio:
+                    logl[valid] = likelihood.batch_log_likelihood_ratio(
+                        valid_parameters
+                    )
+                else:
+                    logl[valid] = likelihood.batch_log_likelihood(valid_parameters)
+            valid &= np.isfinite(logl)
+
+            curr_logl = np.array([curr[LOGLKEY] for curr in currents])
+            curr_logp = np.array([curr[LOGPKEY] for curr in currents])
+            with np.errstate(over="ignore", invalid="ignore"):
+                alpha = np.exp(
+                    log_factors + betas * logl + logp - betas * curr_logl - curr_logp
+                )
+            accept = valid & (random.rng.uniform(0, 1, nsamplers) <= alpha)
+            accepted += accept
+
+            for ii in range(nsamplers):
+                if accept[ii]:
+                    prop = prop_list[ii]
+                    prop[LOGPKEY] = logp[ii]
+                    prop[LOGLKEY] = logl[ii]
+                    currents[ii] = prop
+                    samplers[ii].chain.current_sample = prop
+                    proposal_list[ii].accepted += 1
+                else:
+                    proposal_list[ii].rejected += 1
+
+        for sampler, curr, naccepted in zip(samplers, currents, accepted):
+            sampler.chain.append(curr)
+            sampler.accepted += int(naccepted)
+            sampler.rejected += int(self.L1steps - naccepted)
+
     @staticmethod
     def _get_sample_to_swap(sampler):
         if not (sampler.chain.converged and sampler.stop_after_convergence):
@@ -805,17 +967,21 @@ class BilbyPTMCMCSampler(object):
         return v, logl
 
     def swap_tempered_chains(self):
+        if isinstance(self.pool, ResidentChainPool):
+            sampler_dictionary = self.pool.snapshot(swap=True)
+        else:
+            sampler_dictionary = self.sampler_dictionary
         if self.pt_ensemble:
             Eindexs = range(self.nensemble)
         else:
             Eindexs = [0]
         for Eindex in Eindexs:
             for Tindex in range(self.ntemps - 1):
-                sampleri = self.sampler_dictionary[Tindex][Eindex]
+                sampleri = sampler_dictionary[Tindex][Eindex]
                 vi, logli = self._get_sample_to_swap(sampleri)
                 betai = sampleri.beta
 
-                samplerj = self.sampler_dictionary[Tindex + 1][Eindex]
+                samplerj = sampler_dictionary[Tindex + 1][Eindex]
                 vj, loglj = self._get_sample_to_swap(samplerj)
                 betaj = samplerj.beta
 
@@ -826,14 +992,21 @@ class BilbyPTMCMCSampler(object):
                 if random.rng.uniform(0, 1) <= alpha_swap:
                     sampleri.chain[-1] = vj
                     samplerj.chain[-1] = vi
-                    self.sampler_dictionary[Tindex][Eindex] = sampleri
-                    self.sampler_dictionary[Tindex + 1][Eindex] = samplerj
+                    sampler_dictionary[Tindex][Eindex] = sampleri
+                    sampler_dictionary[Tindex + 1][Eindex] = samplerj
                     sampleri.pt_accepted += 1
                 else:
                     sampleri.pt_rejected += 1
 
+        if isinstance(self.pool, ResidentChainPool):
+            self.pool.apply(sampler_dictionary)
+
     def ensemble_step(self):
-        for Tindex, sampler_list in self.sampler_dictionary.items():
+        if isinstance(self.pool, ResidentChainPool):
+            sampler_dictionary = self.pool.snapshot()
+        else:
+            sampler_dictionary = self.sampler_dictionary
+        for Tindex, sampler_list in sampler_dictionary.items():
             if len(sampler_list) > 1:
                 for Eindex, sampler in enumerate(sampler_list):
                     curr = sampler.chain.current_sample
@@ -844,7 +1017,7 @@ class BilbyPTMCMCSampler(object):
 
                     if logp == -np.inf:
                         sampler.reject_proposal(curr, proposal)
-                        self.sampler_dictionary[Tindex][Eindex] = sampler
+                        sampler_dictionary[Tindex][Eindex] = sampler
                         continue
 
                     prop[LOGPKEY] = logp
@@ -861,7 +1034,10 @@ class BilbyPTMCMCSampler(object):
                         sampler.accept_proposal(prop, proposal)
                     else:
                         sampler.reject_proposal(curr, proposal)
-                    self.sampler_dictionary[Tindex][Eindex] = sampler
+                    sampler_dictionary[Tindex][Eindex] = sampler
+
+        if isinstance(self.pool, ResidentChainPool):
+            self.pool.apply(sampler_dictionary)
 
     def adapt_temperatures(self):
         """Adapt the temperature of the chains
@@ -1129,6 +1305,7 @@ class BilbyMCMCSampler(object):
         use_ratio=False,
         initial_sample_method="prior",
         initial_sample_dict=None,
+        float32_keys=None,
     ):
         self.beta = beta
         self.Tindex = Tindex
@@ -1162,7 +1339,7 @@ class BilbyMCMCSampler(object):
         initial_sample[LOGLKEY] = self.log_likelihood(initial_sample)
         initial_sample[LOGPKEY] = self.log_prior(initial_sample)
 
-        self.chain = Chain(initial_sample=initial_sample)
+        self.chain = Chain(initial_sample=initial_sample, float32_keys=float32_keys)
         self.set_convergence_inputs(convergence_inputs)
 
         self.accepted = 0
@@ -1378,3 +1555,398 @@ def get_initial_maximimum_posterior_sample(beta):
 def call_step(sampler):
     sampler = sampler.step()
     return sampler
+
+
+_REMOTE_CALLABLE = "_bilby_mcmc_remote_callable"
+
+
+class ResidentChainPool(object):
+    """A pool of worker processes which each own a subset of the chains
+
+    Rather than sending every BilbyMCMCSampler (and its chain) to and from a
+    multiprocessing pool at each step, each worker holds its samplers for the
+    duration of the run. The sampler_dictionary of the BilbyPTMCMCSampler is
+    replaced by lightweight proxies so that only small messages (swap
+    proposals, current samples, counters) are communicated. Full chains are
+    only gathered when check pointing and when the pool is closed.
+
+    The ensemble and temperature swap steps run on the primary process
+    using snapshots of the chain states (see :code:`snapshot`), and their
+    outcome is sent back with :code:`apply`, so each of these steps costs
+    one round trip per worker in each direction. The sampler acceptance
+    counters are only ever updated by the workers that own the samplers.
+
+    Parameters
+    ----------
+    ptsampler: BilbyPTMCMCSampler
+        The parallel-tempered sampler whose chains to distribute.
+    processes: int
+        The number of worker processes.
+    """
+
+    def __init__(self, ptsampler, processes):
+        self.ptsampler = ptsampler
+        samplers = ptsampler.sampler_list
+        self._processes = min(processes, len(samplers))
+        seeds = random.generate_seeds(self._processes)
+        self.workers = [
+            _ResidentChainWorker(samplers[ii :: self._processes], seeds[ii])
+            for ii in range(self._processes)
+        ]
+        for worker in self.workers:
+            for Tindex, Eindex in worker.keys:
+                ptsampler.sampler_dictionary[Tindex][Eindex] = _ResidentSampler(
+                    worker, Tindex, Eindex
+                )
+        self._closed = False
+
+    def step_all_chains(self):
+        for worker in self.workers:
+            worker.send("step")
+        for worker in self.workers:
+            worker.receive()
+
+    def snapshot(self, swap=False):
+        """Return a sampler_dictionary of snapshots of the resident samplers
+
+        Parameters
+        ----------
+        swap: bool
+            If True, also include the sample each chain offers for a
+            temperature swap.
+
+        Returns
+        -------
+        sampler_dictionary: dict
+            Dictionary of lists of :code:`_ResidentSamplerSnapshot`.
+        """
+        for worker in self.workers:
+            worker.send("snapshot", swap)
+        snapshots = {
+            Tindex: list(row)
+            for Tindex, row in self.ptsampler.sampler_dictionary.items()
+        }
+        for worker in self.workers:
+            for key, state in worker.receive().items():
+                snapshots[key[0]][key[1]] = _ResidentSamplerSnapshot(key, **state)
+        return snapshots
+
+    def apply(self, snapshots):
+        """Send the steps recorded in snapshots back to the resident samplers"""
+        updates = {worker: [] for worker in self.workers}
+        for row in snapshots.values():
+            for snapshot in row:
+                sampler = self.ptsampler.sampler_dictionary[snapshot.Tindex][
+                    snapshot.Eindex
+                ]
+                updates[sampler._worker].append(snapshot.updates)
+        for worker, worker_updates in updates.items():
+            worker.send("apply", worker_updates)
+        for worker in self.workers:
+            worker.receive()
+
+    def gather(self):
+        """Return a sampler_dictionary of the samplers held by the workers"""
+        return _gather_resident_samplers(self.ptsampler.sampler_dictionary)
+
+    def close(self):
+        if self._closed:
+            return
+        self.ptsampler.sampler_dictionary = self.gather()
+        for worker in self.workers:
+            worker.send("close")
+        self._closed = True
+
+    def join(self):
+        for worker in self.workers:
+            worker.process.join()
+
+    def terminate(self):
+        for worker in self.workers:
+            worker.process.kill()
+        self._closed = True
+
+
+class _ResidentChainWorker(object):
+    """Primary-side handle on a worker process which owns a set of samplers"""
+
+    def __init__(self, samplers, seed):
+        import multiprocessing
+
+        self.keys = [(sampler.Tindex, sampler.Eindex) for sampler in samplers]
+        self.connection, worker_connection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_resident_chain_worker_loop,
+            args=(
+                worker_connection,
+                samplers,
+                seed,
+                _sampling_convenience_dump.likelihood,
+                _sampling_convenience_dump.priors,
+                _sampling_convenience_dump.search_parameter_keys,
+                _sampling_convenience_dump.use_ratio,
+            ),
+            daemon=True,
+        )
+        self.process.start()
+        worker_connection.close()
+
+    def send(self, command, *args):
+        self.connection.send((command, args))
+
+    def receive(self):
+        result = self.connection.recv()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def call(self, command, *args):
+        self.send(command, *args)
+        return self.receive()
+
+
+def _resolve_attribute(obj, name):
+    for attribute in name.split("."):
+        obj = getattr(obj, attribute)
+    return obj
+
+
+def _resident_chain_worker_loop(
+    connection, samplers, seed, likelihood, priors, search_parameter_keys, use_ratio
+):
+    import signal
+
+    # Interrupts are handled (and check points written) by the primary process
+    for signum in [signal.SIGINT, signal.SIGTERM, signal.SIGALRM]:
+        signal.signal(signum, signal.SIG_IGN)
+
+    _initialize_global_variables(likelihood, priors, search_parameter_keys, use_ratio)
+    random.seed(seed)
+    samplers = {(sampler.Tindex, sampler.Eindex): sampler for sampler in samplers}
+
+    while True:
+        try:
+            command, args = connection.recv()
+        except EOFError:
+            # The primary process has exited
+            break
+        if command == "close":
+            break
+        try:
+            if command == "step":
+                for sampler in samplers.values():
+                    sampler.step()
+                result = None
+            elif command == "gather":
+                result = list(samplers.values())
+            elif command == "snapshot":
+                (swap,) = args
+                result = {
+                    key: _snapshot_state(sampler, swap)
+                    for key, sampler in samplers.items()
+                }
+            elif command == "apply":
+                (updates,) = args
+                for key, appended, last_sample, counters in updates:
+                    sampler = samplers[key]
+                    for sample in appended:
+                        sampler.chain.append(sample)
+                    if last_sample is not None:
+                        sampler.chain[-1] = last_sample
+                    for name, value in counters.items():
+                        setattr(sampler, name, getattr(sampler, name) + value)
+                result = None
+            elif command == "getattr":
+                key, name = args
+                result = _resolve_attribute(samplers[key], name)
+                if callable(result):
+                    result = _REMOTE_CALLABLE
+            elif command == "setattr":
+                key, name, value = args
+                parent, _, attribute = name.rpartition(".")
+                obj = samplers[key]
+                if parent != "":
+                    obj = _resolve_attribute(obj, parent)
+                setattr(obj, attribute, value)
+                result = None
+            elif command == "call":
+                key, name, call_args, call_kwargs = args
+                result = _resolve_attribute(samplers[key], name)(
+                    *call_args, **call_kwargs
+                )
+            else:
+                raise SamplerError(f"Unknown resident chain command {command}")
+        except Exception as e:
+            result = e
+        connection.send(result)
+    connection.close()
+
+
+class _ResidentProxy(object):
+    """Primary-side proxy for an object owned by a resident chain worker"""
+
+    def __init__(self, worker, key, path):
+        object.__setattr__(self, "_worker", worker)
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_path", path)
+
+    def _call(self, name, *args, **kwargs):
+        return self._worker.call("call", self._key, self._path + name, args, kwargs)
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = self._worker.call("getattr", self._key, self._path + name)
+        if isinstance(value, str) and value == _REMOTE_CALLABLE:
+            return partial(self._call, name)
+        return value
+
+    def __setattr__(self, name, value):
+        self._worker.call("setattr", self._key, self._path + name, value)
+
+
+class _ResidentChain(_ResidentProxy):
+    def __getitem__(self, index):
+        return self._call("__getitem__", index)
+
+    def __setitem__(self, index, sample):
+        self._call("__setitem__", index, sample)
+
+
+class _ResidentSampler(_ResidentProxy):
+    def __init__(self, worker, Tindex, Eindex):
+        super(_ResidentSampler, self).__init__(worker, (Tindex, Eindex), "")
+        object.__setattr__(self, "Tindex", Tindex)
+        object.__setattr__(self, "Eindex", Eindex)
+        object.__setattr__(
+            self, "chain", _ResidentChain(worker, (Tindex, Eindex), "chain.")
+        )
+
+
+def _snapshot_state(sampler, swap):
+    """The state of a resident sampler needed for ensemble and swap steps"""
+    chain = sampler.chain
+    state = dict(
+        beta=sampler.beta,
+        use_ratio=sampler.use_ratio,
+        stop_after_convergence=sampler.stop_after_convergence,
+        current_sample=chain.current_sample,
+        converged=chain.converged,
+    )
+    if swap:
+        state["last_sample"] = chain[-1]
+        if chain.converged and sampler.stop_after_convergence:
+            state["random_sample"] = chain.random_sample
+    return state
+
+
+class _ResidentChainSnapshot(object):
+    """Primary-side copy of the parts of a resident chain used between steps
+
+    Appended samples and replacements of the last sample are recorded so
+    that they can be applied to the resident chain in a single message.
+    """
+
+    def __init__(self, current_sample, converged, last_sample=None, random_sample=None):
+        self._current_sample = current_sample
+        self.converged = converged
+        self._last_sample = last_sample
+        self._random_sample = random_sample
+        self.appended = []
+        self.replaced_last_sample = None
+
+    @property
+    def current_sample(self):
+        return self._current_sample.copy()
+
+    @property
+    def random_sample(self):
+        return self._random_sample
+
+    def append(self, sample):
+        self.appended.append(sample)
+        self._current_sample = sample
+        self._last_sample = sample
+
+    def __getitem__(self, index):
+        if index != -1:
+            raise SamplerError("Only the last sample of a chain snapshot is available")
+        return self._last_sample
+
+    def __setitem__(self, index, sample):
+        if index != -1:
+            raise SamplerError("Only the last sample of a chain snapshot can be set")
+        self._last_sample = sample
+        self.replaced_last_sample = sample
+
+
+class _ResidentSamplerSnapshot(object):
+    """Primary-side stand-in for a resident sampler in ensemble and swap steps
+
+    Prior and likelihood evaluations happen on the primary process. The
+    acceptance counters start from zero and hold the increments to apply
+    to the resident sampler.
+    """
+
+    log_likelihood = BilbyMCMCSampler.log_likelihood
+    log_prior = BilbyMCMCSampler.log_prior
+    accept_proposal = BilbyMCMCSampler.accept_proposal
+    reject_proposal = BilbyMCMCSampler.reject_proposal
+
+    def __init__(
+        self,
+        key,
+        beta,
+        use_ratio,
+        stop_after_convergence,
+        current_sample,
+        converged,
+        last_sample=None,
+        random_sample=None,
+    ):
+        self.Tindex, self.Eindex = key
+        self.beta = beta
+        self.use_ratio = use_ratio
+        self.stop_after_convergence = stop_after_convergence
+        self.chain = _ResidentChainSnapshot(
+            current_sample, converged, last_sample, random_sample
+        )
+        self.accepted = 0
+        self.rejected = 0
+        self.pt_accepted = 0
+        self.pt_rejected = 0
+
+    @property
+    def updates(self):
+        counters = {
+            name: getattr(self, name)
+            for name in ["accepted", "rejected", "pt_accepted", "pt_rejected"]
+            if getattr(self, name) != 0
+        }
+        return (
+            (self.Tindex, self.Eindex),
+            self.chain.appended,
+            self.chain.replaced_last_sample,
+            counters,
+        )
+
+
+def _gather_resident_samplers(sampler_dictionary):
+    """Collect the samplers owned by resident workers into a sampler_dictionary"""
+    workers = []
+    for row in sampler_dictionary.values():
+        for sampler in row:
+            if isinstance(sampler, _ResidentSampler) and all(
+                sampler._worker is not worker for worker in workers
+            ):
+                workers.append(sampler._worker)
+    for worker in workers:
+        worker.send("gather")
+    gathered = {
+        Tindex: [sampler for sampler in row]
+        for Tindex, row in sampler_dictionary.items()
+    }
+    for worker in workers:
+        for sampler in worker.receive():
+            gathered[sampler.Tindex][sampler.Eindex] = sampler
+    return gathered
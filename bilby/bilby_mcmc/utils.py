@@ -19,7 +19,10 @@ ConvergenceInputs = namedtuple(
         "min_tau",
         "fixed_tau",
         "tau_window",
+        "tau_method",
     ],
+    # resume files written before tau_method was added do not include it
+    defaults=("online",),
 )
 
 ParallelTemperingInputs = namedtuple(
@@ -51,6 +51,49 @@ class Likelihood(object):
         """
         return self.log_likelihood() - self.noise_log_likelihood()
 
+    def batch_log_likelihood(self, parameters):
+        """Calculate the log likelihood for a set of samples
+
+        The default implementation loops over the samples calling
+        :code:`log_likelihood`, subclasses can override this with a
+        vectorized implementation.
+
+        Parameters
+        ==========
+        parameters: dict
+            Dictionary of equal-length arrays of the parameter values
+
+        Returns
+        =======
+        array_like: The log likelihood of each sample
+        """
+        return self._evaluate_per_sample(parameters, self.log_likelihood)
+
+    def batch_log_likelihood_ratio(self, parameters):
+        """Calculate the log likelihood ratio for a set of samples
+
+        See :code:`batch_log_likelihood`.
+
+        Parameters
+        ==========
+        parameters: dict
+            Dictionary of equal-length arrays of the parameter values
+
+        Returns
+        =======
+        array_like: The log likelihood ratio of each sample
+        """
+        return self._evaluate_per_sample(parameters, self.log_likelihood_ratio)
+
+    def _evaluate_per_sample(self, parameters, method):
+        parameters = {key: np.atleast_1d(val) for key, val in parameters.items()}
+        nsamples = len(next(iter(parameters.values())))
+        output = np.zeros(nsamples)
+        for ii in range(nsamples):
+            self.parameters.update({key: val[ii] for key, val in parameters.items()})
+            output[ii] = method()
+        return output
+
     @property
     def meta_data(self):
         return getattr(self, '_meta_data', None)
@@ -480,6 +523,10 @@ class AnalyticalMultidimensionalCovariantGaussian(Likelihood):
         x = np.array([self.parameters["x{0}".format(i)] for i in range(self.dim)])
         return self.pdf.logpdf(x)
 
+    def batch_log_likelihood(self, parameters):
+        x = np.array([parameters["x{0}".format(i)] for i in range(self.dim)]).T
+        return np.atleast_1d(self.pdf.logpdf(x))
+
 
 class AnalyticalMultidimensionalBimodalCovariantGaussian(Likelihood):
     """
@@ -513,6 +560,12 @@ class AnalyticalMultidimensionalBimodalCovariantGaussian(Likelihood):
         x = np.array([self.parameters["x{0}".format(i)] for i in range(self.dim)])
         return -np.log(2) + np.logaddexp(self.pdf_1.logpdf(x), self.pdf_2.logpdf(x))
 
+    def batch_log_likelihood(self, parameters):
+        x = np.array([parameters["x{0}".format(i)] for i in range(self.dim)]).T
+        return np.atleast_1d(
+            -np.log(2) + np.logaddexp(self.pdf_1.logpdf(x), self.pdf_2.logpdf(x))
+        )
+
 
 class JointLikelihood(Likelihood):
     def __init__(self, *likelihoods):
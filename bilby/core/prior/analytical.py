@@ -1470,7 +1470,11 @@ class Categorical(Prior):
         =======
         Union[float, array_like]: Rescaled probability
         """
-        return np.floor(val * (1 + self.maximum))
+        return np.minimum(np.floor(val * self.ncategories), self.ncategories - 1)
+
+    def _in_support(self, val):
+        """Boolean mask of the values which are one of the categories"""
+        return (val == np.floor(val)) & (val >= 0) & (val < self.ncategories)
 
     def prob(self, val):
         """Return the prior probability of val.
@@ -1484,16 +1488,13 @@ class Categorical(Prior):
         float: Prior probability of val
         """
         if isinstance(val, (float, int)):
-            if val in self.categories:
+            if self._in_support(val):
                 return self.p
             else:
                 return 0
         else:
             val = np.atleast_1d(val)
-            probs = np.zeros_like(val, dtype=np.float64)
-            idxs = np.isin(val, self.categories)
-            probs[idxs] = self.p
-            return probs
+            return np.where(self._in_support(val), self.p, 0.0)
 
     def ln_prob(self, val):
         """Return the logarithmic prior probability of val
@@ -1508,16 +1509,13 @@ class Categorical(Prior):
 
         """
         if isinstance(val, (float, int)):
-            if val in self.categories:
+            if self._in_support(val):
                 return self.lnp
             else:
                 return -np.inf
         else:
             val = np.atleast_1d(val)
-            probs = -np.inf * np.ones_like(val, dtype=np.float64)
-            idxs = np.isin(val, self.categories)
-            probs[idxs] = self.lnp
-            return probs
+            return np.where(self._in_support(val), self.lnp, -np.inf)
 
 
 class Triangular(Prior):
@@ -1,9 +1,13 @@
+from bisect import bisect_right
+
+import numpy as np
+
 from .base import Prior, PriorException
 from .interpolated import Interped
 from .analytical import DeltaFunction, PowerLaw, Uniform, LogUniform, \
     SymmetricLogUniform, Cosine, Sine, Gaussian, TruncatedGaussian, HalfGaussian, \
     LogNormal, Exponential, StudentT, Beta, Logistic, Cauchy, Gamma, ChiSquared, FermiDirac
-from ..utils import infer_args_from_method, infer_parameters_from_function
+from ..utils import infer_args_from_method, infer_parameters_from_function, logger
 
 
 def conditional_prior_factory(prior_class):
@@ -56,6 +60,7 @@ def conditional_prior_factory(prior_class):
             self._required_variables = None
             self.condition_func = condition_func
             self._reference_params = reference_params
+            self._lookup_table = None
             self.__class__.__name__ = 'Conditional{}'.format(prior_class.__name__)
             self.__class__.__qualname__ = 'Conditional{}'.format(prior_class.__qualname__)
 
@@ -92,6 +97,9 @@ def conditional_prior_factory(prior_class):
 
 
             """
+            rescaled = self._lookup_rescale(val, required_variables)
+            if rescaled is not None:
+                return rescaled
             self.update_conditions(**required_variables)
             return super(ConditionalPrior, self).rescale(val)
 
@@ -149,6 +157,115 @@ def conditional_prior_factory(prior_class):
             self.update_conditions(**required_variables)
             return super(ConditionalPrior, self).cdf(val)
 
+        def evaluate(self, method, val, **required_variables):
+            """
+            Evaluate a method of this prior for the given required variables
+            without modifying this prior.
+
+            The conditions are applied to a shallow copy of the prior, so a
+            single prior can be shared between threads.
+
+            Parameters
+            ==========
+            method: str
+                The name of the method to evaluate, e.g., :code:`rescale`,
+                :code:`prob`, :code:`ln_prob` or :code:`cdf`
+            val: Union[float, int, array_like]
+                The value to pass to the method
+            required_variables:
+                Any required variables that this prior depends on
+
+            Returns
+            =======
+            Union[float, array_like]: The output of the method
+            """
+            if method == "rescale":
+                rescaled = self._lookup_rescale(val, required_variables)
+                if rescaled is not None:
+                    return rescaled
+            conditioned = object.__new__(self.__class__)
+            conditioned.__dict__.update(self.__dict__)
+            return getattr(conditioned, method)(val, **required_variables)
+
+        def build_lookup_table(
+            self, minimum, maximum, resolution=256, tolerance=None, max_resolution=4096
+        ):
+            """
+            Tabulate the inverse CDF of the prior over the unit interval and
+            the values of the required variable.
+
+            The :code:`rescale` method then interpolates in the table rather
+            than updating the conditions for every call. Values of the required
+            variable outside of the table are rescaled exactly. This is only
+            available for priors with a single required variable. This is
+            mostly useful for rescaling single samples, or if the exact inverse
+            CDF is expensive to evaluate.
+
+            Parameters
+            ==========
+            minimum: float
+                The minimum value of the required variable in the table
+            maximum: float
+                The maximum value of the required variable in the table
+            resolution: int
+                The number of points along each axis of the table
+            tolerance: float, optional
+                The maximum allowed difference from the exact inverse CDF
+                relative to the range of the rescaled values, checked between
+                the points of the table. If given, the resolution is doubled
+                until this is met. If it cannot be met with
+                :code:`max_resolution` points the table is not used.
+            max_resolution: int
+                The maximum number of points along each axis of the table
+
+            Returns
+            =======
+            float: The maximum difference from the exact inverse CDF relative to
+                the range of the rescaled values.
+            """
+            if len(self.required_variables) != 1:
+                raise ValueError(
+                    "Lookup tables are only available for priors with a single "
+                    "required variable, {} has {}".format(self.name, self.required_variables)
+                )
+            self._lookup_table = None
+            while True:
+                table = ConditionalInverseCDFTable(
+                    self,
+                    self.required_variables[0],
+                    self._lookup_table_conditions(minimum, maximum, resolution),
+                    resolution,
+                )
+                error = table.check_accuracy(self)
+                if tolerance is None or error <= tolerance:
+                    self._lookup_table = table
+                    return error
+                elif 2 * resolution > max_resolution:
+                    logger.warning(
+                        "Unable to tabulate the inverse CDF for {} to within {}, the "
+                        "maximum error is {}.".format(self.name, tolerance, error)
+                    )
+                    return error
+                resolution *= 2
+
+        def _lookup_table_conditions(self, minimum, maximum, resolution):
+            """
+            The values of the required variable in the lookup table, subclasses
+            can override this to place more points where the inverse CDF
+            changes rapidly.
+            """
+            return np.linspace(minimum, maximum, resolution)
+
+        def remove_lookup_table(self):
+            """Rescale using the exact inverse CDF."""
+            self._lookup_table = None
+
+        def _lookup_rescale(self, val, required_variables):
+            table = getattr(self, "_lookup_table", None)
+            if table is None or table.variable not in required_variables:
+                return None
+            return table(val, required_variables[table.variable])
+
         def update_conditions(self, **required_variables):
             """
             This method updates the conditional parameters (depending on the parent class
@@ -238,6 +355,121 @@ def conditional_prior_factory(prior_class):
     return ConditionalPrior
 
 
+class ConditionalInverseCDFTable(object):
+
+    def __init__(self, prior, variable, conditions, resolution):
+        """
+        A table of the inverse CDF of a conditional prior on a regular grid in
+        the unit interval and a sorted set of values of a single required
+        variable, evaluated with bilinear interpolation.
+
+        Where the exact inverse CDF is not finite at a value of the required
+        variable, e.g., where the conditional prior is degenerate, the table
+        is filled by interpolating between the neighbouring values.
+
+        Parameters
+        ==========
+        prior: ConditionalPrior
+            The prior to tabulate
+        variable: str
+            The name of the required variable
+        conditions: array_like
+            The increasing values of the required variable
+        resolution: int
+            The number of points along the unit interval
+        """
+        self.variable = variable
+        self.conditions = np.asarray(conditions, dtype=float)
+        self.minimum = self.conditions[0]
+        self.maximum = self.conditions[-1]
+        self.resolution = int(resolution)
+        unit = np.linspace(0, 1, self.resolution)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.values = np.array([
+                np.broadcast_to(
+                    prior.evaluate("rescale", unit, **{variable: condition}), unit.shape
+                )
+                for condition in self.conditions
+            ], dtype=float)
+        for column in self.values.T:
+            defined = np.isfinite(column)
+            if np.any(defined) and not np.all(defined):
+                column[~defined] = np.interp(
+                    self.conditions[~defined], self.conditions[defined], column[defined]
+                )
+        self._widths = np.diff(self.conditions)
+        self._flat_values = self.values.flatten()
+        self._conditions_list = self.conditions.tolist()
+        self._widths_list = self._widths.tolist()
+        self._values_list = self.values.tolist()
+
+    def check_accuracy(self, prior):
+        """
+        The maximum difference from the exact inverse CDF between the points
+        of the table, relative to the range of the tabulated values. Points
+        where the exact inverse CDF is not finite are ignored.
+        """
+        midpoints = (np.arange(self.resolution - 1) + 0.5) / (self.resolution - 1)
+        unit, conditions = np.meshgrid(
+            midpoints, self.conditions[:-1] + self._widths / 2
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            exact = np.array([
+                np.broadcast_to(
+                    prior.evaluate("rescale", row, **{self.variable: condition[0]}), row.shape
+                )
+                for row, condition in zip(unit, conditions)
+            ])
+        defined = np.isfinite(exact)
+        difference = np.abs(self(unit, conditions) - exact)[defined]
+        if not np.all(np.isfinite(difference)):
+            return np.inf
+        return np.max(difference) / np.ptp(self.values[np.isfinite(self.values)])
+
+    def __call__(self, val, condition):
+        """
+        Interpolate the inverse CDF.
+
+        Returns
+        =======
+        Union[float, array_like, None]: The rescaled values, or None if any of
+            the required variables are outside of the table.
+        """
+        if isinstance(val, (float, int)) and isinstance(condition, (float, int)):
+            if not self.minimum <= condition <= self.maximum or not 0 <= val <= 1:
+                return None
+            ii = min(bisect_right(self._conditions_list, condition) - 1, len(self._widths_list) - 1)
+            xx = (condition - self._conditions_list[ii]) / self._widths_list[ii]
+            yy = val * (self.resolution - 1)
+            jj = min(int(yy), self.resolution - 2)
+            yy -= jj
+            lower = self._values_list[ii]
+            upper = self._values_list[ii + 1]
+            return (
+                (1 - xx) * ((1 - yy) * lower[jj] + yy * lower[jj + 1])
+                + xx * ((1 - yy) * upper[jj] + yy * upper[jj + 1])
+            )
+        val = np.asarray(val, dtype=float)
+        condition = np.asarray(condition, dtype=float)
+        if (
+            np.any(condition < self.minimum) or np.any(condition > self.maximum)
+            or np.any(val < 0) or np.any(val > 1)
+        ):
+            return None
+        ii = np.minimum(
+            np.searchsorted(self.conditions, condition, side="right") - 1, len(self._widths) - 1
+        )
+        xx = (condition - self.conditions.take(ii)) / self._widths.take(ii)
+        yy = val * (self.resolution - 1)
+        jj = np.minimum(yy.astype(int), self.resolution - 2)
+        yy = yy - jj
+        index = ii * self.resolution + jj
+        lower = (1 - yy) * self._flat_values.take(index) + yy * self._flat_values.take(index + 1)
+        index += self.resolution
+        upper = (1 - yy) * self._flat_values.take(index) + yy * self._flat_values.take(index + 1)
+        return (1 - xx) * lower + xx * upper
+
+
 class ConditionalBasePrior(conditional_prior_factory(Prior)):
     pass
 
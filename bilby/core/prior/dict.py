@@ -1,6 +1,10 @@
+import hashlib
 import json
 import os
 import re
+import stat
+import types
+from collections import OrderedDict
 from importlib import import_module
 from io import open as ioopen
 
@@ -14,10 +18,51 @@ from ..utils import (
     check_directory_exists_and_if_not_mkdir,
     BilbyJsonEncoder,
     decode_bilby_json,
+    get_version_information,
 )
 
+# Pickled priors parsed by PriorDict.from_file in this process, least
+# recently used first
+_parsed_prior_cache = OrderedDict()
+_PARSED_PRIOR_CACHE_SIZE = 32
+
+
+def _parsed_prior_cache_enabled():
+    return (
+        os.environ.get("BILBY_PRIOR_CACHE", "").lower() in ["1", "true"]
+        or bool(os.environ.get("BILBY_PRIOR_CACHE_DIRECTORY", None))
+    )
+
+
+def _store_parsed_priors(cache_key, pickled):
+    _parsed_prior_cache[cache_key] = pickled
+    _parsed_prior_cache.move_to_end(cache_key)
+    while len(_parsed_prior_cache) > _PARSED_PRIOR_CACHE_SIZE:
+        _parsed_prior_cache.popitem(last=False)
+
+
+def _is_private_path(path):
+    """Whether the path is owned by the user and not writable by others
+
+    Cached priors are unpickled, so they are only read from places that no
+    one else can write to.
+    """
+    try:
+        path_stat = os.stat(path)
+    except OSError:
+        return False
+    if hasattr(os, "getuid") and path_stat.st_uid != os.getuid():
+        logger.warning("Not using the prior cache {}, it is owned by another user".format(path))
+        return False
+    if path_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        logger.warning("Not using the prior cache {}, it is writable by other users".format(path))
+        return False
+    return True
+
 
 class PriorDict(dict):
+    _conditional_prior_transform = False
+
     def __init__(self, dictionary=None, filename=None, conversion_function=None):
         """A dictionary of priors
 
@@ -30,8 +75,16 @@ class PriorDict(dict):
         conversion_function: func
             Function to convert between sampled parameters and constraints.
             Default is no conversion.
+
+        Notes
+        =====
+        If the prior set is read from a file and a file with the same name and
+        the suffix :code:`.normalization.json` exists next to it, the constraint
+        normalizations stored there are used and newly computed
+        normalizations are added to it, see :code:`normalization_file`.
         """
         super(PriorDict, self).__init__()
+        self.normalization_file = None
         if isinstance(dictionary, dict):
             self.from_dictionary(dictionary)
         elif type(dictionary) is str:
@@ -109,6 +162,9 @@ class PriorDict(dict):
                 else:
                     outfile.write("{} = {}\n".format(key, self[key]))
 
+        if len(getattr(self, "_cached_normalizations", dict())) > 0:
+            self.write_normalizations("{}.normalization.json".format(prior_file))
+
     def _get_json_dict(self):
         self.convert_floats_to_delta_functions()
         total_dict = {key: json.loads(self[key].to_json()) for key in self}
@@ -142,20 +198,134 @@ class PriorDict(dict):
         - bilby.gw.prior as, e.g.,      :code:`foo = bilby.gw.prior.AlignedSpin()`
         - other external modules, e.g., :code:`foo = my.module.CustomPrior(...)`
 
+        If the environment variable :code:`BILBY_PRIOR_CACHE` is set to
+        :code:`1`, the constructed priors are cached, keyed by the hash of the
+        file contents, the modification times of data files named in it, the
+        :code:`PriorDict` class and the bilby version, so reading the same
+        file again skips the parsing and the setup of the individual priors,
+        e.g., the cosmological interpolants. At most 32 files are cached. If
+        :code:`BILBY_PRIOR_CACHE_DIRECTORY` is set, the cache is also stored
+        there and shared between processes. The directory must be owned by
+        the user and not writable by anyone else. This cache must be cleared
+        by hand if the code of custom prior classes changes.
         """
 
-        comments = ["#", "\n"]
-        prior = dict()
-        with ioopen(filename, "r", encoding="unicode_escape") as f:
-            for line in f:
-                if line[0] in comments:
-                    continue
-                line.replace(" ", "")
-                elements = line.split("=")
-                key = elements[0].replace(" ", "")
-                val = "=".join(elements[1:]).strip()
-                prior[key] = val
-        self.from_dictionary(prior)
+        cache_key = None
+        if _parsed_prior_cache_enabled():
+            cache_key = self._parsed_prior_key(filename)
+        if cache_key is None or not self._read_parsed_priors(cache_key):
+            attributes = set(self.__dict__)
+            comments = ["#", "\n"]
+            prior = dict()
+            with ioopen(filename, "r", encoding="unicode_escape") as f:
+                for line in f:
+                    if line[0] in comments:
+                        continue
+                    line.replace(" ", "")
+                    elements = line.split("=")
+                    key = elements[0].replace(" ", "")
+                    val = "=".join(elements[1:]).strip()
+                    prior[key] = val
+            self.from_dictionary(prior)
+            if cache_key is not None:
+                self._write_parsed_priors(
+                    cache_key,
+                    {key: val for key, val in self.__dict__.items() if key not in attributes},
+                )
+
+        normalization_file = "{}.normalization.json".format(filename)
+        if os.path.isfile(normalization_file):
+            self.normalization_file = normalization_file
+
+    def _parsed_prior_key(self, filename):
+        with open(filename, "rb") as ff:
+            contents = ff.read()
+        key = hashlib.sha256(contents)
+        key.update(
+            "{}.{}".format(type(self).__module__, type(self).__qualname__).encode()
+        )
+        key.update(str(get_version_information()).encode())
+        # data files read by the priors, e.g., FromFile(file_name="...")
+        text = contents.decode("unicode_escape")
+        for name in sorted(set(re.findall(r"""(?:'([^']+)'|"([^"]+)")""", text))):
+            name = name[0] or name[1]
+            if os.path.isfile(name):
+                file_stat = os.stat(name)
+                key.update(
+                    "{}:{}:{}".format(
+                        os.path.abspath(name), file_stat.st_mtime_ns, file_stat.st_size
+                    ).encode()
+                )
+        return key.hexdigest()
+
+    @staticmethod
+    def _parsed_prior_cache_file(cache_key):
+        cache_directory = os.environ.get("BILBY_PRIOR_CACHE_DIRECTORY", None)
+        if not cache_directory:
+            return None
+        return os.path.join(cache_directory, "{}.pkl".format(cache_key))
+
+    def _read_parsed_priors(self, cache_key):
+        """Fill the prior dictionary from the parsed prior cache
+
+        Returns
+        =======
+        bool: Whether the priors were found in the cache
+        """
+        import dill
+
+        pickled = _parsed_prior_cache.get(cache_key, None)
+        cache_file = self._parsed_prior_cache_file(cache_key)
+        if (
+            pickled is None
+            and cache_file is not None
+            and os.path.isfile(cache_file)
+            and _is_private_path(os.path.dirname(cache_file))
+            and _is_private_path(cache_file)
+        ):
+            try:
+                with open(cache_file, "rb") as ff:
+                    pickled = ff.read()
+            except OSError as e:
+                logger.debug("Unable to read parsed priors from {}: {}".format(cache_file, e))
+        if pickled is None:
+            return False
+        try:
+            priors, attributes = dill.loads(pickled)
+        except Exception as e:
+            logger.debug("Unable to load cached priors: {}".format(e))
+            return False
+        _store_parsed_priors(cache_key, pickled)
+        self.update(priors)
+        self.__dict__.update(attributes)
+        logger.debug("Read parsed priors from cache")
+        return True
+
+    def _write_parsed_priors(self, cache_key, attributes):
+        import dill
+
+        try:
+            pickled = dill.dumps((dict(self), attributes))
+        except Exception as e:
+            logger.debug("Unable to cache parsed priors: {}".format(e))
+            return
+        _store_parsed_priors(cache_key, pickled)
+        cache_file = self._parsed_prior_cache_file(cache_key)
+        if cache_file is None:
+            return
+        cache_directory = os.path.dirname(cache_file)
+        temporary_file = "{}.{}.tmp".format(cache_file, os.getpid())
+        try:
+            os.makedirs(cache_directory, mode=0o700, exist_ok=True)
+            if not _is_private_path(cache_directory):
+                return
+            with os.fdopen(
+                os.open(temporary_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb"
+            ) as ff:
+                ff.write(pickled)
+            os.replace(temporary_file, cache_file)
+        except OSError as e:
+            logger.debug("Unable to write parsed priors to {}: {}".format(cache_file, e))
 
     @classmethod
     def _get_from_json_dict(cls, prior_dict):
@@ -366,19 +536,23 @@ class PriorDict(dict):
         for key in self:
             self.test_redundancy(key)
 
-    def sample(self, size=None):
+    def sample(self, size=None, npool=None):
         """Draw samples from the prior set
 
         Parameters
         ==========
         size: int or tuple of ints, optional
             See numpy.random.uniform docs
+        npool: int, optional
+            The number of processes to draw the samples with
 
         Returns
         =======
         dict: Dictionary of the samples
         """
-        return self.sample_subset_constrained(keys=list(self.keys()), size=size)
+        return self.sample_subset_constrained(
+            keys=list(self.keys()), size=size, npool=npool
+        )
 
     def sample_subset_constrained_as_array(self, keys=iter([]), size=None):
         """Return an array of samples
@@ -443,37 +617,154 @@ class PriorDict(dict):
     def constraint_keys(self):
         return [k for k, p in self.items() if isinstance(p, Constraint)]
 
-    def sample_subset_constrained(self, keys=iter([]), size=None):
+    def sample_subset_constrained(
+        self, keys=iter([]), size=None, npool=None, parallel_comms=None
+    ):
+        """Draw samples from the prior set satisfying the constraints
+
+        The acceptance rate of the constraints is estimated from the first
+        batch of samples and later batches are oversampled accordingly, the
+        accepted samples are written into a preallocated array.
+
+        Parameters
+        ==========
+        keys: list
+            The keys to sample, any constraint keys are removed from the list
+        size: int or tuple of ints, optional
+            See numpy.random.uniform docs
+        npool: int, optional
+            If greater than one, draw the samples in parallel using a pool
+            of this many processes, see
+            :code:`bilby.core.sampler.base_sampler.create_pool`
+        parallel_comms: str, optional
+            The parallelisation backend for the pool
+
+        Returns
+        =======
+        dict: Dictionary of the samples
+        """
         if size is None or size == 1:
             while True:
                 sample = self.sample_subset(keys=keys, size=size)
                 if self.evaluate_constraints(sample):
                     return sample
         else:
-            needed = np.prod(size)
+            needed = int(np.prod(size))
             for key in keys.copy():
                 if isinstance(self[key], Constraint):
                     del keys[keys.index(key)]
-            all_samples = {key: np.array([]) for key in keys}
-            _first_key = list(all_samples.keys())[0]
-            while len(all_samples[_first_key]) < needed:
-                samples = self.sample_subset(keys=keys, size=needed)
-                keep = np.array(self.evaluate_constraints(samples), dtype=bool)
-                for key in keys:
-                    all_samples[key] = np.hstack(
-                        [all_samples[key], samples[key][keep].flatten()]
-                    )
+            if npool is not None and npool > 1:
+                all_samples = self._parallel_constrained_samples(
+                    keys=keys, needed=needed, npool=npool, parallel_comms=parallel_comms
+                )
+            else:
+                all_samples = self._constrained_samples(keys=keys, needed=needed)
             all_samples = {
-                key: np.reshape(all_samples[key][:needed], size) for key in keys
+                key: np.reshape(all_samples[key], size) for key in keys
             }
             return all_samples
 
+    def _constrained_samples(self, keys, needed, maximum_batch=1000000):
+        """Draw a flat array of needed samples satisfying the constraints
+
+        At most maximum_batch samples are drawn at a time.
+        """
+        all_samples = None
+        filled = 0
+        ndrawn = 0
+        naccepted = 0
+        batch = min(needed, maximum_batch)
+        while filled < needed:
+            samples = self.sample_subset(keys=keys, size=batch)
+            keep = np.broadcast_to(
+                np.array(self.evaluate_constraints(samples), dtype=bool), (batch,)
+            )
+            if all_samples is None:
+                all_samples = {
+                    key: np.empty(
+                        needed, dtype=np.result_type(np.float64, np.asarray(samples[key]))
+                    )
+                    for key in keys
+                }
+            ndrawn += batch
+            naccepted += np.count_nonzero(keep)
+            accepted = np.flatnonzero(keep)[:needed - filled]
+            for key in keys:
+                all_samples[key][filled:filled + len(accepted)] = np.ravel(
+                    samples[key]
+                )[accepted]
+            filled += len(accepted)
+            acceptance = max(naccepted, 1) / ndrawn
+            batch = int(min(
+                np.ceil(1.1 * (needed - filled) / acceptance) + 1, maximum_batch
+            ))
+        if all_samples is None:
+            all_samples = {key: np.empty(0) for key in keys}
+        return all_samples
+
+    def _parallel_constrained_samples(self, keys, needed, npool, parallel_comms=None):
+        """Draw a flat array of constrained samples split over a pool"""
+        from ..sampler.base_sampler import close_pool, create_pool
+        from ..utils.random import generate_seeds
+
+        pool = create_pool(priors=self, npool=npool, parallel_comms=parallel_comms)
+        if pool is None:
+            return self._constrained_samples(keys=keys, needed=needed)
+        nprocesses = getattr(pool, "_processes", npool) or npool
+        sizes = [len(chunk) for chunk in np.array_split(np.arange(needed), nprocesses)]
+        sizes = [size for size in sizes if size > 0]
+        seeds = generate_seeds(len(sizes))
+        try:
+            chunks = pool.map(
+                _constrained_samples_on_worker,
+                [(list(keys), size, seed) for size, seed in zip(sizes, seeds)],
+            )
+        finally:
+            close_pool(pool)
+        all_samples = dict()
+        for key in keys:
+            all_samples[key] = np.empty(
+                needed, dtype=np.result_type(*[chunk[key] for chunk in chunks])
+            )
+            start = 0
+            for size, chunk in zip(sizes, chunks):
+                all_samples[key][start:start + size] = chunk[key]
+                start += size
+        return all_samples
+
     def normalize_constraint_factor(
         self, keys, min_accept=10000, sampling_chunk=50000, nrepeats=10
     ):
+        """The normalization of the prior for the given keys due to constraints
+
+        This is estimated by Monte Carlo sampling once per set of keys. The
+        estimate is cached in memory and, if :code:`normalization_file` is set,
+        on disk keyed by the repr of the priors involved and the code of the
+        conversion function, so that later jobs using the same priors can
+        reuse it.
+
+        Parameters
+        ==========
+        keys: tuple
+            The keys of the samples the prior is evaluated for
+        min_accept: int
+            The minimum number of accepted samples for each estimate
+        sampling_chunk: int
+            The number of samples to draw at a time
+        nrepeats: int
+            The number of estimates to average over
+
+        Returns
+        =======
+        float: The factor to multiply the prior probability by
+        """
         if keys in self._cached_normalizations.keys():
             return self._cached_normalizations[keys]
+        elif len(self.constraint_keys) == 0:
+            factor_rounded = 1
         else:
+            factor_rounded = self._read_normalization(keys)
+        if factor_rounded is None:
             factor_estimates = [
                 self._estimate_normalization(keys, min_accept, sampling_chunk)
                 for _ in range(nrepeats)
@@ -484,23 +775,115 @@ class PriorDict(dict):
                 factor_rounded = np.round(factor, decimals)
             else:
                 factor_rounded = factor
-            self._cached_normalizations[keys] = factor_rounded
-            return factor_rounded
+            self._write_normalization(keys, factor_rounded)
+        self._cached_normalizations[keys] = factor_rounded
+        return factor_rounded
 
     def _estimate_normalization(self, keys, min_accept, sampling_chunk):
-        samples = self.sample_subset(keys=keys, size=sampling_chunk)
-        keep = np.atleast_1d(self.evaluate_constraints(samples))
-        if len(keep) == 1:
-            self._cached_normalizations[keys] = 1
-            return 1
-        all_samples = {key: np.array([]) for key in keys}
-        while np.count_nonzero(keep) < min_accept:
+        """Estimate the constraint normalization from batches of samples
+
+        Only the new samples are tested against the constraints, the number of
+        samples drawn and accepted are accumulated until min_accept samples
+        have been accepted.
+        """
+        naccepted = 0
+        ntotal = 0
+        while naccepted < min_accept:
             samples = self.sample_subset(keys=keys, size=sampling_chunk)
-            for key in samples:
-                all_samples[key] = np.hstack([all_samples[key], samples[key].flatten()])
-            keep = np.array(self.evaluate_constraints(all_samples), dtype=bool)
-        factor = len(keep) / np.count_nonzero(keep)
-        return factor
+            keep = np.atleast_1d(self.evaluate_constraints(samples))
+            if len(keep) == 1:
+                return 1
+            naccepted += np.count_nonzero(keep)
+            ntotal += len(keep)
+        return ntotal / naccepted
+
+    def _normalization_key(self, keys):
+        """A hash of the priors and conversion determining a normalization"""
+        entries = [
+            "{}={!r}".format(key, self[key])
+            for key in sorted(set(keys) | set(self.constraint_keys))
+            if key in self
+        ]
+        conversion = self.conversion_function
+        fingerprint = _function_fingerprint(conversion)
+        if fingerprint is None:
+            return None
+        entries.append(
+            "{}.{}:{}".format(
+                getattr(conversion, "__module__", ""),
+                getattr(conversion, "__qualname__", repr(conversion)),
+                fingerprint,
+            )
+        )
+        return hashlib.sha256("\n".join(entries).encode()).hexdigest()
+
+    @staticmethod
+    def _read_normalization_file(filename):
+        if filename is None or not os.path.isfile(filename):
+            return dict()
+        try:
+            with open(filename, "r") as ff:
+                return json.load(ff)
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "Unable to read constraint normalizations from {}: {}".format(
+                    filename, e
+                )
+            )
+            return dict()
+
+    def _read_normalization(self, keys):
+        filename = getattr(self, "normalization_file", None)
+        key = self._normalization_key(keys)
+        if filename is None or key is None:
+            return None
+        stored = self._read_normalization_file(filename)
+        return stored.get(key, None)
+
+    def _write_normalization(self, keys, factor):
+        filename = getattr(self, "normalization_file", None)
+        key = self._normalization_key(keys)
+        if filename is None or key is None:
+            return
+        self._update_normalization_file(filename, {key: float(factor)})
+
+    def _update_normalization_file(self, filename, normalizations):
+        stored = self._read_normalization_file(filename)
+        stored.update(normalizations)
+        temporary_file = "{}.{}.tmp".format(filename, os.getpid())
+        try:
+            with open(temporary_file, "w") as ff:
+                json.dump(stored, ff, indent=2)
+            os.replace(temporary_file, filename)
+            logger.debug("Written constraint normalizations to {}".format(filename))
+        except OSError as e:
+            logger.warning(
+                "Unable to write constraint normalizations to {}: {}".format(
+                    filename, e
+                )
+            )
+
+    def write_normalizations(self, filename=None):
+        """Store the constraint normalizations computed so far
+
+        Parameters
+        ==========
+        filename: str, optional
+            The file to write to, the existing contents are kept. Defaults to
+            :code:`normalization_file`. Prior files read with
+            :code:`from_file` use the normalizations in
+            :code:`<prior file>.normalization.json` if it exists.
+        """
+        if filename is None:
+            filename = self.normalization_file
+        if filename is None:
+            raise ValueError("No file to write the normalizations to")
+        normalizations = dict()
+        for keys, factor in self._cached_normalizations.items():
+            key = self._normalization_key(keys)
+            if key is not None:
+                normalizations[key] = float(factor)
+        self._update_normalization_file(filename, normalizations)
 
     def prob(self, sample, **kwargs):
         """
@@ -556,6 +939,45 @@ class PriorDict(dict):
         ln_prob = np.sum([self[key].ln_prob(sample[key]) for key in sample], axis=axis)
         return self.check_ln_prob(sample, ln_prob)
 
+    def batch_ln_prob(self, samples):
+        """Calculate the joint log probability of many samples at once
+
+        Each prior is evaluated once for all samples, and the conversion
+        function and constraints are only evaluated once for the samples with
+        non-zero probability.
+
+        Parameters
+        ==========
+        samples: dict, pandas.DataFrame, numpy structured array
+            The samples, a dictionary of arrays or a table with one column
+            per key
+
+        Returns
+        =======
+        array_like: The log probability of each sample
+        """
+        samples = _samples_to_dict(samples)
+        ln_prob = np.zeros(_number_of_samples(samples))
+        for key in samples:
+            ln_prob += self[key].ln_prob(samples[key])
+        return self._constrain_batch_ln_prob(samples, ln_prob)
+
+    def _constrain_batch_ln_prob(self, samples, ln_prob):
+        if len(self.constraint_keys) == 0:
+            return ln_prob
+        finite = np.flatnonzero(np.isfinite(ln_prob))
+        if len(finite) == 0:
+            return ln_prob
+        if len(finite) < len(ln_prob):
+            samples = {key: value[finite] for key, value in samples.items()}
+        keep = np.broadcast_to(
+            np.asarray(self.evaluate_constraints(samples), dtype=bool), finite.shape
+        )
+        ln_prob[finite[~keep]] = -np.inf
+        ratio = self.normalize_constraint_factor(tuple(samples.keys()))
+        ln_prob[finite[keep]] += np.log(ratio)
+        return ln_prob
+
     def check_ln_prob(self, sample, ln_prob):
         ratio = self.normalize_constraint_factor(tuple(sample.keys()))
         if np.all(np.isinf(ln_prob)):
@@ -603,11 +1025,43 @@ class PriorDict(dict):
         =======
         list: List of floats containing the rescaled sample
         """
-        from matplotlib.cbook import flatten
+        transform = self.compile_prior_transform(keys)
+        return transform.rescale_sample(_unit_cube_array(theta).tolist())
 
-        return list(
-            flatten([self[key].rescale(sample) for key, sample in zip(keys, theta)])
-        )
+    def compile_prior_transform(self, keys):
+        """Get a prior transform for a fixed set of keys
+
+        The transform is built once and cached, it is rebuilt if any of the
+        priors it uses are replaced.
+
+        Parameters
+        ==========
+        keys: list
+            List of prior keys to be rescaled, in the order of the unit-cube
+            samples.
+
+        Returns
+        =======
+        CompiledPriorTransform: callable mapping an array of unit-cube samples
+        with shape (ndim,) or (N, ndim) to an array of samples from the prior
+        with the same shape.
+        """
+        keys = tuple(keys)
+        if getattr(self, "_compiled_prior_transforms", None) is None:
+            self._compiled_prior_transforms = dict()
+        transform = self._compiled_prior_transforms.get(keys, None)
+        if transform is None or not transform.is_valid_for(self):
+            transform = CompiledPriorTransform(
+                self,
+                keys,
+                order=self._rescale_order(keys),
+                conditional=self._conditional_prior_transform,
+            )
+            self._compiled_prior_transforms[keys] = transform
+        return transform
+
+    def _rescale_order(self, keys):
+        return list(keys)
 
     def test_redundancy(self, key, disable_logging=False):
         """Empty redundancy test, should be overwritten in subclasses"""
@@ -641,7 +1095,254 @@ class PriorDict(dict):
         We have to overwrite the copy method as it fails due to the presence of
         defaults.
         """
-        return self.__class__(dictionary=dict(self))
+        new = self.__class__(dictionary=dict(self))
+        new.normalization_file = getattr(self, "normalization_file", None)
+        return new
+
+
+def _function_fingerprint(function):
+    """A hash of the code, defaults and closure of a function
+
+    Used to identify conversion functions in the stored constraint
+    normalizations. Returns None for callables without Python code (or
+    with a closure which cannot be identified), whose normalizations are
+    then not stored on disk.
+    """
+    function = getattr(function, "__func__", function)
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return None
+    digest = hashlib.sha256()
+
+    def add_code(code):
+        digest.update(code.co_code)
+        digest.update(repr(code.co_names).encode())
+        for constant in code.co_consts:
+            if isinstance(constant, types.CodeType):
+                add_code(constant)
+            else:
+                digest.update(repr(constant).encode())
+
+    add_code(code)
+    digest.update(repr(function.__defaults__).encode())
+    digest.update(repr(function.__kwdefaults__).encode())
+    for cell in function.__closure__ or []:
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            continue
+        if callable(value):
+            value = _function_fingerprint(value)
+            if value is None:
+                return None
+        digest.update(repr(value).encode())
+    return digest.hexdigest()
+
+
+def _constrained_samples_on_worker(args):
+    from ..sampler.base_sampler import _sampling_convenience_dump
+    from ..utils.random import seed
+
+    keys, size, rseed = args
+    seed(rseed)
+    return _sampling_convenience_dump.priors._constrained_samples(keys=keys, needed=size)
+
+
+def _evaluate_prior(prior, method, val, required_variables):
+    """Evaluate a method of a prior without modifying conditional priors"""
+    if hasattr(prior, "condition_func"):
+        return prior.evaluate(method, val, **required_variables)
+    return getattr(prior, method)(val, **required_variables)
+
+
+def _samples_to_dict(samples):
+    """Get a dictionary of arrays (views where possible) from a set of samples"""
+    if isinstance(samples, np.ndarray) and samples.dtype.names is not None:
+        return {key: samples[key] for key in samples.dtype.names}
+    elif hasattr(samples, "columns"):
+        return {key: samples[key].to_numpy() for key in samples.columns}
+    else:
+        return {key: np.atleast_1d(value) for key, value in samples.items()}
+
+
+def _number_of_samples(samples):
+    return max([len(value) for value in samples.values()] + [0])
+
+
+def _unit_cube_array(theta):
+    """Convert a sequence of unit-cube values (possibly length-1 arrays) to an array"""
+    if isinstance(theta, np.ndarray):
+        return theta.astype(float, copy=False)
+    return np.hstack(list(theta)).astype(float)
+
+
+class CompiledPriorTransform(object):
+    def __init__(self, priors, keys, order=None, conditional=False):
+        """Prior transform from the unit hypercube for a fixed set of keys
+
+        The order of evaluation, the column of each key and the required
+        variables of conditional priors are resolved once, so calling the
+        transform only calls the rescale method of each prior.
+
+        Parameters
+        ==========
+        priors: PriorDict
+            The priors to use
+        keys: list
+            The keys corresponding to the columns of the unit-cube samples
+        order: list, optional
+            The order to evaluate the keys in, must be consistent with any
+            conditions. Defaults to the order of keys.
+        conditional: bool
+            Whether to pass the required variables to conditional priors
+        """
+        self.keys = list(keys)
+        self.ndim = len(self.keys)
+        self.conditional = conditional
+        if order is None:
+            order = self.keys
+        columns = {key: ii for ii, key in enumerate(self.keys)}
+
+        self._priors = {key: priors[key] for key in self.keys}
+        self._steps = []
+        joint_distributions = []
+        for key in order:
+            prior = priors[key]
+            if isinstance(prior, JointPrior):
+                if prior.dist in joint_distributions:
+                    continue
+                joint_distributions.append(prior.dist)
+                missing = [name for name in prior.dist.names if name not in columns]
+                if len(missing) > 0:
+                    raise ValueError(
+                        "Keys {} of {} are required to rescale".format(
+                            missing, prior.dist.distname
+                        )
+                    )
+                self._steps.append(
+                    (prior, [columns[name] for name in prior.dist.names], None)
+                )
+            else:
+                required = [
+                    (name, columns.get(name, None))
+                    for name in getattr(prior, "required_variables", [])
+                ]
+                for name, _ in required:
+                    self._priors[name] = priors[name]
+                self._steps.append((prior, columns[key], required))
+
+    def is_valid_for(self, priors):
+        """Whether the transform uses the current priors in the dictionary"""
+        try:
+            return all(priors[key] is prior for key, prior in self._priors.items())
+        except KeyError:
+            return False
+
+    def __call__(self, theta, out=None):
+        """Rescale samples from the unit hypercube to the prior
+
+        Parameters
+        ==========
+        theta: array_like
+            Unit-cube samples with shape (ndim,) or (N, ndim)
+        out: array_like, optional
+            An array with the same shape as theta to store the result in
+
+        Returns
+        =======
+        array_like: The samples from the prior
+        """
+        theta = np.asarray(theta, dtype=float)
+        if theta.shape[-1] != self.ndim:
+            raise ValueError(
+                "Expected samples with {} parameters, got shape {}".format(
+                    self.ndim, theta.shape
+                )
+            )
+        if theta.ndim == 1 and out is None:
+            return np.array(self.rescale_sample(theta.tolist()))
+        if out is None:
+            out = np.empty_like(theta)
+        for prior, column, required in self._steps:
+            values = theta[..., column]
+            if required is None:
+                result = prior.dist.batch_rescale(np.reshape(values, (-1, len(column))))
+            elif self.conditional and len(required) > 0:
+                required_variables = {
+                    name: self._priors[name].least_recently_sampled
+                    if index is None
+                    else out[..., index]
+                    for name, index in required
+                }
+                result = self._conditional_rescale(prior, values, required_variables)
+            else:
+                result = prior.rescale(values)
+            out[..., column] = self._reshape(result, np.shape(values))
+        return out
+
+    def rescale_sample(self, theta):
+        """Rescale a single sample
+
+        This avoids the array overheads of __call__ for a single sample.
+
+        Parameters
+        ==========
+        theta: list
+            The unit-cube values, one for each key
+
+        Returns
+        =======
+        list: The rescaled sample
+        """
+        out = [0.0] * self.ndim
+        for prior, column, required in self._steps:
+            if required is None:
+                result = np.reshape(prior.dist.rescale([theta[ii] for ii in column]), -1)
+                for ii, value in zip(column, result):
+                    out[ii] = value
+                continue
+            elif self.conditional and len(required) > 0:
+                required_variables = {
+                    name: self._priors[name].least_recently_sampled
+                    if index is None
+                    else out[index]
+                    for name, index in required
+                }
+                result = _evaluate_prior(prior, "rescale", theta[column], required_variables)
+            else:
+                result = prior.rescale(theta[column])
+            if not isinstance(result, float):
+                result = np.reshape(result, -1)[0]
+            out[column] = result
+        return out
+
+    @staticmethod
+    def _conditional_rescale(prior, values, required_variables):
+        try:
+            return _evaluate_prior(prior, "rescale", values, required_variables)
+        except ValueError:
+            # Some prior classes can not handle an array of conditional
+            # parameters (e.g. alpha for PowerLaw), rescale each sample individually
+            if np.ndim(values) == 0:
+                raise
+            result = np.zeros(len(values))
+            for ii in range(len(values)):
+                rvars = {
+                    key: value if np.ndim(value) == 0 else value[ii]
+                    for key, value in required_variables.items()
+                }
+                result[ii] = _evaluate_prior(prior, "rescale", values[ii], rvars)
+            return result
+
+    @staticmethod
+    def _reshape(result, shape):
+        result = np.asarray(result, dtype=float)
+        if result.shape == shape:
+            return result
+        elif result.size == np.prod(shape, dtype=int):
+            return result.reshape(shape)
+        else:
+            return np.broadcast_to(result, shape)
 
 
 class PriorDictException(Exception):
@@ -649,6 +1350,8 @@ class PriorDictException(Exception):
 
 
 class ConditionalPriorDict(PriorDict):
+    _conditional_prior_transform = True
+
     def __init__(self, dictionary=None, filename=None, conversion_function=None):
         """
 
@@ -777,11 +1480,7 @@ class ConditionalPriorDict(PriorDict):
         float: Joint probability of all individual sample probabilities
 
         """
-        self._prepare_evaluation(*zip(*sample.items()))
-        res = [
-            self[key].prob(sample[key], **self.get_required_variables(key))
-            for key in sample
-        ]
+        res = list(self._evaluate("prob", sample).values())
         prob = np.product(res, **kwargs)
         return self.check_prob(sample, prob)
 
@@ -800,21 +1499,80 @@ class ConditionalPriorDict(PriorDict):
         float: Joint log probability of all the individual sample probabilities
 
         """
-        self._prepare_evaluation(*zip(*sample.items()))
-        res = [
-            self[key].ln_prob(sample[key], **self.get_required_variables(key))
-            for key in sample
-        ]
+        res = list(self._evaluate("ln_prob", sample).values())
         ln_prob = np.sum(res, axis=axis)
         return self.check_ln_prob(sample, ln_prob)
 
+    def batch_ln_prob(self, samples):
+        """Calculate the joint log probability of many samples at once
+
+        The required variables of conditional priors are taken directly from
+        the samples, see :code:`PriorDict.batch_ln_prob` for details.
+
+        Parameters
+        ==========
+        samples: dict, pandas.DataFrame, numpy structured array
+            The samples, a dictionary of arrays or a table with one column
+            per key
+
+        Returns
+        =======
+        array_like: The log probability of each sample
+        """
+        samples = _samples_to_dict(samples)
+        ln_prob = np.zeros(_number_of_samples(samples))
+        for value in self._evaluate("ln_prob", samples).values():
+            ln_prob += value
+        return self._constrain_batch_ln_prob(samples, ln_prob)
+
     def cdf(self, sample):
-        self._prepare_evaluation(*zip(*sample.items()))
-        res = {
-            key: self[key].cdf(sample[key], **self.get_required_variables(key))
-            for key in sample
-        }
-        return sample.__class__(res)
+        return sample.__class__(self._evaluate("cdf", sample))
+
+    def _evaluate(self, method, sample):
+        """Evaluate a method of the prior for each key in the sample
+
+        The required variables of conditional priors are taken from the
+        sample, or from the last sampled values if they are not in the
+        sample, and joint priors are evaluated once for each distribution.
+        None of the priors are modified, so this can be called from multiple
+        threads.
+
+        Parameters
+        ==========
+        method: str
+            One of :code:`prob`, :code:`ln_prob` or :code:`cdf`
+        sample: dict
+            Dictionary of the samples to evaluate the method at
+
+        Returns
+        =======
+        dict: The output of the method for each key
+        """
+        self._check_resolved()
+        results = dict()
+        evaluated_distributions = list()
+        for key in sample:
+            prior = self[key]
+            if (
+                isinstance(prior, JointPrior)
+                and method in ["prob", "ln_prob"]
+                and all(name in sample for name in prior.dist.names)
+            ):
+                if any(prior.dist is dist for dist in evaluated_distributions):
+                    result = np.zeros_like(np.asarray(sample[key], dtype=float))
+                else:
+                    evaluated_distributions.append(prior.dist)
+                    result = prior.dist.ln_prob(
+                        np.asarray([sample[name] for name in prior.dist.names]).T
+                    )
+                results[key] = np.exp(result) if method == "prob" else result
+                continue
+            required_variables = {
+                name: sample[name] if name in sample else self[name].least_recently_sampled
+                for name in getattr(prior, "required_variables", [])
+            }
+            results[key] = _evaluate_prior(prior, method, sample[key], required_variables)
+        return results
 
     def rescale(self, keys, theta):
         """Rescale samples from unit cube to prior
@@ -829,22 +1587,31 @@ class ConditionalPriorDict(PriorDict):
         Returns
         =======
         list: List of floats containing the rescaled sample
+
+        Notes
+        =====
+        The rescaled values are stored as the :code:`least_recently_sampled`
+        value of each prior. To rescale without modifying the priors, e.g.,
+        from multiple threads, use the transform returned by
+        :code:`compile_prior_transform`.
         """
-        from matplotlib.cbook import flatten
+        self._check_resolved()
+        transform = self.compile_prior_transform(keys)
+        result = transform.rescale_sample(_unit_cube_array(theta).tolist())
+        for key, value in zip(transform.keys, result):
+            self[key].least_recently_sampled = value
+        return result
 
-        keys = list(keys)
-        theta = list(theta)
+    def compile_prior_transform(self, keys):
         self._check_resolved()
-        self._update_rescale_keys(keys)
-        result = dict()
-        for key, index in zip(
-            self.sorted_keys_without_fixed_parameters, self._rescale_indexes
-        ):
-            result[key] = self[key].rescale(
-                theta[index], **self.get_required_variables(key)
-            )
-            self[key].least_recently_sampled = result[key]
-        return list(flatten([result[key] for key in keys]))
+        return super(ConditionalPriorDict, self).compile_prior_transform(keys)
+
+    def _rescale_order(self, keys):
+        order = self.sorted_keys_without_fixed_parameters
+        missing = [key for key in order if key not in keys]
+        if len(missing) > 0:
+            raise ValueError("Keys {} are required to rescale".format(missing))
+        return order + [key for key in keys if key not in order]
 
     def _update_rescale_keys(self, keys):
         if not keys == self._least_recently_rescaled_keys:
@@ -854,11 +1621,6 @@ class ConditionalPriorDict(PriorDict):
             ]
             self._least_recently_rescaled_keys = keys
 
-    def _prepare_evaluation(self, keys, theta):
-        self._check_resolved()
-        for key, value in zip(keys, theta):
-            self[key].least_recently_sampled = value
-
     def _check_resolved(self):
         if not self._resolved:
             raise IllegalConditionsException(
@@ -907,7 +1669,9 @@ class DirichletPriorDict(ConditionalPriorDict):
             )
 
     def copy(self, **kwargs):
-        return self.__class__(n_dim=self.n_dim, label=self.label)
+        new = self.__class__(n_dim=self.n_dim, label=self.label)
+        new.normalization_file = getattr(self, "normalization_file", None)
+        return new
 
     def _get_json_dict(self):
         total_dict = dict()
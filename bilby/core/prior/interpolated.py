@@ -41,7 +41,17 @@ class Interped(Prior):
         YY: array_like
             Cumulative prior probability distribution
 
+        Notes
+        =====
+        The interpolants are evaluated with :code:`numpy.interp`, the
+        :code:`scipy` objects above are kept for convenience. For faster
+        evaluation at some loss of precision a uniformly spaced table of the
+        inverse cumulative distribution can be used, see
+        :code:`build_lookup_table`.
+
         """
+        self._lookup_settings = None
+        self._lookup_table = None
         self.xx = xx
         self.min_limit = min(xx)
         self.max_limit = max(xx)
@@ -75,10 +85,10 @@ class Interped(Prior):
         =======
          Union[float, array_like]: Prior probability of val
         """
-        return self.probability_density(val)
+        return np.interp(val, self.xx, self._yy, left=0, right=0)
 
     def cdf(self, val):
-        return self.cumulative_distribution(val)
+        return np.interp(val, self.xx, self.YY, left=0, right=1)
 
     def rescale(self, val):
         """
@@ -86,11 +96,75 @@ class Interped(Prior):
 
         This maps to the inverse CDF. This is done using interpolation.
         """
-        rescaled = self.inverse_cumulative_distribution(val)
+        # Interped priors pickled before lookup tables were added do not have one
+        lookup_table = getattr(self, "_lookup_table", None)
+        if lookup_table is not None:
+            return lookup_table(val)
+        if isinstance(val, (float, int)):
+            if not 0 <= val <= 1:
+                raise ValueError("Values to rescale must be in the interval [0, 1].")
+            return float(np.interp(val, self.YY, self.xx))
+        val = np.asarray(val)
+        if np.any(val < 0) or np.any(val > 1):
+            raise ValueError("Values to rescale must be in the interval [0, 1].")
+        rescaled = np.interp(val, self.YY, self.xx)
         if rescaled.shape == ():
             rescaled = float(rescaled)
         return rescaled
 
+    def build_lookup_table(self, resolution=4096, tolerance=None, max_resolution=2**20):
+        """
+        Tabulate the inverse cumulative distribution on a uniform grid.
+
+        The inverse CDF is then evaluated with index arithmetic rather than a
+        search over the interpolation nodes. The table is rebuilt if the prior
+        is changed.
+
+        Parameters
+        ==========
+        resolution: int
+            The number of points in the table.
+        tolerance: float, optional
+            The maximum allowed difference from the exact interpolant
+            relative to the width of the prior. If given, the resolution is
+            doubled until this is met. If it cannot be met with
+            :code:`max_resolution` points, e.g., for inverse CDFs which are
+            very steep near the edges, the table is not used.
+        max_resolution: int
+            The maximum number of points in the table.
+
+        Returns
+        =======
+        float: The maximum difference from the exact interpolant relative to
+            the width of the prior.
+        """
+        self._lookup_settings = dict(
+            resolution=resolution, tolerance=tolerance, max_resolution=max_resolution
+        )
+        self._lookup_table = None
+        width = self.maximum - self.minimum
+        while True:
+            table = InverseCDFTable(self.YY, self.xx, resolution)
+            test_points = (np.arange(resolution - 1) + 0.5) / (resolution - 1)
+            error = np.max(np.abs(
+                table(test_points) - np.interp(test_points, self.YY, self.xx)
+            )) / width
+            if tolerance is None or error <= tolerance:
+                self._lookup_table = table
+                return error
+            elif 2 * resolution > max_resolution:
+                logger.warning(
+                    "Unable to tabulate the inverse CDF for {} to within {}, the "
+                    "maximum error is {}.".format(self.name, tolerance, error)
+                )
+                return error
+            resolution *= 2
+
+    def remove_lookup_table(self):
+        """Evaluate the inverse CDF using the exact interpolant."""
+        self._lookup_settings = None
+        self._lookup_table = None
+
     @property
     def minimum(self):
         """Return minimum of the prior distribution.
@@ -172,6 +246,47 @@ class Interped(Prior):
         self.probability_density = interp1d(x=self.xx, y=self._yy, bounds_error=False, fill_value=0)
         self.cumulative_distribution = interp1d(x=self.xx, y=self.YY, bounds_error=False, fill_value=(0, 1))
         self.inverse_cumulative_distribution = interp1d(x=self.YY, y=self.xx, bounds_error=True)
+        if getattr(self, "_lookup_settings", None) is not None:
+            self.build_lookup_table(**self._lookup_settings)
+
+
+class InverseCDFTable(object):
+
+    def __init__(self, cdf, xx, resolution):
+        """
+        A uniformly spaced table of an inverse cumulative distribution.
+
+        Parameters
+        ==========
+        cdf: array_like
+            The cumulative distribution at xx, increasing from zero to one
+        xx: array_like
+            The values the cumulative distribution is evaluated at
+        resolution: int
+            The number of points in the table
+        """
+        self.resolution = int(resolution)
+        self.values = np.interp(np.linspace(0, 1, self.resolution), cdf, xx)
+        self._values_list = self.values.tolist()
+
+    def __call__(self, val):
+        if isinstance(val, (float, int)):
+            if not 0 <= val <= 1:
+                raise ValueError("Values to rescale must be in the interval [0, 1].")
+            position = val * (self.resolution - 1)
+            index = min(int(position), self.resolution - 2)
+            lower = self._values_list[index]
+            return lower + (position - index) * (self._values_list[index + 1] - lower)
+        val = np.asarray(val, dtype=float)
+        if np.any(val < 0) or np.any(val > 1):
+            raise ValueError("Values to rescale must be in the interval [0, 1].")
+        position = val * (self.resolution - 1)
+        index = np.minimum(position.astype(int), self.resolution - 2)
+        lower = self.values[index]
+        rescaled = lower + (position - index) * (self.values[index + 1] - lower)
+        if rescaled.shape == ():
+            rescaled = float(rescaled)
+        return rescaled
 
 
 class FromFile(Interped):
@@ -2,6 +2,7 @@ import re
 
 import numpy as np
 import scipy.stats
+from scipy.linalg import solve_triangular
 from scipy.special import erfinv
 
 from .base import Prior, PriorException
@@ -311,6 +312,70 @@ class BaseJointPriorDist(object):
         """
         return samp
 
+    def _check_batch(self, value):
+        samp = np.asarray(value, dtype=float)
+        if samp.ndim == 1:
+            samp = samp.reshape(1, -1)
+        if samp.ndim != 2 or samp.shape[1] != self.num_vars:
+            raise ValueError("Array is the wrong shape")
+        return samp
+
+    def _outside_bounds(self, samp):
+        outbounds = np.zeros(samp.shape[0], dtype=bool)
+        for column, bound in zip(samp.T, self.bounds.values()):
+            outbounds |= (column < bound[0]) | (column > bound[1])
+        return outbounds
+
+    def batch_rescale(self, value, **kwargs):
+        """
+        Rescale an array of samples from the unit hypercube to the
+        JointPriorDist in a single call.
+
+        Unlike the :code:`JointPrior.rescale` method this does not store any
+        state on the distribution, so it can be used in vectorized prior
+        transforms and from multiple threads.
+
+        Parameters
+        ==========
+        value: array_like
+            A NxM array of samples drawn from a uniform distribution between
+            0 and 1, where N is the number of samples and M is the number of
+            parameters.
+        kwargs: dict
+            Keyword arguments passed to the :code:`_batch_rescale` method
+
+        Returns
+        =======
+        array: The NxM array of rescaled samples
+        """
+        samp = self._check_batch(value)
+        return self._batch_rescale(samp, **kwargs)
+
+    def _batch_rescale(self, samp, **kwargs):
+        """
+        Rescale a NxM array of samples, child classes can overwrite this
+        with a vectorized version of :code:`_rescale`.
+        """
+        return np.reshape(self._rescale(samp, **kwargs), samp.shape)
+
+    def batch_ln_prob(self, value):
+        """
+        Get the log-probability of an array of samples in a single call.
+
+        Parameters
+        ==========
+        value: array_like
+            A NxM array of samples, where N is the number of samples and M is
+            the number of parameters.
+
+        Returns
+        =======
+        array: The log-probability of each sample
+        """
+        samp = self._check_batch(value)
+        lnprob = -np.inf * np.ones(samp.shape[0])
+        return self._ln_prob(samp, lnprob, self._outside_bounds(samp))
+
 
 class MultivariateGaussianDist(BaseJointPriorDist):
     def __init__(
@@ -388,6 +453,8 @@ class MultivariateGaussianDist(BaseJointPriorDist):
         self.eigvalues = []
         self.eigvectors = []
         self.sqeigvalues = []  # square root of the eigenvalues
+        self.rescale_matrices = []  # map from standard normal samples to each mode
+        self.choleskys = []  # Cholesky factors of the correlation coefficient matrices
         self.mvn = []  # list of multivariate normal distributions
 
         # put values in lists if required
@@ -550,6 +617,12 @@ class MultivariateGaussianDist(BaseJointPriorDist):
             )
         self.sqeigvalues.append(np.sqrt(self.eigvalues[-1]))
 
+        # cache the matrices used to rescale samples and evaluate the
+        # probability so they are not recomputed for every sample
+        rescale_matrix, cholesky = self._mode_matrices(-1)
+        self.rescale_matrices.append(rescale_matrix)
+        self.choleskys.append(cholesky)
+
         # set the weights
         if weight is None:
             self.weights.append(1.0)
@@ -574,6 +647,28 @@ class MultivariateGaussianDist(BaseJointPriorDist):
             scipy.stats.multivariate_normal(mean=np.zeros(self.num_vars), cov=self.corrcoefs[-1])
         )
 
+    def _mode_matrices(self, mode):
+        """The rescale matrix and correlation Cholesky factor of a mode"""
+        rescale_matrix = (
+            self.sqeigvalues[mode][:, np.newaxis] * self.eigvectors[mode].T
+            * np.asarray(self.sigmas[mode])[np.newaxis, :]
+        )
+        cholesky = np.linalg.cholesky(self.corrcoefs[mode])
+        return rescale_matrix, cholesky
+
+    def _check_mode_matrices(self):
+        """Rebuild the cached mode matrices if they are missing
+
+        Distributions pickled before these were cached do not have them.
+        """
+        if (
+            getattr(self, "rescale_matrices", None) is None
+            or getattr(self, "choleskys", None) is None
+        ):
+            matrices = [self._mode_matrices(mode) for mode in range(self.nmodes)]
+            self.rescale_matrices = [matrix for matrix, _ in matrices]
+            self.choleskys = [cholesky for _, cholesky in matrices]
+
     def _rescale(self, samp, **kwargs):
         try:
             mode = kwargs["mode"]
@@ -594,6 +689,41 @@ class MultivariateGaussianDist(BaseJointPriorDist):
         )
         return samp
 
+    def _batch_rescale(self, samp, mode=None, **kwargs):
+        """
+        Rescale a NxM array of unit hypercube samples.
+
+        Parameters
+        ==========
+        samp: array_like
+            The NxM array of samples to rescale
+        mode: int, array_like, optional
+            The mode, or an array of modes one for each sample, to rescale
+            to. If not given, a mode is drawn at random for each sample
+            according to the weights.
+
+        Returns
+        =======
+        array: The NxM array of rescaled samples
+        """
+        self._check_mode_matrices()
+        normal = erfinv(2.0 * samp - 1) * 2.0 ** 0.5
+        if mode is None:
+            if self.nmodes == 1:
+                mode = 0
+            else:
+                mode = np.searchsorted(
+                    self.cumweights, random.rng.uniform(0, 1, samp.shape[0]), side="right"
+                )
+        if np.ndim(mode) == 0:
+            return np.asarray(self.mus[mode]) + normal @ self.rescale_matrices[mode]
+        mode = np.asarray(mode)
+        rescaled = np.empty_like(normal)
+        for ii in np.unique(mode):
+            idxs = mode == ii
+            rescaled[idxs] = np.asarray(self.mus[ii]) + normal[idxs] @ self.rescale_matrices[ii]
+        return rescaled
+
     def _sample(self, size, **kwargs):
         try:
             mode = kwargs["mode"]
@@ -639,12 +769,18 @@ class MultivariateGaussianDist(BaseJointPriorDist):
         return samps
 
     def _ln_prob(self, samp, lnprob, outbounds):
-        for j in range(samp.shape[0]):
-            # loop over the modes and sum the probabilities
-            for i in range(self.nmodes):
-                # self.mvn[i] is a "standard" multivariate normal distribution; see add_mode()
-                z = (samp[j] - self.mus[i]) / self.sigmas[i]
-                lnprob[j] = np.logaddexp(lnprob[j], self.mvn[i].logpdf(z) - self.logprodsigmas[i])
+        # loop over the modes and sum the probabilities, each mode is a
+        # "standard" multivariate normal distribution; see add_mode()
+        self._check_mode_matrices()
+        for i in range(self.nmodes):
+            z = (samp - self.mus[i]) / self.sigmas[i]
+            whitened = solve_triangular(self.choleskys[i], z.T, lower=True)
+            logpdf = (
+                -0.5 * np.sum(whitened ** 2, axis=0)
+                - np.sum(np.log(np.diag(self.choleskys[i])))
+                - 0.5 * self.num_vars * np.log(2 * np.pi)
+            )
+            lnprob = np.logaddexp(lnprob, logpdf - self.logprodsigmas[i])
 
         # set out-of-bounds values to -inf
         lnprob[outbounds] = -np.inf
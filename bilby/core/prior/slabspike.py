@@ -76,6 +76,11 @@ class SlabSpikePrior(Prior):
         """
         'Rescale' a sample from the unit line element to the prior.
 
+        The slab is evaluated once for all values: values above the spike are
+        shifted down by the spike height and values inside the spike are
+        mapped to the slab CDF at the spike location before being replaced
+        by the spike location.
+
         Parameters
         ==========
         val: Union[float, int, array_like]
@@ -86,25 +91,19 @@ class SlabSpikePrior(Prior):
         array_like: Associated prior value with input value.
         """
         original_is_number = isinstance(val, Number)
-        val = np.atleast_1d(val)
-
-        lower_indices = np.where(val < self.inverse_cdf_below_spike)[0]
-        intermediate_indices = np.where(np.logical_and(
-            self.inverse_cdf_below_spike <= val,
-            val <= self.inverse_cdf_below_spike + self.spike_height))[0]
-        higher_indices = np.where(val > self.inverse_cdf_below_spike + self.spike_height)[0]
-
-        res = np.zeros(len(val))
-        res[lower_indices] = self._contracted_rescale(val[lower_indices])
-        res[intermediate_indices] = self.spike_location
-        res[higher_indices] = self._contracted_rescale(val[higher_indices] - self.spike_height)
+        val = np.asarray(val, dtype=float)
+        if self.slab_fraction == 0:
+            res = np.full(val.shape, float(self.spike_location))
+        else:
+            lower = self.inverse_cdf_below_spike
+            upper = lower + self.spike_height
+            above = val > upper
+            in_spike = (val >= lower) & ~above
+            slab_val = np.where(above, val - self.spike_height, np.minimum(val, lower))
+            res = np.where(in_spike, self.spike_location, self._contracted_rescale(slab_val))
         if original_is_number:
-            try:
-                res = res[0]
-            except (KeyError, TypeError):
-                logger.warning("Based on inputs, a number should be output\
-                               but this could not be accessed from what was computed")
-        return res
+            return float(res)
+        return np.atleast_1d(res)
 
     def _contracted_rescale(self, val):
         """
@@ -134,17 +133,7 @@ class SlabSpikePrior(Prior):
         =======
         array_like: Prior probability of val
         """
-        original_is_number = isinstance(val, Number)
-        res = self.slab.prob(val) * self.slab_fraction
-        res = np.atleast_1d(res)
-        res[np.where(val == self.spike_location)] = np.inf
-        if original_is_number:
-            try:
-                res = res[0]
-            except (KeyError, TypeError):
-                logger.warning("Based on inputs, a number should be output\
-                               but this could not be accessed from what was computed")
-        return res
+        return self._with_spike(self.slab.prob(val) * self.slab_fraction, val)
 
     def ln_prob(self, val):
         """Return the Log prior probability of val.
@@ -158,17 +147,17 @@ class SlabSpikePrior(Prior):
         =======
         array_like: Prior probability of val
         """
+        with np.errstate(divide="ignore"):
+            log_slab_fraction = np.log(self.slab_fraction)
+        return self._with_spike(self.slab.ln_prob(val) + log_slab_fraction, val)
+
+    def _with_spike(self, res, val):
+        """Set the slab density res to np.inf at the spike location"""
         original_is_number = isinstance(val, Number)
-        res = self.slab.ln_prob(val) + np.log(self.slab_fraction)
-        res = np.atleast_1d(res)
-        res[np.where(val == self.spike_location)] = np.inf
+        res = np.where(np.asarray(val) == self.spike_location, np.inf, res)
         if original_is_number:
-            try:
-                res = res[0]
-            except (KeyError, TypeError):
-                logger.warning("Based on inputs, a number should be output\
-                               but this could not be accessed from what was computed")
-        return res
+            return float(res)
+        return np.atleast_1d(res)
 
     def cdf(self, val):
         """ Return the CDF of the prior.
@@ -184,8 +173,5 @@ class SlabSpikePrior(Prior):
         array_like: CDF value of val
 
         """
-        res = self.slab.cdf(val) * self.slab_fraction
-        res = np.atleast_1d(res)
-        indices_above_spike = np.where(val > self.spike_location)[0]
-        res[indices_above_spike] += self.spike_height
-        return res
+        res = self.slab.cdf(val) * self.slab_fraction + self.spike_height * (np.asarray(val) > self.spike_location)
+        return np.atleast_1d(res)
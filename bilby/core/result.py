@@ -225,28 +225,26 @@ def get_weights_for_reweighting(
     else:
         new_log_likelihood_array[starting_index:] = eval_pool(new_likelihood)
 
-    # Compute priors
-    for ii, sample in enumerate(tqdm(dict_samples[starting_index:],
-                                     desc='Computing priors',
-                                     total=n),
-                                start=starting_index):
-        # prior calculation needs to not have prior or likelihood keys
-        ln_prior = sample.pop("log_prior", np.nan)
-        if "log_likelihood" in sample:
-            del sample["log_likelihood"]
+    # Compute priors: the prior calculation needs to not have prior or likelihood keys
+    prior_samples = result.posterior.drop(columns=["log_prior", "log_likelihood"], errors="ignore")
+    for start in range(starting_index, nposterior, n_checkpoint):
+        stop = min(start + n_checkpoint, nposterior)
+        block = prior_samples.iloc[start:stop]
 
         if old_prior is not None:
-            old_log_prior_array[ii] = old_prior.ln_prob(sample)
+            old_log_prior_array[start:stop] = old_prior.batch_ln_prob(block)
+        elif "log_prior" in result.posterior:
+            old_log_prior_array[start:stop] = result.posterior["log_prior"].iloc[start:stop]
         else:
-            old_log_prior_array[ii] = ln_prior
+            old_log_prior_array[start:stop] = np.nan
 
         if new_prior is not None:
-            new_log_prior_array[ii] = new_prior.ln_prob(sample)
+            new_log_prior_array[start:stop] = new_prior.batch_ln_prob(block)
         else:
             # Don't perform prior reweighting (i.e. prior isn't updated)
-            new_log_prior_array[ii] = old_log_prior_array[ii]
+            new_log_prior_array[start:stop] = old_log_prior_array[start:stop]
 
-        if (ii % (n_checkpoint) == 0) and (resume_file is not None):
+        if resume_file is not None:
             checkpointed_index = np.argmin(np.abs(old_log_likelihood_array))
             logger.info(f'Checkpointing with {checkpointed_index} samples')
             np.savetxt(
@@ -1466,8 +1464,8 @@ class Result(object):
         data_frame['log_likelihood'] = getattr(
             self, 'log_likelihood_evaluations', np.nan)
         if self.log_prior_evaluations is None and priors is not None:
-            data_frame['log_prior'] = priors.ln_prob(
-                dict(data_frame[self.search_parameter_keys]), axis=0)
+            data_frame['log_prior'] = priors.batch_ln_prob(
+                data_frame[self.search_parameter_keys])
         else:
             data_frame['log_prior'] = self.log_prior_evaluations
 
@@ -64,6 +64,173 @@ def _initialize_global_variables(
     _sampling_convenience_dump.use_ratio = use_ratio
 
 
+class MPIPool(object):
+    """
+    A minimal wrapper around :code:`mpi4py.futures.MPIPoolExecutor` that
+    provides the subset of the :code:`multiprocessing.Pool` interface used
+    by the samplers and post-processing functions.
+
+    The initializer and its arguments are broadcast to the workers once when
+    the pool is set up, so large objects (e.g., the likelihood) are not
+    communicated with every task.
+
+    If the script is launched with, e.g.,
+    :code:`mpirun -n 257 python -m mpi4py.futures script.py` the workers are
+    taken from :code:`MPI.COMM_WORLD`, otherwise :code:`processes` workers are
+    spawned dynamically.
+
+    Parameters
+    ==========
+    processes: int, optional
+        The maximum number of worker processes.
+    initializer: callable, optional
+        Function called once on each worker when the pool starts.
+    initargs: tuple, optional
+        Arguments to pass to :code:`initializer`.
+    """
+
+    def __init__(self, processes=None, initializer=None, initargs=()):
+        from mpi4py.futures import MPIPoolExecutor
+
+        self._executor = MPIPoolExecutor(
+            max_workers=processes,
+            initializer=initializer,
+            initargs=initargs,
+        )
+        self._executor.bootup(wait=True)
+        self._processes = self._executor.num_workers
+
+    def map(self, func, iterable, chunksize=1):
+        return list(self._executor.map(func, iterable, chunksize=chunksize))
+
+    def imap(self, func, iterable, chunksize=1):
+        return self._executor.map(func, iterable, chunksize=chunksize)
+
+    def starmap(self, func, iterable, chunksize=1):
+        return list(self._executor.starmap(func, iterable, chunksize=chunksize))
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+    def join(self):
+        self._executor.shutdown(wait=True)
+
+    def terminate(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+        self.join()
+
+
+def create_pool(
+    likelihood=None,
+    priors=None,
+    search_parameter_keys=None,
+    use_ratio=None,
+    npool=1,
+    parallel_comms=None,
+):
+    """
+    Create a pool of workers with a global copy of the likelihood, priors,
+    and search keys stored on each worker by
+    :code:`_initialize_global_variables`.
+
+    Parameters
+    ==========
+    likelihood: bilby.core.likelihood.Likelihood, optional
+        The likelihood to store on each worker.
+    priors: bilby.core.prior.PriorDict, optional
+        The priors to store on each worker.
+    search_parameter_keys: list, optional
+        The sampled parameter keys to store on each worker.
+    use_ratio: bool, optional
+        Whether the log-likelihood ratio is being used.
+    npool: int, optional
+        The number of worker processes. For :code:`multiprocessing` no pool is
+        created unless this is greater than one. For :code:`mpi`, :code:`None`
+        uses all available MPI workers.
+    parallel_comms: str, optional
+        The parallelisation backend, either :code:`multiprocessing` or
+        :code:`mpi`. If not given, this is read from the
+        :code:`BILBY_PARALLEL_COMMS` environment variable, defaulting to
+        :code:`multiprocessing`. If :code:`mpi4py` is not installed, a
+        :code:`multiprocessing` pool is used instead.
+
+    Returns
+    =======
+    pool: multiprocessing.Pool, MPIPool, None
+        The pool, or :code:`None` if no pool is required.
+    """
+    if parallel_comms is None:
+        parallel_comms = os.environ.get("BILBY_PARALLEL_COMMS", "multiprocessing")
+    parallel_comms = parallel_comms.lower()
+    if parallel_comms not in ["multiprocessing", "mpi"]:
+        raise ValueError(
+            f"Unknown parallel_comms {parallel_comms}, should be one of "
+            "'multiprocessing' or 'mpi'"
+        )
+    if npool is None or npool > 1:
+        _cache_constraint_normalization(priors, search_parameter_keys)
+    initargs = (likelihood, priors, search_parameter_keys, use_ratio)
+
+    if parallel_comms == "mpi" and (npool is None or npool > 1):
+        try:
+            pool = MPIPool(
+                processes=npool,
+                initializer=_initialize_global_variables,
+                initargs=initargs,
+            )
+            logger.info(f"Setting up MPI pool with {pool._processes} processes")
+            return pool
+        except ImportError:
+            logger.warning(
+                "mpi4py is not installed, falling back to a multiprocessing pool"
+            )
+
+    if npool is not None and npool > 1:
+        logger.info(f"Setting up multiproccesing pool with {npool} processes")
+        import multiprocessing
+
+        return multiprocessing.Pool(
+            processes=npool,
+            initializer=_initialize_global_variables,
+            initargs=initargs,
+        )
+    return None
+
+
+def _cache_constraint_normalization(priors, search_parameter_keys):
+    """
+    Compute the constraint normalization for the search parameters before
+    the priors are sent to the workers so that it is only computed once.
+    """
+    if search_parameter_keys is None or not hasattr(
+        priors, "normalize_constraint_factor"
+    ):
+        return
+    if len(getattr(priors, "constraint_keys", [])) == 0:
+        return
+    priors.normalize_constraint_factor(tuple(search_parameter_keys))
+
+
+def close_pool(pool):
+    """
+    Close and join a pool created by :code:`create_pool`.
+
+    Parameters
+    ==========
+    pool: multiprocessing.Pool, MPIPool, None
+        The pool to close, if :code:`None` this does nothing.
+    """
+    if pool is not None:
+        pool.close()
+        pool.join()
+
+
 def signal_wrapper(method):
     """
     Decorator to wrap a method of a class to set system signals before running
@@ -139,6 +306,12 @@ class Sampler(object):
         from being tested before running the sampler. This is relevant when
         using custom likelihoods that must NOT be initialized on the main thread
         when using multiprocessing, e.g. when using tensorflow in the likelihood.
+    npool: int, optional
+        The number of processes to use in the pool.
+    parallel_comms: str, optional
+        The parallelisation backend used to create the pool, either
+        :code:`multiprocessing` or :code:`mpi`. See
+        :code:`bilby.core.sampler.base_sampler.create_pool`.
     **kwargs: dict
         Additional keyword arguments
 
@@ -221,6 +394,7 @@ class Sampler(object):
         soft_init=False,
         exit_code=130,
         npool=1,
+        parallel_comms=None,
         **kwargs,
     ):
         self.likelihood = likelihood
@@ -234,6 +408,7 @@ class Sampler(object):
         self.meta_data = meta_data
         self.use_ratio = use_ratio
         self._npool = npool
+        self.parallel_comms = parallel_comms
         if not skip_import_verification:
             self._verify_external_sampler()
         self.external_sampler_function = None
@@ -746,22 +921,15 @@ class Sampler(object):
         if self.kwargs.get("pool", None) is not None:
             logger.info("Using user defined pool.")
             self.pool = self.kwargs["pool"]
-        elif self.npool is not None and self.npool > 1:
-            logger.info(f"Setting up multiproccesing pool with {self.npool} processes")
-            import multiprocessing
-
-            self.pool = multiprocessing.Pool(
-                processes=self.npool,
-                initializer=_initialize_global_variables,
-                initargs=(
-                    self.likelihood,
-                    self.priors,
-                    self._search_parameter_keys,
-                    self.use_ratio,
-                ),
-            )
         else:
-            self.pool = None
+            self.pool = create_pool(
+                likelihood=self.likelihood,
+                priors=self.priors,
+                search_parameter_keys=self._search_parameter_keys,
+                use_ratio=self.use_ratio,
+                npool=self.npool,
+                parallel_comms=self.parallel_comms,
+            )
         _initialize_global_variables(
             likelihood=self.likelihood,
             priors=self.priors,
@@ -3,14 +3,16 @@ A collection of functions to convert between parameters describing
 gravitational-wave sources.
 """
 
+import copy
+import hashlib
 import os
 import sys
-import multiprocessing
 import pickle
+from functools import lru_cache
 
 import numpy as np
 from pandas import DataFrame, Series
-from scipy.stats import norm
+from scipy.special import ndtri
 
 from .utils import (lalsim_SimNeutronStarEOS4ParamSDGammaCheck,
                     lalsim_SimNeutronStarEOS4ParameterSpectralDecomposition,
@@ -27,11 +29,11 @@ from .utils import (lalsim_SimNeutronStarEOS4ParamSDGammaCheck,
                     lalsim_SimNeutronStarLoveNumberK2)
 
 from ..core.likelihood import MarginalizedLikelihoodReconstructionError
-from ..core.utils import logger, solar_mass, gravitational_constant, speed_of_light, command_line_args, safe_file_dump
+from ..core.utils import logger, solar_mass, gravitational_constant, speed_of_light, command_line_args
 from ..core.prior import DeltaFunction
 from .utils import lalsim_SimInspiralTransformPrecessingNewInitialConditions
 from .eos.eos import IntegrateTOV
-from .cosmology import get_cosmology, z_at_value
+from .cosmology import get_cosmology, redshift_at_distance
 
 
 def redshift_to_luminosity_distance(redshift, cosmology=None):
@@ -45,19 +47,17 @@ def redshift_to_comoving_distance(redshift, cosmology=None):
 
 
 def luminosity_distance_to_redshift(distance, cosmology=None):
-    from astropy import units
     cosmology = get_cosmology(cosmology)
     if isinstance(distance, Series):
         distance = distance.values
-    return z_at_value(cosmology.luminosity_distance, distance * units.Mpc)
+    return redshift_at_distance(distance, cosmology, "luminosity_distance")
 
 
 def comoving_distance_to_redshift(distance, cosmology=None):
-    from astropy import units
     cosmology = get_cosmology(cosmology)
     if isinstance(distance, Series):
         distance = distance.values
-    return z_at_value(cosmology.comoving_distance, distance * units.Mpc)
+    return redshift_at_distance(distance, cosmology, "comoving_distance")
 
 
 def comoving_distance_to_luminosity_distance(distance, cosmology=None):
@@ -142,7 +142,15 @@ def bilby_to_lalsimulation_spins(
     spin_1x, spin_1y, spin_1z, spin_2x, spin_2y, spin_2z: float
         Cartesian spin components
     """
-    if (a_1 == 0 or tilt_1 in [0, np.pi]) and (a_2 == 0 or tilt_2 in [0, np.pi]):
+    from numbers import Number
+    args = (
+        theta_jn, phi_jl, tilt_1, tilt_2, phi_12, a_1, a_2, mass_1,
+        mass_2, reference_frequency, phase
+    )
+    float_inputs = all([isinstance(arg, Number) for arg in args])
+    if not float_inputs:
+        return transform_precessing_spins(*args)
+    elif (a_1 == 0 or tilt_1 in [0, np.pi]) and (a_2 == 0 or tilt_2 in [0, np.pi]):
         spin_1x = 0
         spin_1y = 0
         spin_1z = a_1 * np.cos(tilt_1)
@@ -151,31 +159,116 @@ def bilby_to_lalsimulation_spins(
         spin_2z = a_2 * np.cos(tilt_2)
         iota = theta_jn
     else:
-        from numbers import Number
-        args = (
-            theta_jn, phi_jl, tilt_1, tilt_2, phi_12, a_1, a_2, mass_1,
-            mass_2, reference_frequency, phase
+        iota, spin_1x, spin_1y, spin_1z, spin_2x, spin_2y, spin_2z = (
+            lalsim_SimInspiralTransformPrecessingNewInitialConditions(*args)
         )
-        float_inputs = all([isinstance(arg, Number) for arg in args])
-        if float_inputs:
-            func = lalsim_SimInspiralTransformPrecessingNewInitialConditions
-        else:
-            func = transform_precessing_spins
-        iota, spin_1x, spin_1y, spin_1z, spin_2x, spin_2y, spin_2z = func(*args)
     return iota, spin_1x, spin_1y, spin_1z, spin_2x, spin_2y, spin_2z
 
 
-@np.vectorize
-def transform_precessing_spins(*args):
+def _rotate_z(angle, vx, vy, vz):
+    cos_angle = np.cos(angle)
+    sin_angle = np.sin(angle)
+    return vx * cos_angle - vy * sin_angle, vx * sin_angle + vy * cos_angle, vz
+
+
+def _rotate_y(angle, vx, vy, vz):
+    cos_angle = np.cos(angle)
+    sin_angle = np.sin(angle)
+    return vx * cos_angle + vz * sin_angle, vy, -vx * sin_angle + vz * cos_angle
+
+
+def transform_precessing_spins(
+    theta_jn, phi_jl, tilt_1, tilt_2, phi_12, a_1, a_2, mass_1, mass_2,
+    reference_frequency, phase
+):
     """
-    Vectorized wrapper for
+    Vectorized implementation of
     lalsimulation.SimInspiralTransformPrecessingNewInitialConditions
 
+    This follows the same sequence of rotations as the lalsimulation
+    function, but operates on arrays of samples with numpy. Samples with
+    aligned spins return the in-plane components as exactly zero, matching
+    :code:`bilby.gw.conversion.bilby_to_lalsimulation_spins`.
+
     For detailed documentation see
     :code:`bilby.gw.conversion.bilby_to_lalsimulation_spins`.
     This will be removed from the public API in a future release.
     """
-    return lalsim_SimInspiralTransformPrecessingNewInitialConditions(*args)
+    (
+        theta_jn, phi_jl, tilt_1, tilt_2, phi_12, a_1, a_2, mass_1, mass_2,
+        reference_frequency, phase
+    ) = np.broadcast_arrays(*[np.asarray(arg, dtype=float) for arg in (
+        theta_jn, phi_jl, tilt_1, tilt_2, phi_12, a_1, a_2, mass_1, mass_2,
+        reference_frequency, phase
+    )])
+    if np.any(reference_frequency <= 0):
+        raise ValueError("reference_frequency must be positive for precessing spin conversion")
+
+    # Start in the frame with the orbital angular momentum along z and the
+    # primary spin in the x-z plane (before the reference phase rotation).
+    ln_hat = (np.zeros_like(theta_jn), np.zeros_like(theta_jn), np.ones_like(theta_jn))
+    s1_hat = (np.sin(tilt_1) * np.cos(phase), np.sin(tilt_1) * np.sin(phase), np.cos(tilt_1))
+    s2_hat = (
+        np.sin(tilt_2) * np.cos(phi_12 + phase),
+        np.sin(tilt_2) * np.sin(phi_12 + phase),
+        np.cos(tilt_2),
+    )
+
+    # Magnitudes in geometric units (seconds), the orbital angular momentum
+    # is computed at 2PN order as in lalsimulation.
+    m1 = mass_1 * gravitational_constant / speed_of_light ** 3
+    m2 = mass_2 * gravitational_constant / speed_of_light ** 3
+    total_mass = m1 + m2
+    eta = m1 * m2 / total_mass ** 2
+    v0 = np.cbrt(total_mass * np.pi * reference_frequency)
+    l_mag = total_mass ** 2 * eta / v0 * (1 + v0 ** 2 * (1.5 + eta / 6))
+
+    s1_mag = m1 ** 2 * a_1
+    s2_mag = m2 ** 2 * a_2
+    j_x = s1_mag * s1_hat[0] + s2_mag * s2_hat[0]
+    j_y = s1_mag * s1_hat[1] + s2_mag * s2_hat[1]
+    j_z = l_mag + s1_mag * s1_hat[2] + s2_mag * s2_hat[2]
+    theta_0 = np.arccos(j_z / np.sqrt(j_x ** 2 + j_y ** 2 + j_z ** 2))
+    phi_0 = np.arctan2(j_y, j_x)
+
+    # Rotate J onto the z axis and then place L at azimuth phi_jl about J.
+    vectors = [ln_hat, s1_hat, s2_hat]
+    vectors = [_rotate_z(-phi_0, *vector) for vector in vectors]
+    vectors = [_rotate_y(-theta_0, *vector) for vector in vectors]
+    ln_hat, s1_hat, s2_hat = [_rotate_z(phi_jl - np.pi, *vector) for vector in vectors]
+
+    line_of_sight = (np.zeros_like(theta_jn), np.sin(theta_jn), np.cos(theta_jn))
+    iota = np.arccos(
+        line_of_sight[1] * ln_hat[1] + line_of_sight[2] * ln_hat[2]
+    )
+
+    # Rotate L back onto the z axis with the line of sight in the y-z plane,
+    # the spins are then given relative to the binary separation.
+    theta_lj = np.arccos(ln_hat[2])
+    phi_l = np.arctan2(ln_hat[1], ln_hat[0])
+    vectors = [s1_hat, s2_hat, line_of_sight]
+    vectors = [_rotate_z(-phi_l, *vector) for vector in vectors]
+    s1_hat, s2_hat, line_of_sight = [_rotate_y(-theta_lj, *vector) for vector in vectors]
+    phi_n = np.arctan2(line_of_sight[1], line_of_sight[0])
+    s1_hat = _rotate_z(np.pi / 2 - phi_n - phase, *s1_hat)
+    s2_hat = _rotate_z(np.pi / 2 - phi_n - phase, *s2_hat)
+
+    spin_1x, spin_1y, spin_1z = [a_1 * component for component in s1_hat]
+    spin_2x, spin_2y, spin_2z = [a_2 * component for component in s2_hat]
+
+    aligned = (
+        ((a_1 == 0) | (tilt_1 == 0) | (tilt_1 == np.pi))
+        & ((a_2 == 0) | (tilt_2 == 0) | (tilt_2 == np.pi))
+    )
+    if np.any(aligned):
+        iota = np.where(aligned, theta_jn, iota)
+        spin_1x, spin_1y, spin_2x, spin_2y = [
+            np.where(aligned, 0, component)
+            for component in (spin_1x, spin_1y, spin_2x, spin_2y)
+        ]
+        spin_1z = np.where(aligned, a_1 * np.cos(tilt_1), spin_1z)
+        spin_2z = np.where(aligned, a_2 * np.cos(tilt_2), spin_2z)
+    return iota, spin_1x, spin_1y, spin_1z, spin_2x, spin_2y, spin_2z
 
 
 def convert_to_lal_binary_black_hole_parameters(parameters):
@@ -378,19 +471,9 @@ def convert_to_lal_binary_neutron_star_parameters(parameters):
             g3pca = converted_parameters['eos_spectral_pca_gamma_3']
             m1s = converted_parameters['mass_1_source']
             m2s = converted_parameters['mass_2_source']
-            all_lambda_1 = np.empty(0)
-            all_lambda_2 = np.empty(0)
-            all_eos_check = np.empty(0, dtype=bool)
-            for (g_0pca, g_1pca, g_2pca, g_3pca, m1_s, m2_s) in zip(g0pca, g1pca, g2pca, g3pca, m1s, m2s):
-                g_0, g_1, g_2, g_3 = spectral_pca_to_spectral(g_0pca, g_1pca, g_2pca, g_3pca)
-                lambda_1, lambda_2, eos_check = \
-                    spectral_params_to_lambda_1_lambda_2(g_0, g_1, g_2, g_3, m1_s, m2_s)
-                all_lambda_1 = np.append(all_lambda_1, lambda_1)
-                all_lambda_2 = np.append(all_lambda_2, lambda_2)
-                all_eos_check = np.append(all_eos_check, eos_check)
-            converted_parameters['lambda_1'] = all_lambda_1
-            converted_parameters['lambda_2'] = all_lambda_2
-            converted_parameters['eos_check'] = all_eos_check
+            g_0, g_1, g_2, g_3 = spectral_pca_to_spectral(g0pca, g1pca, g2pca, g3pca)
+            converted_parameters['lambda_1'], converted_parameters['lambda_2'], converted_parameters['eos_check'] = \
+                spectral_params_to_lambda_1_lambda_2(g_0, g_1, g_2, g_3, m1s, m2s)
             for key in float_eos_params.keys():
                 converted_parameters[key] = float_eos_params[key]
     elif 'eos_polytrope_gamma_0' and 'eos_polytrope_log10_pressure_1' in converted_parameters.keys():
@@ -430,19 +513,9 @@ def convert_to_lal_binary_neutron_star_parameters(parameters):
             logp2 = converted_parameters['eos_polytrope_log10_pressure_2']
             m1s = converted_parameters['mass_1_source']
             m2s = converted_parameters['mass_2_source']
-            all_lambda_1 = np.empty(0)
-            all_lambda_2 = np.empty(0)
-            all_eos_check = np.empty(0, dtype=bool)
-            for (pg_0, pg_1, pg_2, logp_1, logp_2, m1_s, m2_s) in zip(pg0, pg1, pg2, logp1, logp2, m1s, m2s):
-                lambda_1, lambda_2, eos_check = \
-                    polytrope_or_causal_params_to_lambda_1_lambda_2(
-                        pg_0, logp_1, pg_1, logp_2, pg_2, m1_s, m2_s, causal=0)
-                all_lambda_1 = np.append(all_lambda_1, lambda_1)
-                all_lambda_2 = np.append(all_lambda_2, lambda_2)
-                all_eos_check = np.append(all_eos_check, eos_check)
-            converted_parameters['lambda_1'] = all_lambda_1
-            converted_parameters['lambda_2'] = all_lambda_2
-            converted_parameters['eos_check'] = all_eos_check
+            converted_parameters['lambda_1'], converted_parameters['lambda_2'], converted_parameters['eos_check'] = \
+                polytrope_or_causal_params_to_lambda_1_lambda_2(
+                    pg0, logp1, pg1, logp2, pg2, m1s, m2s, causal=0)
             for key in float_eos_params.keys():
                 converted_parameters[key] = float_eos_params[key]
     elif 'eos_polytrope_gamma_0' and 'eos_polytrope_scaled_pressure_ratio' in converted_parameters.keys():
@@ -485,21 +558,10 @@ def convert_to_lal_binary_neutron_star_parameters(parameters):
             scaled_p2 = converted_parameters['eos_polytrope_scaled_pressure_2']
             m1s = converted_parameters['mass_1_source']
             m2s = converted_parameters['mass_2_source']
-            all_lambda_1 = np.empty(0)
-            all_lambda_2 = np.empty(0)
-            all_eos_check = np.empty(0, dtype=bool)
-            for (pg_0, pg_1, pg_2, scaled_ratio, scaled_p_2, m1_s,
-                    m2_s) in zip(pg0, pg1, pg2, scaledratio, scaled_p2, m1s, m2s):
-                logp_1, logp_2 = log_pressure_reparameterization_conversion(scaled_ratio, scaled_p_2)
-                lambda_1, lambda_2, eos_check = \
-                    polytrope_or_causal_params_to_lambda_1_lambda_2(
-                        pg_0, logp_1, pg_1, logp_2, pg_2, m1_s, m2_s, causal=0)
-                all_lambda_1 = np.append(all_lambda_1, lambda_1)
-                all_lambda_2 = np.append(all_lambda_2, lambda_2)
-                all_eos_check = np.append(all_eos_check, eos_check)
-            converted_parameters['lambda_1'] = all_lambda_1
-            converted_parameters['lambda_2'] = all_lambda_2
-            converted_parameters['eos_check'] = all_eos_check
+            logp1, logp2 = log_pressure_reparameterization_conversion(scaledratio, scaled_p2)
+            converted_parameters['lambda_1'], converted_parameters['lambda_2'], converted_parameters['eos_check'] = \
+                polytrope_or_causal_params_to_lambda_1_lambda_2(
+                    pg0, logp1, pg1, logp2, pg2, m1s, m2s, causal=0)
             for key in float_eos_params.keys():
                 converted_parameters[key] = float_eos_params[key]
     elif 'eos_v1' in converted_parameters.keys():
@@ -539,19 +601,9 @@ def convert_to_lal_binary_neutron_star_parameters(parameters):
             logp2 = converted_parameters['eos_log10_pressure2_cgs']
             m1s = converted_parameters['mass_1_source']
             m2s = converted_parameters['mass_2_source']
-            all_lambda_1 = np.empty(0)
-            all_lambda_2 = np.empty(0)
-            all_eos_check = np.empty(0, dtype=bool)
-            for (v_1, v_2, v_3, logp_1, logp_2, m1_s, m2_s) in zip(v1, v2, v3, logp1, logp2, m1s, m2s):
-                lambda_1, lambda_2, eos_check = \
-                    polytrope_or_causal_params_to_lambda_1_lambda_2(
-                        v_1, logp_1, v_2, logp_2, v_3, m1_s, m2_s, causal=1)
-                all_lambda_1 = np.append(all_lambda_1, lambda_1)
-                all_lambda_2 = np.append(all_lambda_2, lambda_2)
-                all_eos_check = np.append(all_eos_check, eos_check)
-            converted_parameters['lambda_1'] = all_lambda_1
-            converted_parameters['lambda_2'] = all_lambda_2
-            converted_parameters['eos_check'] = all_eos_check
+            converted_parameters['lambda_1'], converted_parameters['lambda_2'], converted_parameters['eos_check'] = \
+                polytrope_or_causal_params_to_lambda_1_lambda_2(
+                    v1, logp1, v2, logp2, v3, m1s, m2s, causal=1)
             for key in float_eos_params.keys():
                 converted_parameters[key] = float_eos_params[key]
     elif 'lambda_symmetric' in converted_parameters.keys():
@@ -642,8 +694,9 @@ def spectral_pca_to_spectral(gamma_pca_0, gamma_pca_1, gamma_pca_2, gamma_pca_3)
 
     model_space_mean = np.array([0.89421, 0.33878, -0.07894, 0.00393])
     model_space_standard_deviation = np.array([0.35700, 0.25769, 0.05452, 0.00312])
-    converted_gamma_parameters = \
-        model_space_mean + model_space_standard_deviation * np.dot(transformation_matrix, sampled_pca_gammas)
+    converted_gamma_parameters = (
+        model_space_mean + model_space_standard_deviation * np.dot(transformation_matrix, sampled_pca_gammas).T
+    ).T
 
     return converted_gamma_parameters
 
@@ -653,37 +706,30 @@ def spectral_params_to_lambda_1_lambda_2(gamma_0, gamma_1, gamma_2, gamma_3, mas
     Converts from the 4 spectral decomposition parameters and the source masses
     to the tidal deformability parameters.
 
+    Array inputs are converted in a batch, the equation of state family is
+    built once for each unique set of spectral parameters and recently used
+    families are reused between calls.
+
     Parameters
     ----------
-    gamma_0, gamma_1, gamma_2, gamma_3: float
+    gamma_0, gamma_1, gamma_2, gamma_3: float, array-like
         sampled spectral decomposition parameters
-    mass_1_source, mass_2_source: float
+    mass_1_source, mass_2_source: float, array-like
         sampled component mass parameters converted to source frame in solar masses
 
     Returns
     -------
-    lambda_1, lambda_2: float
+    lambda_1, lambda_2: float, array-like
         component tidal deformability parameters
-    eos_check: bool
+    eos_check: bool, array-like
         whether or not the equation of state is viable /
             if eos_check = False, lambdas are 0 and the sample is rejected.
 
     '''
-    eos_check = True
-    if lalsim_SimNeutronStarEOS4ParamSDGammaCheck(gamma_0, gamma_1, gamma_2, gamma_3) != 0:
-        lambda_1 = 0.0
-        lambda_2 = 0.0
-        eos_check = False
-    else:
-        eos = lalsim_SimNeutronStarEOS4ParameterSpectralDecomposition(gamma_0, gamma_1, gamma_2, gamma_3)
-        if lalsim_SimNeutronStarEOS4ParamSDViableFamilyCheck(gamma_0, gamma_1, gamma_2, gamma_3) != 0:
-            lambda_1 = 0.0
-            lambda_2 = 0.0
-            eos_check = False
-        else:
-            lambda_1, lambda_2, eos_check = neutron_star_family_physical_check(eos, mass_1_source, mass_2_source)
-
-    return lambda_1, lambda_2, eos_check
+    return _eos_params_to_lambda_1_lambda_2(
+        _spectral_neutron_star_family, (gamma_0, gamma_1, gamma_2, gamma_3),
+        mass_1_source, mass_2_source,
+    )
 
 
 def polytrope_or_causal_params_to_lambda_1_lambda_2(
@@ -696,14 +742,18 @@ def polytrope_or_causal_params_to_lambda_1_lambda_2(
     Note that subtracting 1 from the log10 pressure in cgs converts it to
         log10 pressure in si units.
 
+    Array inputs are converted in a batch, the equation of state family is
+    built once for each unique set of equation of state parameters and
+    recently used families are reused between calls.
+
     Parameters
     ----------
-    param1, param2, param3: float
+    param1, param2, param3: float, array-like
         either the sampled adiabatic indices in piecewise polytrope model
         or the sampled causal model params v1, v2, v3
-    log10_pressure1_cgs, log10_pressure2_cgs: float
+    log10_pressure1_cgs, log10_pressure2_cgs: float, array-like
         dividing pressures in piecewise polytrope model or causal model
-    mass_1_source, mass_2_source: float
+    mass_1_source, mass_2_source: float, array-like
         source frame component mass parameters in Msuns
     causal: bool
         whether or not to use causal polytrope model
@@ -711,34 +761,144 @@ def polytrope_or_causal_params_to_lambda_1_lambda_2(
 
     Returns
     -------
-    lambda_1: float
+    lambda_1: float, array-like
         tidal deformability parameter associated with mass 1
-    lambda_2: float
+    lambda_2: float, array-like
         tidal deformability parameter associated with mass 2
-    eos_check: bool
+    eos_check: bool, array-like
         whether eos is valid or not
 
     """
-    eos_check = True
+    return _eos_params_to_lambda_1_lambda_2(
+        _polytrope_or_causal_neutron_star_family,
+        (param1, log10_pressure1_cgs, param2, log10_pressure2_cgs, param3, causal),
+        mass_1_source, mass_2_source,
+    )
+
+
+def _eos_params_to_lambda_1_lambda_2(family_function, eos_parameters, mass_1_source, mass_2_source):
+    """
+    Compute the component tidal deformabilities for a set of equation of
+    state parameters, grouping samples which share an equation of state.
+
+    Parameters
+    ----------
+    family_function: callable
+        Function mapping the equation of state parameters to the output of
+        :code:`_neutron_star_family_properties` or :code:`None` if the
+        equation of state is not viable.
+    eos_parameters: tuple
+        The equation of state parameters, either floats or arrays.
+    mass_1_source, mass_2_source: float, array-like
+        source frame component masses 1 and 2 in solar masses
+
+    Returns
+    -------
+    lambda_1, lambda_2: float, array-like
+        component tidal deformability parameters
+    eos_check: bool, array-like
+        whether or not the equation of state is physically allowed
+    """
+    arrays = np.broadcast_arrays(
+        *[np.asarray(value, dtype=float) for value in eos_parameters + (mass_1_source, mass_2_source)]
+    )
+    if arrays[0].ndim == 0:
+        properties = family_function(*[float(value) for value in eos_parameters])
+        return _lambdas_from_family_properties(properties, mass_1_source, mass_2_source)
+
+    shape = arrays[0].shape
+    eos_parameters = np.column_stack([value.ravel() for value in arrays[:-2]])
+    mass_1_source = arrays[-2].ravel()
+    mass_2_source = arrays[-1].ravel()
+    lambda_1 = np.zeros(len(mass_1_source))
+    lambda_2 = np.zeros(len(mass_1_source))
+    eos_check = np.zeros(len(mass_1_source), dtype=bool)
+    unique_parameters, inverse = np.unique(eos_parameters, axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+    order = np.argsort(inverse, kind="stable")
+    boundaries = np.cumsum(np.bincount(inverse, minlength=len(unique_parameters)))[:-1]
+    for parameters, idxs in zip(unique_parameters, np.split(order, boundaries)):
+        properties = family_function(*parameters)
+        lambda_1[idxs], lambda_2[idxs], eos_check[idxs] = _lambdas_from_family_properties(
+            properties, mass_1_source[idxs], mass_2_source[idxs]
+        )
+    return lambda_1.reshape(shape), lambda_2.reshape(shape), eos_check.reshape(shape)
+
+
+@lru_cache(maxsize=128)
+def _spectral_neutron_star_family(gamma_0, gamma_1, gamma_2, gamma_3):
+    if lalsim_SimNeutronStarEOS4ParamSDGammaCheck(gamma_0, gamma_1, gamma_2, gamma_3) != 0:
+        return None
+    eos = lalsim_SimNeutronStarEOS4ParameterSpectralDecomposition(gamma_0, gamma_1, gamma_2, gamma_3)
+    if lalsim_SimNeutronStarEOS4ParamSDViableFamilyCheck(gamma_0, gamma_1, gamma_2, gamma_3) != 0:
+        return None
+    return _neutron_star_family_properties(eos)
+
+
+@lru_cache(maxsize=128)
+def _polytrope_or_causal_neutron_star_family(
+        param1, log10_pressure1_cgs, param2, log10_pressure2_cgs, param3, causal):
     if log10_pressure1_cgs >= log10_pressure2_cgs:
-        lambda_1 = 0.0
-        lambda_2 = 0.0
-        eos_check = False
+        return None
+    if causal == 0:
+        eos = lalsim_SimNeutronStarEOS3PieceDynamicPolytrope(
+            param1, log10_pressure1_cgs - 1., param2, log10_pressure2_cgs - 1., param3)
     else:
-        if causal == 0:
-            eos = lalsim_SimNeutronStarEOS3PieceDynamicPolytrope(
-                param1, log10_pressure1_cgs - 1., param2, log10_pressure2_cgs - 1., param3)
-        else:
-            eos = lalsim_SimNeutronStarEOS3PieceCausalAnalytic(
-                param1, log10_pressure1_cgs - 1., param2, log10_pressure2_cgs - 1., param3)
-        if lalsim_SimNeutronStarEOS3PDViableFamilyCheck(
-                param1, log10_pressure1_cgs - 1., param2, log10_pressure2_cgs - 1., param3, causal) != 0:
-            lambda_1 = 0.0
-            lambda_2 = 0.0
-            eos_check = False
-        else:
-            lambda_1, lambda_2, eos_check = neutron_star_family_physical_check(eos, mass_1_source, mass_2_source)
+        eos = lalsim_SimNeutronStarEOS3PieceCausalAnalytic(
+            param1, log10_pressure1_cgs - 1., param2, log10_pressure2_cgs - 1., param3)
+    if lalsim_SimNeutronStarEOS3PDViableFamilyCheck(
+            param1, log10_pressure1_cgs - 1., param2, log10_pressure2_cgs - 1., param3, causal) != 0:
+        return None
+    return _neutron_star_family_properties(eos)
+
+
+def _neutron_star_family_properties(eos):
+    """
+    Build the neutron star family for a lalsim eos object along with the
+    mass-independent quantities needed to check if it is physical.
+
+    Returns
+    -------
+    eos, family: lalsim swig-wrapped eos and family objects
+    max_speed_of_sound: float
+        the speed of sound at the maximum pseudo enthalpy
+    min_mass, max_mass: float
+        the range of masses in the family in solar masses
+    """
+    family = lalsim_CreateSimNeutronStarFamily(eos)
+    max_pseudo_enthalpy = lalsim_SimNeutronStarEOSMaxPseudoEnthalpy(eos)
+    max_speed_of_sound = lalsim_SimNeutronStarEOSSpeedOfSoundGeometerized(max_pseudo_enthalpy, eos)
+    min_mass = lalsim_SimNeutronStarFamMinimumMass(family) / solar_mass
+    max_mass = lalsim_SimNeutronStarMaximumMass(family) / solar_mass
+    return eos, family, max_speed_of_sound, min_mass, max_mass
 
+
+def _lambdas_from_family_properties(properties, mass_1_source, mass_2_source):
+    """
+    Performs causal and max/min mass checks given the output of
+    :code:`_neutron_star_family_properties` and calculates the component
+    lambdas for samples which pass. Returns lambda = 0 for the others.
+    """
+    scalar = np.ndim(mass_1_source) == 0 and np.ndim(mass_2_source) == 0
+    mass_1_source, mass_2_source = np.broadcast_arrays(
+        np.atleast_1d(mass_1_source).astype(float), np.atleast_1d(mass_2_source).astype(float)
+    )
+    lambda_1 = np.zeros(mass_1_source.shape)
+    lambda_2 = np.zeros(mass_1_source.shape)
+    if properties is None:
+        eos_check = np.zeros(mass_1_source.shape, dtype=bool)
+    else:
+        _, family, max_speed_of_sound, min_mass, max_mass = properties
+        eos_check = (
+            (max_speed_of_sound <= 1.1)
+            & (min_mass <= mass_1_source) & (mass_1_source <= max_mass)
+            & (min_mass <= mass_2_source) & (mass_2_source <= max_mass)
+        )
+        if np.any(eos_check):
+            lambda_1[eos_check] = lambda_from_mass_and_family(mass_1_source[eos_check], family)
+            lambda_2[eos_check] = lambda_from_mass_and_family(mass_2_source[eos_check], family)
+    if scalar:
+        return float(lambda_1[0]), float(lambda_2[0]), bool(eos_check[0])
     return lambda_1, lambda_2, eos_check
 
 
@@ -752,32 +912,20 @@ def neutron_star_family_physical_check(eos, mass_1_source, mass_2_source):
     ----------
     eos: lalsim swig-wrapped eos object
         the neutron star equation of state
-    mass_1_source, mass_2_source: float
+    mass_1_source, mass_2_source: float, array-like
         source frame component masses 1 and 2 in solar masses
 
     Returns
     -------
-    lambda_1, lambda_2: float
+    lambda_1, lambda_2: float, array-like
         component tidal deformability parameters
-    eos_check: bool
+    eos_check: bool, array-like
         whether or not the equation of state is physically allowed
 
     """
-    eos_check = True
-    family = lalsim_CreateSimNeutronStarFamily(eos)
-    max_pseudo_enthalpy = lalsim_SimNeutronStarEOSMaxPseudoEnthalpy(eos)
-    max_speed_of_sound = lalsim_SimNeutronStarEOSSpeedOfSoundGeometerized(max_pseudo_enthalpy, eos)
-    min_mass = lalsim_SimNeutronStarFamMinimumMass(family) / solar_mass
-    max_mass = lalsim_SimNeutronStarMaximumMass(family) / solar_mass
-    if max_speed_of_sound <= 1.1 and min_mass <= mass_1_source <= max_mass and min_mass <= mass_2_source <= max_mass:
-        lambda_1 = lambda_from_mass_and_family(mass_1_source, family)
-        lambda_2 = lambda_from_mass_and_family(mass_2_source, family)
-    else:
-        lambda_1 = 0.0
-        lambda_2 = 0.0
-        eos_check = False
-
-    return lambda_1, lambda_2, eos_check
+    return _lambdas_from_family_properties(
+        _neutron_star_family_properties(eos), mass_1_source, mass_2_source
+    )
 
 
 def lambda_from_mass_and_family(mass_i, family):
@@ -789,21 +937,25 @@ def lambda_from_mass_and_family(mass_i, family):
     ----------
     family: lalsim family object
         EOS family of type lalsimulation.SimNeutronStarFamily.
-    mass_i: Component mass of neutron star in solar masses.
+    mass_i: float, array-like
+        Component mass(es) of neutron star in solar masses.
 
     Returns
     -------
-    lambda_1: float
+    lambda_1: float, array-like
         component tidal deformability parameter
 
     """
-    radius = lalsim_SimNeutronStarRadius(mass_i * solar_mass, family)
-    love_number_k2 = lalsim_SimNeutronStarLoveNumberK2(mass_i * solar_mass, family)
-    mass_geometrized = mass_i * solar_mass * gravitational_constant / speed_of_light ** 2.
+    mass_si = np.asarray(mass_i, dtype=float) * solar_mass
+    radius = np.array([lalsim_SimNeutronStarRadius(mass, family) for mass in mass_si.ravel()])
+    love_number_k2 = np.array([lalsim_SimNeutronStarLoveNumberK2(mass, family) for mass in mass_si.ravel()])
+    mass_geometrized = mass_si.ravel() * gravitational_constant / speed_of_light ** 2.
     compactness = mass_geometrized / radius
     lambda_i = (2. / 3.) * love_number_k2 / compactness ** 5.
 
-    return lambda_i
+    if mass_si.ndim == 0:
+        return float(lambda_i[0])
+    return lambda_i.reshape(mass_si.shape)
 
 
 def eos_family_physical_check(eos):
@@ -823,25 +975,11 @@ def eos_family_physical_check(eos):
     logedat = np.linspace(loge_min, loge_central, num=eos.npts)
     edat = np.exp(logedat)
 
-    # Generate m, r, and k2 lists
-    mdat = []
-    rdat = []
-    k2dat = []
-    for i in range(8):
-        tov_solver = IntegrateTOV(eos, edat[i])
-        m, r, k2 = tov_solver.integrate_TOV()
-        mdat.append(m)
-        rdat.append(r)
-        k2dat.append(k2)
-
-        # Check if maximum mass has been found
-        if i > 0 and mdat[i] <= mdat[i - 1]:
-            break
-
-    if len(mdat) < 8:
-        return False
-    else:
-        return True
+    # Generate the masses for the first 8 central energy densities, the family
+    # is invalid if the maximum mass is reached before the last of these
+    mdat, _, _ = IntegrateTOV(eos, edat[:8]).integrate_TOV()
+
+    return not np.any(np.diff(mdat[:7]) <= 0)
 
 
 def total_mass_and_mass_ratio_to_component_masses(mass_ratio, total_mass):
@@ -1375,6 +1513,16 @@ def lambda_symmetric_lambda_antisymmetric_to_lambda_1_lambda_2(lambda_symmetric,
     return lambda_1, lambda_2
 
 
+# b_ij and c_ij coefficients of the BinaryLove fit, given in Table I of CHZ
+# (https://arxiv.org/abs/1804.03221), stored as [i - 1, j - 1]
+_BINARY_LOVE_B = np.array([[-27.7408, 8.42358], [122.686, -19.7551], [-175.496, 133.708]])
+_BINARY_LOVE_C = np.array([[-25.5593, 5.58527], [92.0337, 26.8586], [-70.247, -56.3076]])
+
+# mu_i and sigma_i coefficients for the uncertainty in the fit, given in Table II of CHZ
+_BINARY_LOVE_MU = (137.1252739, -32.8026613, 0.5168637, -11.2765281, 14.9499544, -4.6638851)
+_BINARY_LOVE_SIGMA = (-0.0000739, 0.0103778, 0.4581717, -0.8341913, -201.4323962, 273.9268276, -71.2342246)
+
+
 def binary_love_fit_lambda_symmetric_mass_ratio_to_lambda_antisymmetric(lambda_symmetric, mass_ratio):
 
     """
@@ -1404,8 +1552,8 @@ def binary_love_fit_lambda_symmetric_mass_ratio_to_lambda_antisymmetric(lambda_s
         Antisymmetric tidal parameter.
     """
     lambda_symmetric_m1o5 = np.power(lambda_symmetric, -1. / 5.)
-    lambda_symmetric_m2o5 = lambda_symmetric_m1o5 * lambda_symmetric_m1o5
-    lambda_symmetric_m3o5 = lambda_symmetric_m2o5 * lambda_symmetric_m1o5
+    lambda_symmetric_powers = np.stack(
+        [lambda_symmetric_m1o5, lambda_symmetric_m1o5 ** 2, lambda_symmetric_m1o5 ** 3], axis=-1)
 
     q = mass_ratio
     q2 = np.square(mass_ratio)
@@ -1416,34 +1564,14 @@ def binary_love_fit_lambda_symmetric_mass_ratio_to_lambda_antisymmetric(lambda_s
     q_for_Fnofq = np.power(q, 10. / (3. - n_polytropic))
     Fnofq = (1. - q_for_Fnofq) / (1. + q_for_Fnofq)
 
-    # b_ij and c_ij coefficients are given in Table I of CHZ
-
-    b11 = -27.7408
-    b12 = 8.42358
-    b21 = 122.686
-    b22 = -19.7551
-    b31 = -175.496
-    b32 = 133.708
-
-    c11 = -25.5593
-    c12 = 5.58527
-    c21 = 92.0337
-    c22 = 26.8586
-    c31 = -70.247
-    c32 = -56.3076
-
     # Eqn 1 from CHZ, giving the lambda_antisymmetric_fitOnly
     # not yet accounting for the uncertainty in the fit
+    # numerator = 1 + sum_ij b_ij q^j lambda_symmetric^(-i/5), similarly for the denominator
 
-    numerator = 1.0 + \
-        (b11 * q * lambda_symmetric_m1o5) + (b12 * q2 * lambda_symmetric_m1o5) + \
-        (b21 * q * lambda_symmetric_m2o5) + (b22 * q2 * lambda_symmetric_m2o5) + \
-        (b31 * q * lambda_symmetric_m3o5) + (b32 * q2 * lambda_symmetric_m3o5)
-
-    denominator = 1.0 + \
-        (c11 * q * lambda_symmetric_m1o5) + (c12 * q2 * lambda_symmetric_m1o5) + \
-        (c21 * q * lambda_symmetric_m2o5) + (c22 * q2 * lambda_symmetric_m2o5) + \
-        (c31 * q * lambda_symmetric_m3o5) + (c32 * q2 * lambda_symmetric_m3o5)
+    numerator_terms = lambda_symmetric_powers @ _BINARY_LOVE_B
+    denominator_terms = lambda_symmetric_powers @ _BINARY_LOVE_C
+    numerator = 1.0 + q * numerator_terms[..., 0] + q2 * numerator_terms[..., 1]
+    denominator = 1.0 + q * denominator_terms[..., 0] + q2 * denominator_terms[..., 1]
 
     lambda_antisymmetric_fitOnly = Fnofq * lambda_symmetric * numerator / denominator
 
@@ -1488,22 +1616,8 @@ def binary_love_lambda_symmetric_to_lambda_1_lambda_2_manual_marginalisation(bin
     q = mass_ratio
     q2 = np.square(mass_ratio)
 
-    # mu_i and sigma_i coefficients are given in Table II of CHZ
-
-    mu_1 = 137.1252739
-    mu_2 = -32.8026613
-    mu_3 = 0.5168637
-    mu_4 = -11.2765281
-    mu_5 = 14.9499544
-    mu_6 = - 4.6638851
-
-    sigma_1 = -0.0000739
-    sigma_2 = 0.0103778
-    sigma_3 = 0.4581717
-    sigma_4 = -0.8341913
-    sigma_5 = -201.4323962
-    sigma_6 = 273.9268276
-    sigma_7 = -71.2342246
+    mu_1, mu_2, mu_3, mu_4, mu_5, mu_6 = _BINARY_LOVE_MU
+    sigma_1, sigma_2, sigma_3, sigma_4, sigma_5, sigma_6, sigma_7 = _BINARY_LOVE_SIGMA
 
     # Eqn 6 from CHZ, correction on fit for lambdaA caused by
     # uncertainty in the mean of the lambdaS residual fit,
@@ -1555,8 +1669,7 @@ def binary_love_lambda_symmetric_to_lambda_1_lambda_2_manual_marginalisation(bin
     # this is done by sampling a percent point function  (inverse cdf)
     # through a U{0,1} variable called binary_love_uniform
 
-    lambda_antisymmetric_scatter = norm.ppf(binary_love_uniform, loc=0.,
-                                            scale=lambda_antisymmetric_stdCorr)
+    lambda_antisymmetric_scatter = ndtri(binary_love_uniform) * lambda_antisymmetric_stdCorr
 
     # Add the correction of the residual mean
     # and the Gaussian scatter to the lambda_antisymmetric_fitOnly value
@@ -1621,7 +1734,7 @@ def binary_love_lambda_symmetric_to_lambda_1_lambda_2_automatic_marginalisation(
     """
     from ..core.utils.random import rng
 
-    binary_love_uniform = rng.uniform(0, 1, len(lambda_symmetric))
+    binary_love_uniform = rng.uniform(0, 1, np.shape(lambda_symmetric))
 
     lambda_1, lambda_2 = binary_love_lambda_symmetric_to_lambda_1_lambda_2_manual_marginalisation(
         binary_love_uniform, lambda_symmetric, mass_ratio)
@@ -1645,21 +1758,34 @@ def _generate_all_cbc_parameters(sample, defaults, base_conversion,
 
     output_sample = fill_from_fixed_priors(output_sample, priors)
     output_sample, _ = base_conversion(output_sample)
+    snrs_computed = False
     if likelihood is not None:
-        compute_per_detector_log_likelihoods(
-            samples=output_sample, likelihood=likelihood, npool=npool)
-
         marginalized_parameters = getattr(likelihood, "_marginalized_parameters", list())
-        if len(marginalized_parameters) > 0:
-            try:
-                generate_posterior_samples_from_marginalized_likelihood(
+        update_sky_frame = (
+            not getattr(likelihood, "reference_frame", "sky") == "sky"
+            or not getattr(likelihood, "time_reference", "geocenter") == "geocenter"
+        )
+        try:
+            if isinstance(output_sample, DataFrame):
+                _compute_likelihood_derived_parameters(
+                    samples=output_sample, likelihood=likelihood, npool=npool,
+                    update_sky_frame=update_sky_frame)
+                snrs_computed = True
+            else:
+                compute_per_detector_log_likelihoods(
+                    samples=output_sample, likelihood=likelihood, npool=npool)
+                if len(marginalized_parameters) > 0:
+                    generate_posterior_samples_from_marginalized_likelihood(
+                        samples=output_sample, likelihood=likelihood, npool=npool)
+        except MarginalizedLikelihoodReconstructionError as e:
+            logger.warning(
+                "Marginalised parameter reconstruction failed with message "
+                "{}. Some parameters may not have the intended "
+                "interpretation.".format(e)
+            )
+            if isinstance(output_sample, DataFrame):
+                compute_per_detector_log_likelihoods(
                     samples=output_sample, likelihood=likelihood, npool=npool)
-            except MarginalizedLikelihoodReconstructionError as e:
-                logger.warning(
-                    "Marginalised parameter reconstruction failed with message "
-                    "{}. Some parameters may not have the intended "
-                    "interpretation.".format(e)
-                )
         if priors is not None:
             misnamed_marginalizations = dict(
                 luminosity_distance="distance",
@@ -1674,10 +1800,7 @@ def _generate_all_cbc_parameters(sample, defaults, base_conversion,
                 ):
                     priors[par] = likelihood.priors[par]
 
-        if (
-            not getattr(likelihood, "reference_frame", "sky") == "sky"
-            or not getattr(likelihood, "time_reference", "geocenter") == "geocenter"
-        ):
+        if update_sky_frame:
             try:
                 generate_sky_frame_parameters(
                     samples=output_sample, likelihood=likelihood
@@ -1687,7 +1810,7 @@ def _generate_all_cbc_parameters(sample, defaults, base_conversion,
                     "Failed to generate sky frame parameters for type {}"
                     .format(type(output_sample))
                 )
-    if likelihood is not None:
+    if likelihood is not None and not snrs_computed:
         compute_snrs(output_sample, likelihood, npool=npool)
     for key, func in zip(["mass", "spin", "source frame"], [
             generate_mass_parameters, generate_spin_parameters,
@@ -2098,7 +2221,9 @@ def generate_component_spins(sample):
     """
     Add the component spins to the data frame/dictionary.
 
-    This function uses a lalsimulation function to transform the spins.
+    This function uses a lalsimulation function to transform the spins for
+    single samples and a vectorized numpy implementation of the same
+    transformation for arrays of samples.
 
     Parameters
     ==========
@@ -2121,7 +2246,7 @@ def generate_component_spins(sample):
             output_sample['spin_1y'], output_sample['spin_1z'],
             output_sample['spin_2x'], output_sample['spin_2y'],
             output_sample['spin_2z']
-        ) = np.vectorize(bilby_to_lalsimulation_spins)(
+        ) = bilby_to_lalsimulation_spins(
             output_sample['theta_jn'], output_sample['phi_jl'],
             output_sample['tilt_1'], output_sample['tilt_2'],
             output_sample['phi_12'], output_sample['a_1'], output_sample['a_2'],
@@ -2235,22 +2360,18 @@ def compute_snrs(sample, likelihood, npool=1):
             logger.info('Computing SNRs for every sample.')
 
             fill_args = [(ii, row) for ii, row in sample.iterrows()]
-            if npool > 1:
-                from ..core.sampler.base_sampler import _initialize_global_variables
-                pool = multiprocessing.Pool(
-                    processes=npool,
-                    initializer=_initialize_global_variables,
-                    initargs=(likelihood, None, None, False),
-                )
+            from ..core.sampler.base_sampler import (
+                _initialize_global_variables, close_pool, create_pool
+            )
+            pool = create_pool(likelihood=likelihood, use_ratio=False, npool=npool)
+            if pool is not None:
                 logger.info(
                     "Using a pool with size {} for nsamples={}".format(npool, len(sample))
                 )
                 new_samples = pool.map(_compute_snrs, tqdm(fill_args, file=sys.stdout))
-                pool.close()
-                pool.join()
+                close_pool(pool)
             else:
-                from ..core.sampler.base_sampler import _sampling_convenience_dump
-                _sampling_convenience_dump.likelihood = likelihood
+                _initialize_global_variables(likelihood, None, None, False)
                 new_samples = [_compute_snrs(xx) for xx in tqdm(fill_args, file=sys.stdout)]
 
             for ii, ifo in enumerate(likelihood.interferometers):
@@ -2317,62 +2438,30 @@ def compute_per_detector_log_likelihoods(samples, likelihood, npool=1, block=10)
 
         elif not isinstance(samples, DataFrame):
             raise ValueError("Unable to handle input samples of type {}".format(type(samples)))
-        from tqdm.auto import tqdm
 
         logger.info('Computing per-detector log likelihoods.')
 
-        # Initialize cache dict
-        cached_samples_dict = dict()
-
-        # Store samples to convert for checking
-        cached_samples_dict["_samples"] = samples
-
         # Set up the multiprocessing
-        if npool > 1:
-            from ..core.sampler.base_sampler import _initialize_global_variables
-            pool = multiprocessing.Pool(
-                processes=npool,
-                initializer=_initialize_global_variables,
-                initargs=(likelihood, None, None, False),
-            )
+        from ..core.sampler.base_sampler import (
+            _initialize_global_variables, close_pool, create_pool
+        )
+        pool = create_pool(likelihood=likelihood, use_ratio=False, npool=npool)
+        if pool is not None:
             logger.info(
                 "Using a pool with size {} for nsamples={}"
                 .format(npool, len(samples))
             )
         else:
-            from ..core.sampler.base_sampler import _sampling_convenience_dump
-            _sampling_convenience_dump.likelihood = likelihood
-            pool = None
+            _initialize_global_variables(likelihood, None, None, False)
 
         fill_args = [(ii, row) for ii, row in samples.iterrows()]
-        ii = 0
-        pbar = tqdm(total=len(samples), file=sys.stdout)
-        while ii < len(samples):
-            if ii in cached_samples_dict:
-                ii += block
-                pbar.update(block)
-                continue
-
-            if pool is not None:
-                subset_samples = pool.map(_compute_per_detector_log_likelihoods,
-                                          fill_args[ii: ii + block])
-            else:
-                subset_samples = [list(_compute_per_detector_log_likelihoods(xx))
-                                  for xx in fill_args[ii: ii + block]]
-
-            cached_samples_dict[ii] = subset_samples
-
-            ii += block
-            pbar.update(len(subset_samples))
-        pbar.close()
+        new_samples = _map_in_blocks(
+            _compute_per_detector_log_likelihoods, fill_args, dict(), pool, block, None
+        )
 
-        if pool is not None:
-            pool.close()
-            pool.join()
+        close_pool(pool)
 
-        new_samples = np.concatenate(
-            [np.array(val) for key, val in cached_samples_dict.items() if key != "_samples"]
-        )
+        new_samples = np.array(new_samples)
 
         for ii, key in \
                 enumerate([f'{ifo.name}_log_likelihood' for ifo in likelihood.interferometers]):
@@ -2434,98 +2523,341 @@ def generate_posterior_samples_from_marginalized_likelihood(
         return samples
     elif not isinstance(samples, DataFrame):
         raise ValueError("Unable to handle input samples of type {}".format(type(samples)))
-    from tqdm.auto import tqdm
 
     logger.info('Reconstructing marginalised parameters.')
 
+    cache_filename = _conversion_cache_filename(likelihood, "generate_posterior", use_cache)
+    cached_blocks, journal = _read_conversion_cache(samples, cache_filename)
+
+    # Set up the multiprocessing
+    from ..core.sampler.base_sampler import (
+        _initialize_global_variables, close_pool, create_pool
+    )
+    pool = create_pool(likelihood=likelihood, use_ratio=False, npool=npool)
+    if pool is not None:
+        logger.info(
+            "Using a pool with size {} for nsamples={}"
+            .format(npool, len(samples))
+        )
+    else:
+        _initialize_global_variables(likelihood, None, None, False)
+
+    # the workers reconstruct batches of samples from each block at once
+    if pool is not None:
+        batch_size = -(-block // (npool or 1))
+    else:
+        batch_size = block
+    seeds = generate_seeds(len(samples))
+    fill_args = [(ii, row, seed) for (ii, row), seed in zip(samples.iterrows(), seeds)]
+    new_samples = _map_in_blocks(
+        fill_samples, fill_args, cached_blocks, pool, block, journal,
+        batch_size=batch_size,
+    )
+
+    close_pool(pool)
+
+    new_samples = np.array(new_samples)
+
+    for ii, key in enumerate(marginalized_parameters):
+        samples[key] = new_samples[:, ii]
+
+    return samples
+
+
+def _conversion_cache_filename(likelihood, name, use_cache=True):
+    """The name of the file to cache post-processing results in, if any"""
+    if not use_cache:
+        return None
     try:
-        cache_filename = f"{likelihood.outdir}/.{likelihood.label}_generate_posterior_cache.pickle"
+        return f"{likelihood.outdir}/.{likelihood.label}_{name}_cache.pickle"
     except AttributeError:
         logger.warning("Likelihood has no outdir and label attribute: caching disabled")
-        use_cache = False
+        return None
 
-    if use_cache and os.path.exists(cache_filename) and not command_line_args.clean:
+
+def _samples_hash(samples):
+    """A hash identifying the values, index and columns of a DataFrame"""
+    from pandas.util import hash_pandas_object
+
+    samples_hash = hashlib.sha256()
+    samples_hash.update(repr(list(samples.columns)).encode())
+    samples_hash.update(hash_pandas_object(samples, index=True).values.tobytes())
+    return samples_hash.hexdigest()
+
+
+def _read_conversion_cache(samples, cache_filename):
+    """
+    Read the blocks of post-processed samples cached for these samples
+
+    The cache is a journal of pickled records: a header identifying the
+    samples by their hash followed by one :code:`(index, block)` record for
+    each completed block, so that each new block is appended without
+    rewriting the file. Incomplete records at the end of the file, e.g.,
+    from a job being killed while writing, are ignored. If the cache
+    belongs to different samples it is ignored. The file is not modified
+    here, see :code:`_append_conversion_cache`.
+
+    Parameters
+    ==========
+    samples: DataFrame
+        The samples being post-processed.
+    cache_filename: str, None
+        The cache file, if :code:`None` nothing is cached.
+
+    Returns
+    =======
+    cached_blocks: dict
+        The cached blocks keyed by the index of their first sample.
+    journal: dict, None
+        The state of the cache file passed to :code:`_append_conversion_cache`,
+        :code:`None` if nothing is cached.
+    """
+    cached_blocks = dict()
+    if cache_filename is None:
+        return cached_blocks, None
+    header = dict(samples_hash=_samples_hash(samples), nsamples=len(samples))
+    journal = dict(filename=cache_filename, header=header, valid_length=0)
+    if os.path.exists(cache_filename) and not command_line_args.clean:
+        valid_length = 0
         try:
             with open(cache_filename, "rb") as f:
-                cached_samples_dict = pickle.load(f)
+                cached_header = pickle.load(f)
+                if cached_header == header:
+                    valid_length = f.tell()
+                    while True:
+                        ii, subset_samples = pickle.load(f)
+                        cached_blocks[ii] = subset_samples
+                        valid_length = f.tell()
         except EOFError:
-            logger.warning("Cache file is empty")
-            cached_samples_dict = None
-
-        # Check the samples are identical between the cache and current
-        if (cached_samples_dict is not None) and (cached_samples_dict["_samples"].equals(samples)):
-            # Calculate reconstruction percentage and print a log message
-            nsamples_converted = np.sum(
-                [len(val) for key, val in cached_samples_dict.items() if key != "_samples"]
-            )
-            perc = 100 * nsamples_converted / len(cached_samples_dict["_samples"])
+            pass
+        except Exception as e:
+            logger.debug("Stopped reading cache {}: {}".format(cache_filename, e))
+        if valid_length > 0:
+            journal["valid_length"] = valid_length
+            nsamples_converted = sum(len(val) for val in cached_blocks.values())
+            perc = 100 * nsamples_converted / len(samples)
             logger.info(f'Using cached reconstruction with {perc:0.1f}% converted.')
         else:
             logger.info("Cached samples dict out of date, ignoring")
-            cached_samples_dict = dict(_samples=samples)
+    return cached_blocks, journal
 
-    else:
-        # Initialize cache dict
-        cached_samples_dict = dict()
 
-        # Store samples to convert for checking
-        cached_samples_dict["_samples"] = samples
+def _append_conversion_cache(journal, ii, subset_samples):
+    """
+    Append a completed block starting at sample ii to the cache
 
-    # Set up the multiprocessing
-    if npool > 1:
-        from ..core.sampler.base_sampler import _initialize_global_variables
-        pool = multiprocessing.Pool(
-            processes=npool,
-            initializer=_initialize_global_variables,
-            initargs=(likelihood, None, None, False),
-        )
-        logger.info(
-            "Using a pool with size {} for nsamples={}"
-            .format(npool, len(samples))
-        )
-    else:
-        from ..core.sampler.base_sampler import _sampling_convenience_dump
-        _sampling_convenience_dump.likelihood = likelihood
-        pool = None
+    The first write starts a new cache file if there was no valid cache, or
+    drops any partially written record from the end of the existing file.
+    If the file cannot be repaired, nothing more is cached.
+    """
+    if journal is None or journal["filename"] is None:
+        return
+    cache_filename = journal["filename"]
+    valid_length = journal["valid_length"]
+    try:
+        if valid_length == 0:
+            with open(cache_filename, "wb") as f:
+                pickle.dump(journal["header"], f)
+        elif valid_length is not None and os.path.getsize(cache_filename) > valid_length:
+            os.truncate(cache_filename, valid_length)
+    except OSError as e:
+        logger.warning("Unable to repair cache {}, not caching: {}".format(cache_filename, e))
+        journal["filename"] = None
+        return
+    journal["valid_length"] = None
+    try:
+        with open(cache_filename, "ab") as f:
+            pickle.dump((ii, subset_samples), f)
+    except OSError as e:
+        logger.warning("Unable to write cache {}: {}".format(cache_filename, e))
 
-    seeds = generate_seeds(len(samples))
-    fill_args = [(ii, row, seed) for (ii, row), seed in zip(samples.iterrows(), seeds)]
+
+def _map_in_blocks(func, fill_args, cached_blocks, pool, block, journal, batch_size=None):
+    """
+    Apply func to each of fill_args in blocks of size block, skipping the
+    samples in cached_blocks and appending each new block to the cache
+    journal (if given, see :code:`_read_conversion_cache`).
+
+    If batch_size is given, func is applied to lists of up to batch_size
+    consecutive elements of fill_args and returns a list of outputs.
+
+    Returns
+    =======
+    list: the output for each element of fill_args
+    """
+    from tqdm.auto import tqdm
+
+    cached_starts = sorted(cached_blocks)
     ii = 0
-    pbar = tqdm(total=len(samples), file=sys.stdout)
-    while ii < len(samples):
-        if ii in cached_samples_dict:
-            ii += block
-            pbar.update(block)
+    pbar = tqdm(total=len(fill_args), file=sys.stdout)
+    while ii < len(fill_args):
+        if ii in cached_blocks:
+            pbar.update(len(cached_blocks[ii]))
+            ii += len(cached_blocks[ii])
             continue
 
-        if pool is not None:
-            subset_samples = pool.map(fill_sample, fill_args[ii: ii + block])
+        end = min([ii + block] + [start for start in cached_starts if start > ii])
+        if batch_size is not None:
+            batches = [
+                fill_args[jj: min(jj + batch_size, end)]
+                for jj in range(ii, end, batch_size)
+            ]
+            if pool is not None:
+                batches = pool.map(func, batches)
+            else:
+                batches = [func(xx) for xx in batches]
+            subset_samples = [list(xx) for batch in batches for xx in batch]
+        elif pool is not None:
+            subset_samples = pool.map(func, fill_args[ii: end])
         else:
-            subset_samples = [list(fill_sample(xx)) for xx in fill_args[ii: ii + block]]
+            subset_samples = [list(func(xx)) for xx in fill_args[ii: end]]
 
-        cached_samples_dict[ii] = subset_samples
+        cached_blocks[ii] = subset_samples
 
-        if use_cache:
-            safe_file_dump(cached_samples_dict, cache_filename, "pickle")
+        _append_conversion_cache(journal, ii, subset_samples)
 
-        ii += block
+        ii = end
         pbar.update(len(subset_samples))
     pbar.close()
 
+    return [
+        new_sample
+        for key in sorted(cached_blocks)
+        for new_sample in cached_blocks[key]
+    ]
+
+
+def _compute_likelihood_derived_parameters(
+        samples, likelihood, npool=1, block=10, use_cache=True, update_sky_frame=False):
+    """
+    Compute the per-detector log likelihoods, reconstruct the marginalized
+    parameters and compute the SNRs for a set of posterior samples.
+
+    This is equivalent to calling :code:`compute_per_detector_log_likelihoods`,
+    :code:`generate_posterior_samples_from_marginalized_likelihood` and
+    :code:`compute_snrs` in turn, but uses a single pool and the waveform for
+    each sample is generated once and reused for all three. When the phase is
+    marginalized the waveform is regenerated with the reconstructed phase for
+    the SNRs.
+
+    Parameters
+    ==========
+    samples: DataFrame
+        Posterior from run with a marginalised likelihood, updated in place.
+    likelihood: bilby.gw.likelihood.GravitationalWaveTransient
+        Likelihood used during sampling.
+    npool: int, (default=1)
+        If given, perform generation (where possible) using a multiprocessing pool
+    block: int, (default=10)
+        Size of the blocks to use in multiprocessing
+    use_cache: bool, (default=True)
+        If true, cache the generation so that reconstuction can begin from the
+        cache on restart.
+    update_sky_frame: bool, (default=False)
+        Whether to convert to the sky frame parameters before computing the
+        SNRs, see :code:`generate_sky_frame_parameters`.
+
+    Returns
+    =======
+    sample: DataFrame
+        Returns the posterior with new samples.
+    """
+    from ..core.utils.random import generate_seeds
+
+    keys = list()
+    if callable(likelihood.compute_per_detector_log_likelihood):
+        keys += [f'{ifo.name}_log_likelihood' for ifo in likelihood.interferometers]
+    else:
+        logger.debug('Not computing per-detector log likelihoods.')
+    marginalized_parameters = getattr(likelihood, "_marginalized_parameters", list())
+    keys += marginalized_parameters
+    for ifo in likelihood.interferometers:
+        keys += [f'{ifo.name}_matched_filter_snr', f'{ifo.name}_optimal_snr']
+
+    logger.info(
+        'Computing per-detector log likelihoods, marginalised parameters and SNRs.'
+    )
+
+    cache_filename = _conversion_cache_filename(likelihood, "generate_all_parameters", use_cache)
+    cached_blocks, journal = _read_conversion_cache(samples, cache_filename)
+
+    from ..core.sampler.base_sampler import (
+        _initialize_global_variables, close_pool, create_pool
+    )
+    pool = create_pool(likelihood=likelihood, use_ratio=False, npool=npool)
     if pool is not None:
-        pool.close()
-        pool.join()
+        logger.info(
+            "Using a pool with size {} for nsamples={}"
+            .format(npool, len(samples))
+        )
+    else:
+        _initialize_global_variables(likelihood, None, None, False)
 
-    new_samples = np.concatenate(
-        [np.array(val) for key, val in cached_samples_dict.items() if key != "_samples"]
+    seeds = generate_seeds(len(samples))
+    fill_args = [
+        (ii, row, seed, update_sky_frame)
+        for (ii, row), seed in zip(samples.iterrows(), seeds)
+    ]
+    new_samples = _map_in_blocks(
+        _fill_likelihood_derived_parameters, fill_args, cached_blocks,
+        pool, block, journal
     )
 
-    for ii, key in enumerate(marginalized_parameters):
-        samples[key] = new_samples[:, ii]
+    close_pool(pool)
+
+    for key, values in zip(keys, zip(*new_samples)):
+        samples[key] = np.array(values)
 
     return samples
 
 
+def _fill_likelihood_derived_parameters(args):
+    """
+    A wrapper of computing the per-detector log likelihoods, marginalized
+    parameters and SNRs from a single waveform to enable multiprocessing
+    """
+    from ..core.sampler.base_sampler import _sampling_convenience_dump
+    from ..core.utils.random import seed
+
+    ii, sample, rseed, update_sky_frame = args
+    seed(rseed)
+    likelihood = _sampling_convenience_dump.likelihood
+    likelihood.parameters.update(dict(sample).copy())
+    signal_polarizations = likelihood.waveform_generator.frequency_domain_strain(
+        likelihood.parameters
+    )
+
+    new_values = list()
+    if callable(likelihood.compute_per_detector_log_likelihood):
+        new_sample = likelihood.compute_per_detector_log_likelihood(
+            waveform_polarizations=signal_polarizations
+        )
+        new_values += [
+            new_sample[f'{ifo.name}_log_likelihood'] for ifo in likelihood.interferometers
+        ]
+
+    marginalized_parameters = getattr(likelihood, "_marginalized_parameters", list())
+    if len(marginalized_parameters) > 0:
+        # the waveform generator caches the polarizations, which are rescaled
+        # in place during the reconstruction
+        signal_polarizations = copy.deepcopy(signal_polarizations)
+        new_sample = likelihood.generate_posterior_sample_from_marginalized_likelihood(
+            signal_polarizations=signal_polarizations
+        )
+        new_values += [new_sample[key] for key in marginalized_parameters]
+
+    if update_sky_frame:
+        likelihood.parameters.update(likelihood.get_sky_frame_parameters())
+    if getattr(likelihood, "phase_marginalization", False):
+        signal_polarizations = likelihood.waveform_generator.frequency_domain_strain(
+            likelihood.parameters.copy()
+        )
+    for ifo in likelihood.interferometers:
+        snrs = likelihood.calculate_snrs(signal_polarizations, ifo, return_array=False)
+        new_values += [snrs.complex_matched_filter_snr, snrs.optimal_snr_squared.real ** 0.5]
+    return tuple(new_values)
+
+
 def generate_sky_frame_parameters(samples, likelihood):
     if isinstance(samples, dict):
         likelihood.parameters.update(samples)
@@ -2546,6 +2878,27 @@ def generate_sky_frame_parameters(samples, likelihood):
         samples[key] = new_samples[key]
 
 
+def fill_samples(args):
+    """
+    Reconstruct the marginalized parameters for a batch of samples, see
+    :code:`fill_sample` for the format of the elements of args
+    """
+    from ..core.sampler.base_sampler import _sampling_convenience_dump
+
+    likelihood = _sampling_convenience_dump.likelihood
+    if not hasattr(likelihood, "generate_posterior_samples_from_marginalized_likelihood"):
+        return [fill_sample(xx) for xx in args]
+    marginalized_parameters = getattr(likelihood, "_marginalized_parameters", list())
+    new_samples = likelihood.generate_posterior_samples_from_marginalized_likelihood(
+        [dict(sample).copy() for _, sample, _ in args],
+        seeds=[rseed for _, _, rseed in args],
+    )
+    return [
+        tuple((new_sample[key] for key in marginalized_parameters))
+        for new_sample in new_samples
+    ]
+
+
 def fill_sample(args):
     from ..core.sampler.base_sampler import _sampling_convenience_dump
     from ..core.utils.random import seed
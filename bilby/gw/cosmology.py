@@ -91,3 +91,121 @@ def z_at_value(func, fval, **kwargs):
     """
     from astropy.cosmology import z_at_value
     return z_at_value(func=func, fval=fval, **kwargs).value
+
+
+_REDSHIFT_INTERPOLANTS = dict()
+
+
+def _build_redshift_interpolant(
+    distance_function, minimum_redshift=1e-6, maximum_redshift=50,
+    rtol=1e-8, max_iterations=30
+):
+    """
+    Build a cubic spline interpolant of log redshift as a function of log
+    distance.
+
+    The spline is evaluated at the quartiles of each interval in redshift
+    and nodes are added to any interval where the interpolated redshift
+    differs from the true value by more than :code:`rtol` or the
+    interpolant is not monotonic.
+
+    Parameters
+    ==========
+    distance_function: callable
+        Function mapping redshift to distance, e.g.,
+        :code:`cosmology.luminosity_distance`.
+    minimum_redshift: float
+        The minimum redshift in the table.
+    maximum_redshift: float
+        The maximum redshift in the table.
+    rtol: float
+        The maximum relative error in the interpolated redshift.
+    max_iterations: int
+        The maximum number of refinement steps.
+
+    Returns
+    =======
+    minimum_distance, maximum_distance: float
+        The range of distances covered by the interpolant.
+    interpolant: scipy.interpolate.CubicSpline
+        The interpolant of log redshift as a function of log distance.
+    """
+    import numpy as np
+    from scipy.interpolate import CubicSpline
+
+    def log_distance(log_redshift):
+        return np.log(distance_function(np.exp(log_redshift)).value)
+
+    log_redshift = np.linspace(np.log(minimum_redshift), np.log(maximum_redshift), 64)
+    log_distances = log_distance(log_redshift)
+    quartiles = np.array([0.25, 0.5, 0.75])
+    for _ in range(max_iterations):
+        interpolant = CubicSpline(log_distances, log_redshift)
+        test_log_redshift = (
+            log_redshift[:-1, None] + np.diff(log_redshift)[:, None] * quartiles
+        )
+        interpolated = interpolant(log_distance(test_log_redshift))
+        inaccurate = np.any(
+            np.abs(np.expm1(interpolated - test_log_redshift)) > rtol, axis=1
+        )
+        non_monotonic = np.any(np.diff(np.column_stack([
+            log_redshift[:-1], interpolated, log_redshift[1:]
+        ]), axis=1) <= 0, axis=1)
+        refine = inaccurate | non_monotonic
+        if not np.any(refine):
+            break
+        log_redshift = np.sort(np.concatenate([log_redshift, test_log_redshift[refine, 1]]))
+        log_distances = log_distance(log_redshift)
+    else:
+        raise ValueError(
+            f"Redshift interpolant did not reach a relative accuracy of {rtol} "
+            f"in {max_iterations} iterations"
+        )
+    return np.exp(log_distances[0]), np.exp(log_distances[-1]), interpolant
+
+
+def redshift_at_distance(distance, cosmology=None, distance_type="luminosity_distance"):
+    """
+    Find the redshift corresponding to a luminosity or comoving distance.
+
+    An interpolant for the inverse of the distance-redshift relation is
+    built the first time this is called for each cosmology and cached.
+    The interpolant has a relative accuracy of :code:`1e-8` for redshifts
+    between :code:`1e-6` and :code:`50`, other values are found with
+    :code:`z_at_value`.
+
+    Parameters
+    ==========
+    distance: float, array-like
+        The distance(s) in Mpc.
+    cosmology: astropy.cosmology.FLRW, str, None
+        The cosmology to use, see :code:`bilby.gw.cosmology.get_cosmology`.
+    distance_type: str
+        One of :code:`luminosity_distance` or :code:`comoving_distance`.
+
+    Returns
+    =======
+    float, array-like: The redshift(s)
+    """
+    import numpy as np
+    from astropy import units
+
+    if distance_type not in ["luminosity_distance", "comoving_distance"]:
+        raise ValueError(f"Unknown distance type {distance_type}")
+    cosmology = get_cosmology(cosmology)
+    distance_function = getattr(cosmology, distance_type)
+    key = (repr(cosmology), distance_type)
+    if key not in _REDSHIFT_INTERPOLANTS:
+        _REDSHIFT_INTERPOLANTS[key] = _build_redshift_interpolant(distance_function)
+    minimum_distance, maximum_distance, interpolant = _REDSHIFT_INTERPOLANTS[key]
+
+    distance = np.asarray(distance, dtype=float)
+    redshift = np.zeros(distance.shape)
+    in_range = (distance >= minimum_distance) & (distance <= maximum_distance)
+    redshift[in_range] = np.exp(interpolant(np.log(distance[in_range])))
+    outside = ~in_range & (distance != 0)
+    if np.any(outside):
+        redshift[outside] = z_at_value(distance_function, distance[outside] * units.Mpc)
+    if redshift.ndim == 0:
+        redshift = float(redshift)
+    return redshift
@@ -1,6 +1,8 @@
 import os
+from functools import lru_cache
+
 import numpy as np
-from scipy.interpolate import interp1d, CubicSpline
+from scipy.interpolate import CubicSpline
 
 from .tov_solver import IntegrateTOV
 from ...core import utils
@@ -264,14 +266,22 @@ class TabularEOS(object):
         """
         Value of [depsilon/dh](p)
 
+        For 'CubicSpline' interpolation the derivative of the interpolating
+        spline is used, for 'linear' interpolation a central finite difference
+        is used.
+
         :param pseudo_enthalpy (`float`): Dimensionless pseudo-enthalpy.
         :param interp_type (`str`): String specifying interpolation type.
                                     Current implementations are 'CubicSpline', 'linear'.
-        :param rel_dh (`float`): Relative step size in pseudo-enthalpy space.
+        :param rel_dh (`float`): Relative step size in pseudo-enthalpy space for 'linear' interpolation.
 
         :return dedh (`float`): Derivative of energy-density with respect to pseudo-enthalpy
                                 evaluated at `pseudo_enthalpy` in geometerized units.
         """
+        if interp_type == 'CubicSpline':
+            return self.__log_log_derivative(
+                pseudo_enthalpy, self.energy_density_from_pseudo_enthalpy(pseudo_enthalpy),
+                self.minimum_pseudo_enthalpy, 1.5, self.interp_energy_density_from_pseudo_enthalpy)
 
         # step size=fraction of value
         dh = pseudo_enthalpy * rel_dh
@@ -285,14 +295,22 @@ class TabularEOS(object):
         """
         Find value of [depsilon/dp](p)
 
+        For 'CubicSpline' interpolation the derivative of the interpolating
+        spline is used, for 'linear' interpolation a central finite difference
+        is used.
+
         :param pressure (`float`): pressure in geometerized units.
-        :param rel_dp (`float`): Relative step size in pressure space.
+        :param rel_dp (`float`): Relative step size in pressure space for 'linear' interpolation.
         :param interp_type (`float`): String specifying interpolation type.
                                       Current implementations are 'CubicSpline', 'linear'.
 
         :return dedp (`float`): Derivative of energy-density with respect to pressure
                                 evaluated at `pressure`.
         """
+        if interp_type == 'CubicSpline':
+            return self.__log_log_derivative(
+                pressure, self.energy_from_pressure(pressure),
+                self.minimum_pressure, 0.6, self.interp_energy_density_from_pressure)
 
         # step size=fraction of value
         dp = pressure * rel_dp
@@ -302,6 +320,65 @@ class TabularEOS(object):
 
         return (eps_upper - eps_lower) / (2. * dp)
 
+    def tov_quantities_from_pseudo_enthalpy(self, pseudo_enthalpy):
+        """
+        Find epsilon(h), p(h) and [depsilon/dp](h) together, as needed by the TOV equations.
+
+        All three are taken from the pseudo-enthalpy splines, with
+        depsilon/dp = (depsilon/dh) / (dp/dh) from the spline derivatives, so
+        the energy_from_pressure spline does not need to be evaluated as well.
+        Below the minimum enthalpy the same power laws as in
+        `energy_density_from_pseudo_enthalpy` and `pressure_from_pseudo_enthalpy` are used.
+
+        :param pseudo_enthalpy (`float`): Dimensionless pseudo-enthalpy.
+
+        :return energy_density (`float`): energy-density in geometerized units.
+        :return pressure (`float`): pressure in geometerized units.
+        :return dedp (`float`): Derivative of energy-density with respect to pressure.
+        """
+        pseudo_enthalpy = np.atleast_1d(pseudo_enthalpy)
+        log_ratio = np.log10(pseudo_enthalpy) - np.log10(self.pseudo_enthalpy[0])
+        log_energy_density = np.log10(self.energy_density[0]) + 1.5 * log_ratio
+        log_pressure = np.log10(self.pressure[0]) + 2.5 * log_ratio
+        energy_density_slope = np.full(pseudo_enthalpy.shape, 1.5)
+        pressure_slope = np.full(pseudo_enthalpy.shape, 2.5)
+
+        above_min = pseudo_enthalpy >= self.minimum_pseudo_enthalpy
+        if np.any(above_min):
+            x = np.log10(pseudo_enthalpy[above_min])
+            log_energy_density[above_min] = self.interp_energy_density_from_pseudo_enthalpy(x)
+            log_pressure[above_min] = self.interp_pressure_from_pseudo_enthalpy(x)
+            energy_density_slope[above_min] = self.interp_energy_density_from_pseudo_enthalpy(x, 1)
+            pressure_slope[above_min] = self.interp_pressure_from_pseudo_enthalpy(x, 1)
+
+        energy_density = 10 ** log_energy_density
+        pressure = 10 ** log_pressure
+        dedp = energy_density / pressure * energy_density_slope / pressure_slope
+
+        if pseudo_enthalpy.size == 1:
+            return energy_density[0], pressure[0], dedp[0]
+        else:
+            return energy_density, pressure, dedp
+
+    @staticmethod
+    def __log_log_derivative(x, y, minimum_x, low_density_index, spline):
+        """
+        Derivative dy/dx for a quantity interpolated by a cubic spline in
+        log10(y)-log10(x) with a power law y ~ x**low_density_index below
+        the minimum tabulated value.
+        """
+        x = np.atleast_1d(x)
+        y = np.atleast_1d(y)
+        slope = np.full(x.shape, low_density_index)
+        above_min = x >= minimum_x
+        slope[above_min] = spline(np.log10(x[above_min]), 1)
+        derivative = slope * y / x
+
+        if derivative.size == 1:
+            return derivative[0]
+        else:
+            return derivative
+
     def velocity_from_pseudo_enthalpy(self, pseudo_enthalpy, interp_type='CubicSpline'):
         """
         Returns the speed of sound in geometerized units in the
@@ -369,9 +446,7 @@ class TabularEOS(object):
 
     def __construct_all_tables(self):
         """Pressure and epsilon already tabular, now create array of enthalpies"""
-        edat = self.energy_density
-        hdat = [self.pseudo_enthalpy_from_energy_density(e) for e in edat]
-        self.pseudo_enthalpy = np.array(hdat)
+        self.pseudo_enthalpy = np.atleast_1d(self.pseudo_enthalpy_from_energy_density(self.energy_density))
 
     def plot(self, rep, xlim=None, ylim=None, units=None):
         """
@@ -585,39 +660,84 @@ class SpectralDecompositionEOS(TabularEOS):
         Creates p, epsilon table for a given set of spectral parameters
         """
 
-        # make p range
-        # to match lalsimulation tables: array = [pressure, density]
-        x_range = np.linspace(0, self.xmax, self.npts)
-        p_range = self.p0 * np.exp(x_range)
+        return _spectral_decomposition_table(
+            tuple(float(gamma) for gamma in np.ravel(self.gammas)), self.p0, self.e0, self.xmax, self.npts)
 
-        eos_vals = np.zeros((self.npts, 2))
-        eos_vals[:, 0] = p_range
 
-        for i in range(0, len(x_range)):
-            eos_vals[i, 1] = self.energy_density(x_range[i], self.e0)
+def _gauss_legendre(integrand, lower, upper, order=8):
+    """
+    Element-wise Gauss-Legendre quadrature of a vectorized integrand
+    between arrays of lower and upper limits.
+    """
+    nodes, weights = np.polynomial.legendre.leggauss(order)
+    lower = np.asarray(lower)[..., None]
+    half_width = (np.asarray(upper)[..., None] - lower) / 2
+    return np.sum(weights * integrand(lower + half_width * (nodes + 1)), axis=-1) * half_width[..., 0]
+
 
-        # convert eos to geometrized units in *m^-2*
-        # IMPORTANT
-        eos_vals = eos_vals * 0.1 * G_SI / C_SI ** 4
+def _cumulative_gauss_legendre(integrand, x, order=8):
+    """
+    Integral of a vectorized integrand from x[0] to each element of the
+    sorted array x, using Gauss-Legendre quadrature on every interval.
+    """
+    return np.concatenate([[0.], np.cumsum(_gauss_legendre(integrand, x[:-1], x[1:], order))])
 
-        # doing as those before me have done and using SLY4 as low density region
-        # SLY4 in geometrized units
-        low_density_path = os.path.join(os.path.dirname(__file__), 'eos_tables', 'LALSimNeutronStarEOS_SLY4.dat')
-        low_density = np.loadtxt(low_density_path)
 
-        cutoff = eos_vals[0, :]
+@lru_cache(maxsize=128)
+def _spectral_decomposition_table(gammas, p0, e0, xmax, npts):
+    """
+    Creates p, epsilon table for a given set of spectral parameters
 
-        # Then find overlap point
-        break_pt = len(low_density)
-        for i in range(1, len(low_density)):
-            if low_density[-i, 0] < cutoff[0] and low_density[-i, 1] < cutoff[1]:
-                break_pt = len(low_density) - i + 1
-                break
+    The nested integrals for mu(x) and epsilon(x) are evaluated over the
+    whole x grid at once by cumulative Gauss-Legendre quadrature. Tables
+    are cached by their (hashable) arguments and returned read-only.
+    """
+
+    def inverse_adiabatic_index(x):
+        return 1. / spectral_adiabatic_index(gammas, x)
+
+    # make p range
+    # to match lalsimulation tables: array = [pressure, density]
+    x_range = np.linspace(0, xmax, npts)
+    p_range = p0 * np.exp(x_range)
+
+    log_mu = -_cumulative_gauss_legendre(inverse_adiabatic_index, x_range)
+
+    def eps_integrand(x):
+        # x are quadrature nodes in each interval, shape (npts - 1, order)
+        log_mu_x = log_mu[:-1, None] - _gauss_legendre(inverse_adiabatic_index, x_range[:-1, None], x)
+        return np.exp(x + log_mu_x) * inverse_adiabatic_index(x)
+
+    eps_integral = _cumulative_gauss_legendre(eps_integrand, x_range)
+    mu = np.exp(log_mu)
+
+    eos_vals = np.zeros((npts, 2))
+    eos_vals[:, 0] = p_range
+    eos_vals[:, 1] = (e0 * C_CGS ** 2.) / mu + p0 / mu * eps_integral
 
-        # stack EOS arrays
-        eos_vals = np.vstack((low_density[0:break_pt, :], eos_vals))
+    # convert eos to geometrized units in *m^-2*
+    # IMPORTANT
+    eos_vals = eos_vals * 0.1 * G_SI / C_SI ** 4
 
-        return eos_vals
+    # doing as those before me have done and using SLY4 as low density region
+    # SLY4 in geometrized units
+    low_density_path = os.path.join(os.path.dirname(__file__), 'eos_tables', 'LALSimNeutronStarEOS_SLY4.dat')
+    low_density = np.loadtxt(low_density_path)
+
+    cutoff = eos_vals[0, :]
+
+    # Then find overlap point
+    break_pt = len(low_density)
+    for i in range(1, len(low_density)):
+        if low_density[-i, 0] < cutoff[0] and low_density[-i, 1] < cutoff[1]:
+            break_pt = len(low_density) - i + 1
+            break
+
+    # stack EOS arrays
+    eos_vals = np.vstack((low_density[0:break_pt, :], eos_vals))
+    eos_vals.flags.writeable = False
+
+    return eos_vals
 
 
 class EOSFamily(object):
@@ -630,14 +750,25 @@ class EOSFamily(object):
         Supply a `TabularEOS` class (or subclass)
     npts: float
         Number of points to calculate for mass-radius relation. Default is 500.
+    batch_size: int
+        Number of central energy densities to integrate simultaneously.
+        Default is 64.
+    refinement_points: int
+        Number of additional central energy densities to integrate in each
+        step of locating the maximum mass. Default is 8.
+    refinement_steps: int
+        Number of steps used to locate the maximum mass. Default is 3.
 
     Notes
     =====
     The mass-radius and mass-k2 data should be
     populated here via the TOV solver upon object construction.
+
+    The central energy densities are integrated in batches along a
+    logarithmic grid until the mass decreases. The grid is then refined
+    around the maximum mass, so additional points are placed there.
     """
-    def __init__(self, eos, npts=500):
-        from scipy.optimize import minimize_scalar
+    def __init__(self, eos, npts=500, batch_size=64, refinement_points=8, refinement_steps=3):
         self.eos = eos
 
         # FIXME: starting_energy_density is set somewhat arbitrarily
@@ -650,41 +781,45 @@ class EOSFamily(object):
                                               num=npts)
         energy_density_grid = np.exp(log_energy_density_grid)
 
-        # Generate m, r, and k2 lists
-        mass = []
-        radius = []
-        k2love_number = []
-        for i in range(len(energy_density_grid)):
-            tov_solver = IntegrateTOV(self.eos, energy_density_grid[i])
-            m, r, k2 = tov_solver.integrate_TOV()
-            mass.append(m)
-            radius.append(r)
-            k2love_number.append(k2)
+        # Generate m, r, and k2 arrays, integrating batches of central
+        # energy densities until the maximum mass has been passed
+        mass = np.zeros(0)
+        radius = np.zeros(0)
+        k2love_number = np.zeros(0)
+        for start in range(0, npts, batch_size):
+            m, r, k2 = IntegrateTOV(self.eos, energy_density_grid[start:start + batch_size]).integrate_TOV()
+            mass = np.concatenate([mass, m])
+            radius = np.concatenate([radius, r])
+            k2love_number = np.concatenate([k2love_number, k2])
 
             # Check if maximum mass has been found
-            if i > 0 and mass[i] <= mass[i - 1]:
+            decreasing = np.nonzero(np.diff(mass) <= 0)[0]
+            if len(decreasing) > 0:
                 break
+        if len(decreasing) > 0:
+            i = decreasing[0] + 1
+        else:
+            i = npts - 1
+        mass = mass[:i + 1]
+        radius = radius[:i + 1]
+        k2love_number = k2love_number[:i + 1]
 
         # If we're not at the end of the array, determine actual maximum mass. Else, assume
         # last point is the maximum mass and proceed.
-        if i < (npts - 1):
-            # Now replace with point with interpolated maximum mass
-            # This is done by interpolating the last three points and then
-            # minimizing the negative of the interpolated function
-            x = [energy_density_grid[i - 2], energy_density_grid[i - 1], energy_density_grid[i]]
-            y = [mass[i - 2], mass[i - 1], mass[i]]
-
-            f = interp1d(x, y, kind='quadratic', bounds_error=False, fill_value='extrapolate')
-
-            res = minimize_scalar(lambda x: -f(x))
-
-            # Integrate max energy density to get maximum mass
-            tov_solver = IntegrateTOV(self.eos, res.x)
-            mfin, rfin, k2fin = tov_solver.integrate_TOV()
-
-            mass[-1] = mfin
-            radius[-1] = rfin
-            k2love_number[-1] = k2fin
+        if 1 < i < (npts - 1):
+            # Refine the central energy density grid between the two neighbours
+            # of the last increasing point and replace the last point with the
+            # interpolated maximum mass.
+            (
+                refined_energy_density, refined_mass, refined_radius, refined_k2
+            ) = self.__refine_maximum_mass(
+                energy_density_grid[i - 2:i + 1], mass[i - 2:i + 1],
+                refinement_points, refinement_steps,
+            )
+            keep = (refined_energy_density > energy_density_grid[i - 2]) & (refined_mass > mass[i - 2])
+            mass = np.concatenate([mass[:i - 1], refined_mass[keep]])
+            radius = np.concatenate([radius[:i - 1], refined_radius[keep]])
+            k2love_number = np.concatenate([k2love_number[:i - 1], refined_k2[keep]])
 
         # Currently, everything is in geometerized units.
         # The mass variables have dimensions of length, k2 is dimensionless
@@ -692,8 +827,7 @@ class EOSFamily(object):
         # with these quantities, then convert to SI.
 
         # Calculating dimensionless lambda values from k2, radii, and mass
-        tidal_deformability = [2. / 3. * k2 * r ** 5. / m ** 5. for k2, r, m in
-                               zip(k2love_number, radius, mass)]
+        tidal_deformability = 2. / 3. * k2love_number * radius ** 5. / mass ** 5.
 
         # As a last resort, if highest mass is still smaller than second
         # to last point, remove the last point from each array
@@ -703,12 +837,80 @@ class EOSFamily(object):
             k2love_number = k2love_number[:-1]
             tidal_deformability = tidal_deformability[:-1]
 
-        self.mass = np.array(mass)
-        self.radius = np.array(radius)
-        self.k2love_number = np.array(k2love_number)
-        self.tidal_deformability = np.array(tidal_deformability)
+        self.mass = mass
+        self.radius = radius
+        self.k2love_number = k2love_number
+        self.tidal_deformability = tidal_deformability
         self.maximum_mass = mass[-1] * conversion_dict['mass']['m_sol']
 
+    def __refine_maximum_mass(self, energy_density, mass, refinement_points, refinement_steps):
+        """
+        Locate the maximum mass by repeatedly integrating a batch of central
+        energy densities in a shrinking bracket around the largest mass found.
+
+        Parameters
+        ==========
+        energy_density: array-like
+            Three central energy densities with the middle one having the
+            largest mass.
+        mass: array-like
+            The corresponding masses.
+        refinement_points: int
+            The number of central energy densities in each batch.
+        refinement_steps: int
+            The number of times to shrink the bracket.
+
+        Returns
+        =======
+        energy_density, mass, radius, k2love_number: array-like
+            The stars with central energy densities below that of the maximum
+            mass with increasing mass followed by the maximum mass star.
+        """
+        log_energy_density = np.log(energy_density)
+        mass = np.asarray(mass)
+        all_log_energy_density = np.zeros(0)
+        all_mass = np.zeros(0)
+        all_radius = np.zeros(0)
+        all_k2 = np.zeros(0)
+        lower, upper = log_energy_density[0], log_energy_density[-1]
+        for _ in range(refinement_steps):
+            new_log_energy_density = np.linspace(lower, upper, refinement_points + 2)[1:-1]
+            m, r, k2 = IntegrateTOV(self.eos, np.exp(new_log_energy_density)).integrate_TOV()
+            all_log_energy_density = np.concatenate([all_log_energy_density, new_log_energy_density])
+            all_mass = np.concatenate([all_mass, m])
+            all_radius = np.concatenate([all_radius, r])
+            all_k2 = np.concatenate([all_k2, k2])
+            bracket_x = np.concatenate([[lower], new_log_energy_density, [upper]])
+            idx = np.argmax(np.concatenate([[-np.inf], m, [-np.inf]]))
+            lower, upper = bracket_x[idx - 1], bracket_x[idx + 1]
+
+        # interpolate the three points around the largest mass with a
+        # quadratic to find the maximum mass
+        order = np.argsort(all_log_energy_density)
+        all_log_energy_density = all_log_energy_density[order]
+        all_mass = all_mass[order]
+        all_radius = all_radius[order]
+        all_k2 = all_k2[order]
+        idx = np.clip(np.argmax(all_mass), 1, len(all_mass) - 2)
+        coefficients = np.polyfit(
+            all_log_energy_density[idx - 1:idx + 2], all_mass[idx - 1:idx + 2], 2
+        )
+        if coefficients[0] < 0:
+            log_maximum = -coefficients[1] / (2 * coefficients[0])
+            log_maximum = np.clip(log_maximum, all_log_energy_density[idx - 1], all_log_energy_density[idx + 1])
+        else:
+            log_maximum = all_log_energy_density[np.argmax(all_mass)]
+        m_max, r_max, k2_max = IntegrateTOV(self.eos, np.exp(log_maximum)).integrate_TOV()
+
+        below = (all_log_energy_density < log_maximum) & (all_mass < m_max)
+        below &= all_mass >= np.maximum.accumulate(np.where(below, all_mass, -np.inf))
+        return (
+            np.exp(np.concatenate([all_log_energy_density[below], [log_maximum]])),
+            np.concatenate([all_mass[below], [m_max]]),
+            np.concatenate([all_radius[below], [r_max]]),
+            np.concatenate([all_k2[below], [k2_max]]),
+        )
+
     def radius_from_mass(self, m):
         """
         :param m: mass of neutron star in solar masses
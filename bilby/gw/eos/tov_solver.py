@@ -2,9 +2,30 @@
 
 import numpy as np
 
+# Dormand-Prince 5(4) tableau, as used by the RK45 method of
+# scipy.integrate.solve_ivp
+_DOPRI5_N_STAGES = 6
+_DOPRI5_ERROR_ESTIMATOR_ORDER = 4
+_DOPRI5_C = np.array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1])
+_DOPRI5_A = np.array([
+    [0, 0, 0, 0, 0],
+    [1 / 5, 0, 0, 0, 0],
+    [3 / 40, 9 / 40, 0, 0, 0],
+    [44 / 45, -56 / 15, 32 / 9, 0, 0],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729, 0],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+])
+_DOPRI5_B = np.array([35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84])
+_DOPRI5_E = np.array([
+    -71 / 57600, 0, 71 / 16695, -71 / 1920, 17253 / 339200, -22 / 525, 1 / 40
+])
+
 
 class IntegrateTOV:
     """Class that given an initial pressure a mass radius value and a k2-love number
+
+    If an array of central energy densities is given, all of the stars are
+    integrated simultaneously, see :code:`integrate_TOV`.
     """
 
     def __init__(self, eos, eps_0):
@@ -59,9 +80,7 @@ class IntegrateTOV:
         r = y[1]
         H = y[2]
         B = y[3]
-        eps = self.eos.energy_density_from_pseudo_enthalpy(h, interp_type='CubicSpline')
-        p = self.eos.pressure_from_pseudo_enthalpy(h, interp_type='CubicSpline')
-        depsdp = self.eos.dedp(p, interp_type='CubicSpline')
+        eps, p, depsdp = self.eos.tov_quantities_from_pseudo_enthalpy(h)
 
         dmdh = (- (4. * np.pi * eps * r ** 3 * (r - 2. * m)) /
                 (m + 4. * np.pi * r ** 3 * p))
@@ -109,7 +128,15 @@ class IntegrateTOV:
     def integrate_TOV(self):
         """
         Evolves TOV+k2 equations and returns final quantities
+
+        For an array of central energy densities, the equations for all of the
+        stars are evolved together using an explicit Runge-Kutta 5(4) method
+        with the same error control as :code:`scipy.integrate.solve_ivp` but
+        with a separate step size for each star, and arrays are returned.
         """
+        if np.ndim(self.pseudo_enthalpy) > 0:
+            return self.__integrate_TOV_vectorized()
+
         from scipy.integrate import solve_ivp
 
         # integration settings the same as in lalsimulation
@@ -126,3 +153,90 @@ class IntegrateTOV:
         k_2 = self.__calc_k2(r_fin, B_fin, H_fin, m_fin / r_fin)
 
         return m_fin, r_fin, k_2
+
+    def __integrate_TOV_vectorized(self):
+        """
+        Evolve the TOV+k2 equations for many stars at once.
+
+        This follows the Dormand-Prince implementation (RK45) in
+        :code:`scipy.integrate.solve_ivp`, including the choice of the initial
+        step, so the results agree with integrating each star separately.
+        """
+        rel_err = 1e-4
+        safety, min_factor, max_factor = 0.9, 0.2, 10.
+        error_exponent = -1 / (_DOPRI5_ERROR_ESTIMATOR_ORDER + 1)
+        h_final = 1e-16
+
+        def fun(h, y):
+            return self.__tov_eqns(h, y)
+
+        def rms(values):
+            return np.sqrt(np.mean(values ** 2, axis=0))
+
+        h = np.atleast_1d(np.array(self.pseudo_enthalpy, dtype=float))
+        y = np.array(self.y, dtype=float).reshape(4, -1)
+        f = fun(h, y)
+
+        # initial step size as in scipy.integrate._ivp.common.select_initial_step
+        scale = np.abs(y) * rel_err
+        d0 = rms(y / scale)
+        d1 = rms(f / scale)
+        step_0 = np.where((d0 < 1e-5) | (d1 < 1e-5), 1e-6, 0.01 * d0 / d1)
+        f1 = fun(h - step_0, y - step_0 * f)
+        d2 = rms((f1 - f) / scale) / step_0
+        step_1 = np.where(
+            (d1 <= 1e-15) & (d2 <= 1e-15),
+            np.maximum(1e-6, step_0 * 1e-3),
+            (0.01 / np.maximum(d1, d2)) ** (1 / (_DOPRI5_ERROR_ESTIMATOR_ORDER + 1)),
+        )
+        step_size = np.minimum(100 * step_0, step_1)
+
+        rejected = np.zeros(h.shape, dtype=bool)
+        active = h > h_final
+        stages = np.empty((_DOPRI5_N_STAGES + 1,) + y.shape)
+        while np.any(active):
+            idxs = np.nonzero(active)[0]
+            min_step = 10 * np.abs(np.nextafter(h[idxs], -np.inf) - h[idxs])
+            failed = rejected[idxs] & (step_size[idxs] < min_step)
+            if np.any(failed):
+                # stop where the step size becomes too small, as solve_ivp does
+                active[idxs[failed]] = False
+                continue
+            h_now, y_now = h[idxs], y[:, idxs]
+            step = np.maximum(step_size[idxs], min_step)
+            h_new = np.maximum(h_now - step, h_final)
+            step = h_new - h_now
+
+            stages_now = stages[:, :, :len(idxs)]
+            stages_now[0] = f[:, idxs]
+            for ii in range(1, _DOPRI5_N_STAGES):
+                dy = np.einsum("skn,s->kn", stages_now[:ii], _DOPRI5_A[ii, :ii]) * step
+                stages_now[ii] = fun(h_now + _DOPRI5_C[ii] * step, y_now + dy)
+            y_new = y_now + step * np.einsum("skn,s->kn", stages_now[:-1], _DOPRI5_B)
+            f_new = fun(h_new, y_new)
+            stages_now[-1] = f_new
+
+            scale = np.maximum(np.abs(y_now), np.abs(y_new)) * rel_err
+            error_norm = rms(np.einsum("skn,s->kn", stages_now, _DOPRI5_E) * step / scale)
+            accepted = error_norm < 1
+            with np.errstate(divide="ignore"):
+                factor = safety * error_norm ** error_exponent
+            factor = np.where(
+                accepted,
+                np.where(error_norm == 0, max_factor, np.minimum(max_factor, factor)),
+                np.maximum(min_factor, factor),
+            )
+            factor = np.where(accepted & rejected[idxs], np.minimum(1, factor), factor)
+            step_size[idxs] = np.abs(step) * factor
+
+            accepted_idxs = idxs[accepted]
+            h[accepted_idxs] = h_new[accepted]
+            y[:, accepted_idxs] = y_new[:, accepted]
+            f[:, accepted_idxs] = f_new[:, accepted]
+            rejected[idxs] = ~accepted
+            active[idxs] = h[idxs] > h_final
+
+        m_fin, r_fin, H_fin, B_fin = y
+        k_2 = self.__calc_k2(r_fin, B_fin, H_fin, m_fin / r_fin)
+
+        return m_fin, r_fin, k_2
@@ -8,7 +8,7 @@ from scipy.special import logsumexp
 
 from ...core.likelihood import Likelihood
 from ...core.utils import logger, UnsortedInterp2d, create_time_series
-from ...core.prior import Interped, Prior, Uniform, DeltaFunction
+from ...core.prior import Prior, Uniform, DeltaFunction
 from ..detector import InterferometerList, get_empty_interferometer, calibration
 from ..prior import BBHPriorDict, Cosmological
 from ..utils import noise_weighted_inner_product, zenith_azimuth_to_ra_dec, ln_i0
@@ -441,9 +441,25 @@ class GravitationalWaveTransient(Likelihood):
 
         return log_l
 
-    def compute_per_detector_log_likelihood(self):
-        waveform_polarizations = \
-            self.waveform_generator.frequency_domain_strain(self.parameters)
+    def compute_per_detector_log_likelihood(self, waveform_polarizations=None):
+        """
+        Compute the log likelihood in each interferometer
+
+        Parameters
+        ==========
+        waveform_polarizations: dict, optional
+            Polarizations modes of the template. If not given, these are
+            generated for the current parameters.
+
+        Returns
+        =======
+        parameters: dict
+            The parameters with the additional :code:`{ifo}_log_likelihood`
+            entries.
+        """
+        if waveform_polarizations is None:
+            waveform_polarizations = \
+                self.waveform_generator.frequency_domain_strain(self.parameters)
 
         if self.time_marginalization and self.jitter_time:
             self.parameters['geocent_time'] += self.parameters['time_jitter']
@@ -463,13 +479,20 @@ class GravitationalWaveTransient(Likelihood):
 
         return self.parameters.copy()
 
-    def generate_posterior_sample_from_marginalized_likelihood(self):
+    def generate_posterior_sample_from_marginalized_likelihood(
+            self, signal_polarizations=None):
         """
         Reconstruct the distance posterior from a run which used a likelihood
         which explicitly marginalised over time/distance/phase.
 
         See Eq. (C29-C32) of https://arxiv.org/abs/1809.02293
 
+        Parameters
+        ==========
+        signal_polarizations: dict, optional
+            Polarizations modes of the template for the current parameters.
+            Note: These are rescaled in place to the new distance sample.
+
         Returns
         =======
         sample: dict
@@ -477,33 +500,127 @@ class GravitationalWaveTransient(Likelihood):
 
         Notes
         =====
-        This involves a deepcopy of the signal to avoid issues with waveform
-        caching, as the signal is overwritten in place.
+        If the polarizations are not given, this involves a deepcopy of the
+        signal to avoid issues with waveform caching, as the signal is
+        overwritten in place.
         """
-        if len(self._marginalized_parameters) > 0:
-            signal_polarizations = copy.deepcopy(
-                self.waveform_generator.frequency_domain_strain(
-                    self.parameters))
-        else:
+        if len(self._marginalized_parameters) == 0:
             return self.parameters
+        if signal_polarizations is not None:
+            signal_polarizations = [signal_polarizations]
+        new_sample = self.generate_posterior_samples_from_marginalized_likelihood(
+            [self.parameters.copy()], signal_polarizations=signal_polarizations)[0]
+        self.parameters.update(new_sample)
+        return self.parameters.copy()
+
+    def generate_posterior_samples_from_marginalized_likelihood(
+            self, samples, signal_polarizations=None, seeds=None):
+        """
+        Reconstruct the marginalized parameters for a set of samples.
+
+        The waveform and the inner products are computed for each sample,
+        while the posteriors for the time, distance and phase are evaluated
+        for all samples on (number of samples, grid size) arrays and sampled
+        by inverse-CDF sampling. The inner products at the new time are
+        computed once and rescaled for the phase reconstruction.
+
+        See Eq. (C29-C32) of https://arxiv.org/abs/1809.02293
+
+        Parameters
+        ==========
+        samples: list
+            Dictionaries of the parameters of each sample.
+        signal_polarizations: list, optional
+            Polarizations modes of the template for each sample.
+            Note: These are rescaled in place to the new distance samples.
+        seeds: list, optional
+            A seed for the random number generator for each sample. If given,
+            the reconstructed values for each sample only depend on its seed
+            and not on the other samples.
+
+        Returns
+        =======
+        new_samples: list
+            The parameters of each sample with the reconstructed values.
+        """
+        from ...core.utils import random
+
+        if len(self._marginalized_parameters) == 0:
+            return [dict(sample) for sample in samples]
+        if signal_polarizations is None:
+            signal_polarizations = [None] * len(samples)
+        custom_time_sampling = (
+            type(self).generate_time_sample_from_marginalized_likelihood
+            is not GravitationalWaveTransient.generate_time_sample_from_marginalized_likelihood
+        )
+
+        new_samples = list()
+        signals = list()
+        time_grids = list()
+        # uniform draws for the time, distance and phase of each sample
+        units = np.zeros((len(samples), 3))
+        if self.time_marginalization and not custom_time_sampling:
+            weights = self._time_marginalization_weights()
+        for ii, (sample, signal) in enumerate(zip(samples, signal_polarizations)):
+            if seeds is not None:
+                random.seed(seeds[ii])
+            self.parameters.update(sample)
+            if signal is None:
+                signal = copy.deepcopy(
+                    self.waveform_generator.frequency_domain_strain(self.parameters))
+            if self.calibration_marginalization:
+                self.parameters['recalib_index'] = \
+                    self.generate_calibration_sample_from_marginalized_likelihood(
+                        signal_polarizations=signal)
+            if self.time_marginalization and custom_time_sampling:
+                self.parameters['geocent_time'] = \
+                    self.generate_time_sample_from_marginalized_likelihood(
+                        signal_polarizations=signal)
+            elif self.time_marginalization:
+                time_grids.append(self._time_posterior_grid(signal, weights=weights))
+            units[ii] = random.rng.uniform(0, 1, 3)
+            new_samples.append(self.parameters.copy())
+            signals.append(signal)
+
+        if len(time_grids) > 0:
+            new_times = _sample_from_grid(*_stack_grids(time_grids), unit=units[:, 0])
+            for new_sample, new_time in zip(new_samples, new_times):
+                new_sample['geocent_time'] = float(new_time)
+
+        if self.distance_marginalization or self.phase_marginalization:
+            d_inner_h = np.zeros(len(samples), dtype=complex)
+            h_inner_h = np.zeros(len(samples))
+            for ii, (new_sample, signal) in enumerate(zip(new_samples, signals)):
+                self.parameters.update(new_sample)
+                self.parameters.update(self.get_sky_frame_parameters())
+                new_sample.update(self.parameters)
+                d_inner_h[ii], h_inner_h[ii] = self._calculate_inner_products(signal)
 
-        if self.calibration_marginalization:
-            new_calibration = self.generate_calibration_sample_from_marginalized_likelihood(
-                signal_polarizations=signal_polarizations)
-            self.parameters['recalib_index'] = new_calibration
-        if self.time_marginalization:
-            new_time = self.generate_time_sample_from_marginalized_likelihood(
-                signal_polarizations=signal_polarizations)
-            self.parameters['geocent_time'] = new_time
         if self.distance_marginalization:
-            new_distance = self.generate_distance_sample_from_marginalized_likelihood(
-                signal_polarizations=signal_polarizations)
-            self.parameters['luminosity_distance'] = new_distance
+            luminosity_distance = np.array(
+                [new_sample['luminosity_distance'] for new_sample in new_samples])
+            new_distances = _sample_from_grid(
+                self._distance_array,
+                self._distance_posterior_grid(d_inner_h, h_inner_h, luminosity_distance),
+                unit=units[:, 1],
+            )
+            for new_sample, signal, new_distance in zip(new_samples, signals, new_distances):
+                new_sample['luminosity_distance'] = float(new_distance)
+                self._rescale_signal(signal, new_distance)
+            scaling = self._ref_dist / new_distances
+            d_inner_h = d_inner_h * scaling
+            h_inner_h = h_inner_h * scaling ** 2
+
         if self.phase_marginalization:
-            new_phase = self.generate_phase_sample_from_marginalized_likelihood(
-                signal_polarizations=signal_polarizations)
-            self.parameters['phase'] = new_phase
-        return self.parameters.copy()
+            phases = np.linspace(0, 2 * np.pi, 101)
+            new_phases = _sample_from_grid(
+                phases, self._phase_posterior_grid(d_inner_h, h_inner_h, phases),
+                unit=units[:, 2])
+            for new_sample, new_phase in zip(new_samples, new_phases):
+                new_sample['phase'] = float(new_phase)
+
+        self.parameters.update(new_samples[-1])
+        return new_samples
 
     def generate_calibration_sample_from_marginalized_likelihood(
             self, signal_polarizations=None):
@@ -559,6 +676,47 @@ class GravitationalWaveTransient(Likelihood):
         new_time: float
             Sample from the time posterior.
         """
+        times, time_post = self._time_posterior_grid(signal_polarizations)
+        return float(_sample_from_grid(times, time_post)[0])
+
+    def _time_marginalization_weights(self):
+        """
+        The conjugate data divided by the PSD for each interferometer, zero
+        padded to a sampling frequency of 16kHz
+        """
+        n_time_steps = int(self.waveform_generator.duration * 16384)
+        psd = np.ones(n_time_steps)
+        data = np.zeros(n_time_steps, dtype=complex)
+        weights = list()
+        for ifo in self.interferometers:
+            ifo_length = len(ifo.frequency_domain_strain)
+            mask = ifo.frequency_mask
+            data[:ifo_length] = np.conj(ifo.frequency_domain_strain)
+            psd[:ifo_length][mask] = ifo.power_spectral_density_array[mask]
+            weights.append(data / psd)
+        return weights
+
+    def _time_posterior_grid(self, signal_polarizations=None, weights=None):
+        """
+        The unnormalized time posterior on a grid sampled at 16kHz
+
+        Posterior values less than 1/1000 of the maximum are set to zero.
+
+        Parameters
+        ==========
+        signal_polarizations: dict, optional
+            Polarizations modes of the template.
+        weights: list, optional
+            The output of :code:`_time_marginalization_weights`, computed if
+            not given.
+
+        Returns
+        =======
+        times: array_like
+            The times in the prior range, in increasing order.
+        time_post: array_like
+            The posterior density at times.
+        """
         self.parameters.update(self.get_sky_frame_parameters())
         if self.jitter_time:
             self.parameters['geocent_time'] += self.parameters['time_jitter']
@@ -577,24 +735,23 @@ class GravitationalWaveTransient(Likelihood):
         in_prior = (times >= prior.minimum) & (times < prior.maximum)
         times = times[in_prior]
 
+        # the Fourier transform is linear so the integrands for all
+        # interferometers are summed before a single transform
+        if weights is None:
+            weights = self._time_marginalization_weights()
         n_time_steps = int(self.waveform_generator.duration * 16384)
-        d_inner_h = np.zeros(len(times), dtype=complex)
-        psd = np.ones(n_time_steps)
         signal_long = np.zeros(n_time_steps, dtype=complex)
-        data = np.zeros(n_time_steps, dtype=complex)
+        integrand = np.zeros(n_time_steps, dtype=complex)
         h_inner_h = np.zeros(1)
-        for ifo in self.interferometers:
-            ifo_length = len(ifo.frequency_domain_strain)
-            mask = ifo.frequency_mask
+        for ifo, weight in zip(self.interferometers, weights):
             signal = self._compute_full_waveform(
                 signal_polarizations=signal_polarizations,
                 interferometer=ifo,
             )
-            signal_long[:ifo_length] = signal
-            data[:ifo_length] = np.conj(ifo.frequency_domain_strain)
-            psd[:ifo_length][mask] = ifo.power_spectral_density_array[mask]
-            d_inner_h += np.fft.fft(signal_long * data / psd)[in_prior]
+            signal_long[:len(signal)] = signal
+            integrand += signal_long * weight
             h_inner_h += ifo.optimal_snr_squared(signal=signal).real
+        d_inner_h = np.fft.fft(integrand)[in_prior]
 
         if self.distance_marginalization:
             time_log_like = self.distance_marginalized_likelihood(
@@ -605,16 +762,11 @@ class GravitationalWaveTransient(Likelihood):
             time_log_like = (d_inner_h.real - h_inner_h.real / 2)
 
         time_prior_array = self.priors['geocent_time'].prob(times)
-        time_post = np.exp(time_log_like - max(time_log_like)) * time_prior_array
-
-        keep = (time_post > max(time_post) / 1000)
-        if sum(keep) < 3:
-            keep[1:-1] = keep[1:-1] | keep[2:] | keep[:-2]
-        time_post = time_post[keep]
-        times = times[keep]
+        time_post = np.exp(time_log_like - np.max(time_log_like)) * time_prior_array
+        time_post[time_post <= np.max(time_post) / 1000] = 0
 
-        new_time = Interped(times, time_post).sample()
-        return new_time
+        order = np.argsort(times)
+        return times[order], time_post[order]
 
     def generate_distance_sample_from_marginalized_likelihood(
             self, signal_polarizations=None):
@@ -644,27 +796,44 @@ class GravitationalWaveTransient(Likelihood):
 
         d_inner_h, h_inner_h = self._calculate_inner_products(signal_polarizations)
 
-        d_inner_h_dist = (
-            d_inner_h * self.parameters['luminosity_distance'] / self._distance_array
-        )
+        distance_post = self._distance_posterior_grid(
+            d_inner_h, h_inner_h, self.parameters['luminosity_distance'])
+        new_distance = float(_sample_from_grid(self._distance_array, distance_post)[0])
 
-        h_inner_h_dist = (
-            h_inner_h * self.parameters['luminosity_distance']**2 / self._distance_array**2
-        )
+        self._rescale_signal(signal_polarizations, new_distance)
+        return new_distance
+
+    def _distance_posterior_grid(self, d_inner_h, h_inner_h, luminosity_distance):
+        """
+        The unnormalized distance posterior on :code:`_distance_array`
+
+        Parameters
+        ==========
+        d_inner_h, h_inner_h: array_like
+            The inner products for the template at luminosity_distance.
+        luminosity_distance: array_like
+            The distance of the template for each sample.
+
+        Returns
+        =======
+        array_like: The posterior with shape (number of samples, number of distances).
+        """
+        d_inner_h = np.atleast_1d(d_inner_h)[:, np.newaxis]
+        h_inner_h = np.atleast_1d(h_inner_h)[:, np.newaxis]
+        scaling = np.atleast_1d(luminosity_distance)[:, np.newaxis] / self._distance_array
+
+        d_inner_h_dist = d_inner_h * scaling
+        h_inner_h_dist = h_inner_h * scaling**2
 
         if self.phase_marginalization:
             distance_log_like = ln_i0(abs(d_inner_h_dist)) - h_inner_h_dist.real / 2
         else:
             distance_log_like = (d_inner_h_dist.real - h_inner_h_dist.real / 2)
 
-        distance_post = (np.exp(distance_log_like - max(distance_log_like)) *
-                         self.distance_prior_array)
-
-        new_distance = Interped(
-            self._distance_array, distance_post).sample()
-
-        self._rescale_signal(signal_polarizations, new_distance)
-        return new_distance
+        return (
+            np.exp(distance_log_like - np.max(distance_log_like, axis=-1, keepdims=True))
+            * self.distance_prior_array
+        )
 
     def _calculate_inner_products(self, signal_polarizations):
         d_inner_h = 0
@@ -723,11 +892,19 @@ class GravitationalWaveTransient(Likelihood):
         d_inner_h, h_inner_h = self._calculate_inner_products(signal_polarizations)
 
         phases = np.linspace(0, 2 * np.pi, 101)
-        phasor = np.exp(-2j * phases)
-        phase_log_post = d_inner_h * phasor - h_inner_h / 2
-        phase_post = np.exp(phase_log_post.real - max(phase_log_post.real))
-        new_phase = Interped(phases, phase_post).sample()
-        return new_phase
+        phase_post = self._phase_posterior_grid(d_inner_h, h_inner_h, phases)
+        return float(_sample_from_grid(phases, phase_post)[0])
+
+    @staticmethod
+    def _phase_posterior_grid(d_inner_h, h_inner_h, phases):
+        """
+        The unnormalized phase posterior at phases with shape
+        (number of samples, number of phases)
+        """
+        d_inner_h = np.atleast_1d(d_inner_h)[:, np.newaxis]
+        h_inner_h = np.atleast_1d(h_inner_h)[:, np.newaxis]
+        phase_log_post = (d_inner_h * np.exp(-2j * phases) - h_inner_h / 2).real
+        return np.exp(phase_log_post - np.max(phase_log_post, axis=-1, keepdims=True))
 
     def distance_marginalized_likelihood(self, d_inner_h, h_inner_h):
         d_inner_h_ref, h_inner_h_ref = self._setup_rho(
@@ -1129,3 +1306,65 @@ class GravitationalWaveTransient(Likelihood):
             reference_frame=self._reference_frame_str,
             lal_version=self.lal_version,
             lalsimulation_version=self.lalsimulation_version)
+
+
+def _stack_grids(grids):
+    """
+    Stack (x, density) grids of different lengths into two arrays, padding
+    with zero density at the last x value
+    """
+    length = max(len(xx) for xx, _ in grids)
+    xx = np.empty((len(grids), length))
+    yy = np.zeros((len(grids), length))
+    for ii, (x_values, y_values) in enumerate(grids):
+        xx[ii, :len(x_values)] = x_values
+        xx[ii, len(x_values):] = x_values[-1]
+        yy[ii, :len(y_values)] = y_values
+    return xx, yy
+
+
+def _sample_from_grid(xx, yy, unit=None):
+    """
+    Draw one sample from each of a set of piecewise linear densities by
+    inverse-CDF sampling.
+
+    Parameters
+    ==========
+    xx: array_like
+        The increasing points the densities are tabulated at, either shared
+        with shape (number of points,) or with the shape of yy.
+    yy: array_like
+        The unnormalized densities with shape (number of densities, number of
+        points) or (number of points,).
+    unit: array_like, optional
+        The uniform draws used for each density, by default these are drawn
+        from :code:`bilby.core.utils.random.rng`.
+
+    Returns
+    =======
+    array_like: One sample for each density.
+    """
+    from ...core.utils.random import rng
+
+    yy = np.atleast_2d(yy)
+    xx = np.broadcast_to(xx, yy.shape)
+    nsamples, npoints = yy.shape
+    cdf = np.zeros(yy.shape)
+    np.cumsum((yy[:, 1:] + yy[:, :-1]) * np.diff(xx, axis=-1) / 2, axis=-1, out=cdf[:, 1:])
+    cdf /= cdf[:, -1:]
+
+    if unit is None:
+        unit = rng.uniform(0, 1, nsamples)
+    rows = np.arange(nsamples)
+    # offset each row so a single sorted search finds all the intervals
+    offsets = 2 * rows
+    index = np.searchsorted((cdf + offsets[:, np.newaxis]).ravel(), unit + offsets, side="right")
+    index = np.clip(index - rows * npoints, 1, npoints - 1)
+
+    lower_cdf = cdf[rows, index - 1]
+    delta_cdf = cdf[rows, index] - lower_cdf
+    lower_x = xx[rows, index - 1]
+    delta_x = xx[rows, index] - lower_x
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fraction = np.where(delta_cdf > 0, (unit - lower_cdf) / delta_cdf, 0)
+    return lower_x + fraction * delta_x
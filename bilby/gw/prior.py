@@ -20,7 +20,7 @@ from .conversion import (
     generate_all_bbh_parameters,
     chirp_mass_and_mass_ratio_to_total_mass,
     total_mass_and_mass_ratio_to_component_masses)
-from .cosmology import get_cosmology, z_at_value
+from .cosmology import get_cosmology, redshift_at_distance
 from .source import PARAMETER_SETS
 from .utils import calculate_time_to_merger
 
@@ -207,8 +207,8 @@ class Cosmological(Interped):
             if value == 0:
                 limit_dict['redshift'] = 0
             else:
-                limit_dict['redshift'] = z_at_value(
-                    cosmology.luminosity_distance, value * self.unit
+                limit_dict['redshift'] = redshift_at_distance(
+                    (value * self.unit).to("Mpc").value, cosmology, "luminosity_distance"
                 )
             limit_dict['comoving_distance'] = (
                 cosmology.comoving_distance(limit_dict['redshift']).value
@@ -217,8 +217,8 @@ class Cosmological(Interped):
             if value == 0:
                 limit_dict['redshift'] = 0
             else:
-                limit_dict['redshift'] = z_at_value(
-                    cosmology.comoving_distance, value * self.unit
+                limit_dict['redshift'] = redshift_at_distance(
+                    (value * self.unit).to("Mpc").value, cosmology, "comoving_distance"
                 )
             limit_dict['luminosity_distance'] = (
                 cosmology.luminosity_distance(limit_dict['redshift']).value
@@ -515,6 +515,25 @@ class AlignedSpin(Interped):
                                           maximum=maximum)
 
 
+def _aligned_spin_lookup_conditions(minimum, maximum, resolution, maximum_spin):
+    """
+    Aligned spin values for the inverse CDF tables of the conditional spin
+    priors. These are degenerate at zero aligned spin and the in-plane spin
+    goes like the square root of the distance to the maximum spin, so half of
+    the points are logarithmically spaced down to 1e-8 of the maximum spin,
+    with a point at zero, and the rest cluster towards the maximum spin.
+    """
+    number = max((resolution - 1) // 2, 2)
+    low = number // 2
+    magnitudes = maximum_spin * np.concatenate([
+        np.geomspace(1e-8, 0.5, low, endpoint=False),
+        1 - 0.5 * np.linspace(1, 0, number - low) ** 3,
+    ])
+    conditions = np.concatenate([-magnitudes[::-1], [0], magnitudes])
+    conditions = conditions[(conditions > minimum) & (conditions < maximum)]
+    return np.concatenate([[minimum], conditions, [maximum]])
+
+
 class ConditionalChiUniformSpinMagnitude(ConditionalLogUniform):
     r"""
     This prior characterizes the conditional prior on the spin magnitude given
@@ -539,6 +558,27 @@ class ConditionalChiUniformSpinMagnitude(ConditionalLogUniform):
     def _condition_function(self, reference_params, **kwargs):
         return dict(minimum=np.abs(kwargs[self._required_variables[0]]), maximum=reference_params["maximum"])
 
+    def build_lookup_table(self, minimum=None, maximum=None, **kwargs):
+        """
+        Tabulate the inverse CDF, see
+        :code:`bilby.core.prior.ConditionalPrior.build_lookup_table`.
+        By default the table covers aligned spins between plus and minus the
+        maximum spin magnitude, with more points near zero and the maximum
+        where the inverse CDF changes rapidly.
+        """
+        if minimum is None:
+            minimum = -self.reference_params["maximum"]
+        if maximum is None:
+            maximum = self.reference_params["maximum"]
+        return super(ConditionalChiUniformSpinMagnitude, self).build_lookup_table(
+            minimum=minimum, maximum=maximum, **kwargs
+        )
+
+    def _lookup_table_conditions(self, minimum, maximum, resolution):
+        return _aligned_spin_lookup_conditions(
+            minimum, maximum, resolution, self.reference_params["maximum"]
+        )
+
     def __repr__(self):
         return Prior.__repr__(self)
 
@@ -633,10 +673,34 @@ class ConditionalChiInPlane(ConditionalBasePrior):
         (float, array-like)
             The in-plane component of the spin
         """
+        rescaled = self._lookup_rescale(val, required_variables)
+        if rescaled is not None:
+            return rescaled
         self.update_conditions(**required_variables)
         chi_aligned = abs(required_variables[self._required_variables[0]])
         return chi_aligned * ((self._reference_maximum / chi_aligned) ** (2 * val) - 1) ** 0.5
 
+    def build_lookup_table(self, minimum=None, maximum=None, **kwargs):
+        """
+        Tabulate the inverse CDF, see
+        :code:`bilby.core.prior.ConditionalPrior.build_lookup_table`.
+        By default the table covers aligned spins between plus and minus the
+        maximum spin magnitude, with more points near zero and the maximum
+        where the inverse CDF changes rapidly.
+        """
+        if minimum is None:
+            minimum = -self._reference_maximum
+        if maximum is None:
+            maximum = self._reference_maximum
+        return super(ConditionalChiInPlane, self).build_lookup_table(
+            minimum=minimum, maximum=maximum, **kwargs
+        )
+
+    def _lookup_table_conditions(self, minimum, maximum, resolution):
+        return _aligned_spin_lookup_conditions(
+            minimum, maximum, resolution, self._reference_maximum
+        )
+
     def _condition_function(self, reference_params, **kwargs):
         with np.errstate(invalid="ignore"):
             maximum = np.sqrt(
@@ -1439,6 +1503,63 @@ class HealPixMapPriorDist(BaseJointPriorDist):
             sample = np.row_stack([sample[:, 0], sample[:, 1], dist_samples])
         return sample.reshape((-1, self.num_vars))
 
+    def _batch_rescale(self, samp, **kwargs):
+        """
+        Vectorized version of :code:`_rescale` which does not update the stored
+        distance distribution.
+
+        Parameters
+        ==========
+        samp : array_like
+            NxM array of samples on the unit cube, the first column picks the
+            pixel and the last the distance if it is included
+        kwargs : dict
+            unused
+
+        Returns
+        =======
+        rescaled_sample : array_like
+            NxM array of ra, dec (and distance) samples
+        """
+        pixels = np.round(self.inverse_cdf(samp[:, 0])).astype(int)
+        theta, ra = self.hp.pix2ang(self.nside, pixels)
+        dec = 0.5 * np.pi - theta
+        rescaled = np.empty((len(pixels), self.num_vars))
+        rescaled[:, 0] = random.rng.uniform(ra - self.pixel_length, ra + self.pixel_length)
+        rescaled[:, 1] = random.rng.uniform(dec - self.pixel_length, dec + self.pixel_length)
+        if self.distance:
+            rescaled[:, 2] = self._distance_rescale(pixels, samp[:, -1])
+        return rescaled
+
+    def _distance_rescale(self, pixels, samp, block=1000):
+        """
+        Rescale samples from the unit interval with the conditional distance
+        distribution for each of the given pixels.
+
+        The inverse CDFs of all the pixels in a block are concatenated, offset
+        by twice the pixel index, so they can be evaluated with a single call
+        to :code:`numpy.interp`.
+        """
+        unique_pixels, inverse = np.unique(pixels, return_inverse=True)
+        distances = np.empty(len(pixels))
+        for start in range(0, len(unique_pixels), block):
+            block_pixels = unique_pixels[start:start + block]
+            pdfs = self.rs ** 2 * norm(
+                loc=self.distmu[block_pixels][:, np.newaxis],
+                scale=self.distsigma[block_pixels][:, np.newaxis],
+            ).pdf(self.rs)
+            cdfs = np.cumsum(pdfs, axis=1) / np.sum(pdfs, axis=1)[:, np.newaxis]
+            offsets = 2 * np.arange(len(block_pixels))
+            idxs = (inverse >= start) & (inverse < start + len(block_pixels))
+            rows = inverse[idxs] - start
+            values = np.maximum(samp[idxs], cdfs[rows, 0]) + offsets[rows]
+            distances[idxs] = np.interp(
+                values,
+                (cdfs + offsets[:, np.newaxis]).flatten(),
+                np.tile(self.rs, len(block_pixels)),
+            )
+        return distances
+
     def update_distance(self, pix_idx):
         """
         Method to update the conditional distance distributions at given pixel used for distance handling in the
@@ -1612,19 +1733,21 @@ class HealPixMapPriorDist(BaseJointPriorDist):
         lnprob : array_like
             lnprob values at each sample
         """
-        for i in range(samp.shape[0]):
-            if not outbounds[i]:
-                if self.distance:
-                    phi, dec, dist = samp[0]
-                else:
-                    phi, dec = samp[0]
-                theta = 0.5 * np.pi - dec
-                pixel = self.hp.ang2pix(self.nside, theta, phi)
-                lnprob[i] = np.log(self.prob[pixel] / self.pixel_area)
-                if self.distance:
-                    self.update_distance(pixel)
-                    lnprob[i] += np.log(self.distance_pdf(dist) * dist ** 2)
-        lnprob[outbounds] = -np.inf
+        inbounds = ~np.asarray(outbounds, dtype=bool)
+        phi = samp[inbounds, 0]
+        theta = 0.5 * np.pi - samp[inbounds, 1]
+        pixel = self.hp.ang2pix(self.nside, theta, phi)
+        with np.errstate(divide="ignore"):
+            values = np.log(self.prob[pixel] / self.pixel_area)
+            if self.distance:
+                dist = samp[inbounds, 2]
+                values += np.log(
+                    self.distnorm[pixel]
+                    * norm(loc=self.distmu[pixel], scale=self.distsigma[pixel]).pdf(dist)
+                    * dist ** 2
+                )
+        lnprob[inbounds] = values
+        lnprob[~inbounds] = -np.inf
         return lnprob
 
     def __eq__(self, other):
@@ -1,9 +1,16 @@
 import os
+import pickle
 import shutil
 import unittest
 
 import bilby
-from bilby.bilby_mcmc.chain import Chain, Sample, calculate_tau
+from bilby.bilby_mcmc.chain import (
+    BatchMeansACT,
+    Chain,
+    ChunkedChainArray,
+    Sample,
+    calculate_tau,
+)
 from bilby.bilby_mcmc.utils import LOGLKEY, LOGPKEY
 from bilby.core.sampler.base_sampler import SamplerError
 import numpy as np
@@ -67,6 +74,44 @@ class TestChain(unittest.TestCase):
 
         # Check the array is now longer than the block length (successfully extended)
         self.assertEqual(len(chain._chain_array), 4 * block_length)
+        self.assertEqual(len(chain.get_1d_array("a")), 3 * block_length + 1)
+
+    def test_float32_keys(self):
+        chain = Chain(initial_sample=self.initial_sample, float32_keys=["b", LOGLKEY])
+        for i in range(100):
+            chain.append(self.create_random_sample())
+        chain.append(self.initial_sample)
+        self.assertEqual(chain[-1]["a"], self.initial_sample["a"])
+        self.assertNotEqual(chain[-1]["b"], self.initial_sample["b"])
+        self.assertAlmostEqual(chain[-1]["b"], self.initial_sample["b"], places=6)
+        self.assertEqual(chain.current_sample["b"], self.initial_sample["b"])
+        self.assertLess(
+            chain._chain_array.nbytes, chain.block_length * (chain.ndim + 2) * 8
+        )
+
+    def test_pickle_only_stores_samples(self):
+        chain = self.create_chain(n=100)
+        chain.append(self.initial_sample)
+        restored = pickle.loads(pickle.dumps(chain))
+        self.assertLess(len(pickle.dumps(chain)), 100 * chain.block_length)
+        self.assertEqual(len(restored._chain_array), chain.block_length)
+        self.assertEqual(restored[-1], self.initial_sample)
+        np.testing.assert_array_equal(
+            restored.get_1d_array("a"), chain.get_1d_array("a")
+        )
+        restored.append(self.initial_sample)
+        self.assertEqual(restored.position, chain.position + 1)
+
+    def test_unpickle_array_chain(self):
+        chain = self.create_chain(n=100)
+        state = chain.__dict__.copy()
+        state["_chain_array"] = chain._chain_array[:]
+        restored = object.__new__(Chain)
+        restored.__setstate__(state)
+        self.assertIsInstance(restored._chain_array, ChunkedChainArray)
+        np.testing.assert_array_equal(
+            restored.get_1d_array("b"), chain.get_1d_array("b")
+        )
 
     def test_get_item(self):
         chain = self.create_chain()
@@ -130,6 +175,47 @@ class TestChain(unittest.TestCase):
         chain.tau
         self.assertEqual(chain.cached_tau_count, 1)
 
+    def create_correlated_chain(self, n=20000, phi=0.9, **kwargs):
+        # An AR(1) process with an ACT of (1 + phi) / (1 - phi)
+        chain = Chain(initial_sample=self.initial_sample, **kwargs)
+        curr = self.initial_sample.copy()
+        for noise in bilby.core.utils.random.rng.normal(0, 1, (n, 2)):
+            curr = curr.copy()
+            curr["a"] = phi * curr["a"] + noise[0]
+            curr["b"] = phi * curr["b"] + noise[1]
+            chain.append(curr)
+        return chain
+
+    def test_tau_online_matches_fft(self):
+        bilby.core.utils.random.seed(42)
+        chain = self.create_correlated_chain()
+        online = chain._calculate_tau_dict(0)
+        fft = chain._calculate_tau_dict(0, tau_method="fft")
+        for key in chain.parameter_keys:
+            self.assertAlmostEqual(online[key], 19, delta=5)
+            self.assertAlmostEqual(online[key], fft[key], delta=5)
+
+    def test_tau_online_is_incremental(self):
+        chain = self.create_correlated_chain(n=5000)
+        chain.tau_dict
+        nblocks = chain.act_estimator.nblocks
+        self.assertEqual(nblocks, (chain.position + 1) // chain.act_estimator.block_length)
+        chain[100] = self.create_random_sample()
+        self.assertEqual(chain.act_estimator.nblocks, 100 // chain.act_estimator.block_length)
+        chain.tau_dict
+        self.assertEqual(chain.act_estimator.nblocks, nblocks)
+
+    def test_tau_fft_method(self):
+        chain = self.create_correlated_chain(n=2000, tau_method="fft")
+        self.assertEqual(chain.tau_dict, chain.tau_dict_fft)
+        self.assertIsNone(chain._act_estimator)
+
+    def test_tau_unknown_method(self):
+        chain = self.create_chain(n=100)
+        chain.tau_method = "unknown"
+        with self.assertRaises(SamplerError):
+            chain.tau_dict
+
     def test_nsamples(self):
         chain = self.create_chain(n=1000)
         self.assertGreaterEqual(chain.nsamples, 1)
@@ -206,6 +292,46 @@ class TestSample(unittest.TestCase):
         self.assertEqual(curr['a'], 1)
 
 
+class TestChunkedChainArray(unittest.TestCase):
+    def setUp(self):
+        self.array = np.random.normal(0, 1, (250, 4))
+        self.chunked = ChunkedChainArray.from_array(self.array, block_length=100)
+
+    def test_length(self):
+        self.assertEqual(len(self.chunked), 300)
+
+    def test_get_row(self):
+        np.testing.assert_array_equal(self.chunked[123], self.array[123])
+
+    def test_get_slices(self):
+        for index in [
+            slice(0, 250),
+            slice(10, 230, 7),
+            (slice(5, 250, 3), 2),
+            (slice(0, 250), [3, 0]),
+            (99, slice(1, 3)),
+        ]:
+            np.testing.assert_array_equal(self.chunked[index], self.array[index])
+
+    def test_negative_step(self):
+        with self.assertRaises(IndexError):
+            self.chunked[::-1]
+
+    def test_set_values(self):
+        self.chunked[150] = np.arange(4)
+        np.testing.assert_array_equal(self.chunked[150], np.arange(4))
+        self.chunked[90:110, 1] = np.ones(20)
+        np.testing.assert_array_equal(self.chunked[90:110, 1], np.ones(20))
+
+    def test_float32_columns(self):
+        chunked = ChunkedChainArray.from_array(
+            self.array, block_length=100, float32_columns=[1]
+        )
+        self.assertEqual(chunked[10:20].dtype, np.float64)
+        np.testing.assert_array_equal(chunked[:250, [0, 2, 3]], self.array[:, [0, 2, 3]])
+        np.testing.assert_allclose(chunked[:250, 1], self.array[:, 1], rtol=1e-6)
+
+
 class TestACT(unittest.TestCase):
     def test_act_normal(self):
         x = np.random.normal(0, 1, 1000)
@@ -223,6 +349,25 @@ class TestACT(unittest.TestCase):
         tau = calculate_tau(x)
         self.assertGreater(tau, 10)
 
+    def test_batch_means_identical(self):
+        x = np.zeros((1000, 1))
+        estimator = BatchMeansACT(columns=[0])
+        estimator.update(x, len(x))
+        self.assertEqual(estimator.integrated_time(0)[0], np.inf)
+
+    def test_batch_means_too_short(self):
+        x = np.random.normal(0, 1, (100, 1))
+        estimator = BatchMeansACT(columns=[0])
+        estimator.update(x, len(x))
+        self.assertTrue(np.isnan(estimator.integrated_time(0)[0]))
+
+    def test_batch_means_normal(self):
+        x = np.random.normal(0, 1, (10000, 1))
+        estimator = BatchMeansACT(columns=[0])
+        for ii in range(0, len(x), 1000):
+            estimator.update(x, ii + 1000)
+        self.assertLess(estimator.integrated_time(0)[0], 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,15 +1,39 @@
 import os
+import pickle
 import shutil
+import tempfile
 import unittest
+from collections import namedtuple
+from unittest import mock
 
 import bilby
-from bilby.bilby_mcmc.sampler import Bilby_MCMC, BilbyMCMCSampler
-from bilby.bilby_mcmc.utils import ConvergenceInputs
+from bilby.bilby_mcmc.sampler import (
+    Bilby_MCMC,
+    BilbyMCMCSampler,
+    BilbyPTMCMCSampler,
+    ResidentChainPool,
+    _ResidentChainWorker,
+)
+from bilby.bilby_mcmc.utils import ConvergenceInputs, ParallelTemperingInputs
 from bilby.core.sampler.base_sampler import SamplerError
 import numpy as np
 import pandas as pd
 
 
+class TestConvergenceInputs(unittest.TestCase):
+    def test_unpickle_without_tau_method(self):
+        fields = [key for key in ConvergenceInputs._fields if key != "tau_method"]
+        old_inputs = namedtuple("ConvergenceInputs", fields)
+        old_inputs.__module__ = ConvergenceInputs.__module__
+        values = dict(Bilby_MCMC.default_kwargs, target_nsamples=100)
+        with mock.patch("bilby.bilby_mcmc.utils.ConvergenceInputs", old_inputs):
+            pickled = pickle.dumps(old_inputs(**{key: values[key] for key in fields}))
+        convergence_inputs = pickle.loads(pickled)
+        self.assertIsInstance(convergence_inputs, ConvergenceInputs)
+        self.assertEqual(convergence_inputs.tau_method, "online")
+        self.assertEqual(convergence_inputs.tau_window, values["tau_window"])
+
+
 class TestBilbyMCMCSampler(unittest.TestCase):
     def setUp(self):
         default_kwargs = Bilby_MCMC.default_kwargs
@@ -85,5 +109,149 @@ class TestBilbyMCMCSampler(unittest.TestCase):
         self.assertTrue(isinstance(sampler.samples, pd.DataFrame))
 
 
+class TestBilbyPTMCMCSamplerVectorized(unittest.TestCase):
+    def setUp(self):
+        default_kwargs = Bilby_MCMC.default_kwargs.copy()
+        default_kwargs["target_nsamples"] = 100
+        default_kwargs["L1steps"] = 5
+        default_kwargs["ntemps"] = 3
+        default_kwargs["nensemble"] = 2
+        self.convergence_inputs = ConvergenceInputs(
+            **{key: default_kwargs[key] for key in ConvergenceInputs._fields}
+        )
+        self.pt_inputs = ParallelTemperingInputs(
+            **{key: default_kwargs[key] for key in ParallelTemperingInputs._fields}
+        )
+        likelihood = bilby.core.likelihood.AnalyticalMultidimensionalCovariantGaussian(
+            mean=[0, 0], cov=np.eye(2)
+        )
+        priors = bilby.core.prior.PriorDict(
+            dict(x0=bilby.core.prior.Uniform(-5, 5), x1=bilby.core.prior.Uniform(-5, 5))
+        )
+        bilby.core.sampler.base_sampler._initialize_global_variables(
+            likelihood, priors, ["x0", "x1"], False
+        )
+        self.likelihood = likelihood
+        self.priors = priors
+
+    def test_vectorize_and_resident_chains_exclusive(self):
+        with tempfile.TemporaryDirectory() as outdir:
+            with self.assertRaisesRegex(SamplerError, "resident_chains"):
+                Bilby_MCMC(
+                    self.likelihood,
+                    self.priors,
+                    outdir=outdir,
+                    vectorize_chains=True,
+                    resident_chains=True,
+                    npool=2,
+                )
+
+    def test_step_all_chains_vectorized(self):
+        ptsampler = BilbyPTMCMCSampler(
+            convergence_inputs=self.convergence_inputs,
+            pt_inputs=self.pt_inputs,
+            proposal_cycle="default_noNFnoGMnoKD",
+            pt_rejection_sample=False,
+            pool=None,
+            use_ratio=False,
+            evidence_method="stepping_stone",
+            initial_sample_method="prior",
+            initial_sample_dict=None,
+            vectorize_chains=True,
+        )
+        nsteps = 20
+        for _ in range(nsteps):
+            ptsampler.step_all_chains()
+        for sampler in ptsampler.sampler_list:
+            # Only the zero-temperature chains take ensemble steps
+            nensemble_steps = ptsampler.swap_counter["ensemble"] * (sampler.Tindex == 0)
+            self.assertEqual(sampler.chain.position, nsteps + nensemble_steps)
+            self.assertEqual(
+                sampler.accepted + sampler.rejected, 5 * nsteps + nensemble_steps
+            )
+            current = sampler.chain.current_sample
+            self.assertAlmostEqual(
+                current["logl"],
+                bilby.core.sampler.base_sampler._sampling_convenience_dump.likelihood
+                .batch_log_likelihood(dict(x0=current["x0"], x1=current["x1"]))[0],
+            )
+
+    def test_step_all_chains_resident(self):
+        ptsampler = BilbyPTMCMCSampler(
+            convergence_inputs=self.convergence_inputs,
+            pt_inputs=self.pt_inputs,
+            proposal_cycle="default_noNFnoGMnoKD",
+            pt_rejection_sample=False,
+            pool=None,
+            use_ratio=False,
+            evidence_method="stepping_stone",
+            initial_sample_method="prior",
+            initial_sample_dict=None,
+        )
+        pool = ResidentChainPool(ptsampler, processes=2)
+        ptsampler.pool = pool
+        nsteps = 20
+        try:
+            for _ in range(nsteps):
+                ptsampler.step_all_chains()
+            nensemble_steps = ptsampler.swap_counter["ensemble"]
+            state = ptsampler.__getstate__()
+            self.assertIsNone(state["pool"])
+            for sampler in state["sampler_dictionary"].values():
+                for ss in sampler:
+                    self.assertIsInstance(ss, BilbyMCMCSampler)
+                    self.assertEqual(
+                        ss.chain.position, nsteps + nensemble_steps * (ss.Tindex == 0)
+                    )
+        finally:
+            pool.close()
+            pool.join()
+        for sampler in ptsampler.sampler_list:
+            self.assertIsInstance(sampler, BilbyMCMCSampler)
+            expected = nensemble_steps * (sampler.Tindex == 0)
+            self.assertEqual(sampler.chain.position, nsteps + expected)
+            self.assertEqual(sampler.accepted + sampler.rejected, 5 * nsteps + expected)
+        ensemble_proposals = ptsampler.ensemble_proposal_cycle.proposal_list
+        self.assertEqual(
+            sum(proposal.accepted + proposal.rejected for proposal in ensemble_proposals),
+            nensemble_steps * len(ptsampler.sampler_dictionary[0]),
+        )
+        self.assertEqual(
+            sum(sampler.pt_accepted + sampler.pt_rejected for sampler in ptsampler.sampler_list),
+            ptsampler.swap_counter["temperature"] * (ptsampler.ntemps - 1),
+        )
+
+    def test_resident_swaps_use_one_round_trip_per_worker(self):
+        ptsampler = BilbyPTMCMCSampler(
+            convergence_inputs=self.convergence_inputs,
+            pt_inputs=self.pt_inputs,
+            proposal_cycle="default_noNFnoGMnoKD",
+            pt_rejection_sample=False,
+            pool=None,
+            use_ratio=False,
+            evidence_method="stepping_stone",
+            initial_sample_method="prior",
+            initial_sample_dict=None,
+        )
+        pool = ResidentChainPool(ptsampler, processes=2)
+        ptsampler.pool = pool
+        try:
+            for method in [ptsampler.ensemble_step, ptsampler.swap_tempered_chains]:
+                with mock.patch.object(
+                    _ResidentChainWorker, "send", autospec=True,
+                    side_effect=_ResidentChainWorker.send,
+                ) as send:
+                    method()
+                self.assertEqual(
+                    [call.args[1] for call in send.call_args_list],
+                    ["snapshot"] * len(pool.workers) + ["apply"] * len(pool.workers),
+                )
+        finally:
+            pool.close()
+            pool.join()
+        for sampler in ptsampler.sampler_list:
+            self.assertEqual(sampler.chain.position, 1 * (sampler.Tindex == 0))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -50,6 +50,12 @@ class TestLikelihoodBase(unittest.TestCase):
         self.likelihood.meta_data = meta_data
         self.assertEqual(self.likelihood.meta_data, meta_data)
 
+    def test_base_batch_log_likelihood(self):
+        self.likelihood.parameters = dict(a=0)
+        values = self.likelihood.batch_log_likelihood(dict(a=np.arange(3)))
+        self.assertEqual(len(values), 3)
+        self.assertTrue(np.all(np.isnan(values)))
+
 
 class TestAnalytical1DLikelihood(unittest.TestCase):
     def setUp(self):
@@ -540,6 +546,15 @@ class TestAnalyticalMultidimensionalCovariantGaussian(unittest.TestCase):
         likelihood = AnalyticalMultidimensionalCovariantGaussian(mean=[0], cov=[1])
         self.assertEqual(-np.log(2 * np.pi) / 2, likelihood.log_likelihood())
 
+    def test_batch_log_likelihood_matches_loop(self):
+        parameters = dict(
+            x0=np.linspace(9, 11, 5), x1=np.linspace(10, 12, 5), x2=np.linspace(11, 13, 5)
+        )
+        expected = Likelihood.batch_log_likelihood(self.likelihood, parameters)
+        self.assertTrue(
+            np.allclose(expected, self.likelihood.batch_log_likelihood(parameters))
+        )
+
 
 class TestAnalyticalMultidimensionalBimodalCovariantGaussian(unittest.TestCase):
     def setUp(self):
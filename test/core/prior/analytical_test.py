@@ -65,6 +65,18 @@ class TestCategoricalPrior(unittest.TestCase):
             )
         )
 
+    def test_rescale_at_unit_boundaries(self):
+        N = 3
+        categorical_prior = bilby.core.prior.Categorical(N)
+        self.assertEqual(categorical_prior.rescale(0), 0)
+        self.assertEqual(categorical_prior.rescale(1), N - 1)
+        self.assertTrue(
+            np.array_equal(
+                categorical_prior.rescale(np.array([0, 0.3, 0.5, 0.9, 1])),
+                np.array([0, 0, 1, 2, 2]),
+            )
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
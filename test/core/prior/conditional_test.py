@@ -54,6 +54,83 @@ class TestConditionalPrior(unittest.TestCase):
         )
         self.assertListEqual([], self.prior.required_variables)
 
+    def test_evaluate_does_not_update_conditions(self):
+        prior = bilby.core.prior.ConditionalUniform(
+            condition_func=self.condition_func, minimum=self.minimum, maximum=self.maximum
+        )
+        result = prior.evaluate(
+            "rescale",
+            0.5,
+            test_variable_1=self.test_variable_1,
+            test_variable_2=self.test_variable_2,
+        )
+        self.assertEqual(3.5, result)
+        self.assertEqual(self.minimum, prior.minimum)
+        self.assertEqual(self.maximum, prior.maximum)
+
+    def test_lookup_table(self):
+        def condition_func(reference_params, test_variable_1):
+            return dict(minimum=reference_params["minimum"], maximum=test_variable_1)
+
+        prior = bilby.core.prior.ConditionalPowerLaw(
+            condition_func=condition_func, alpha=2, minimum=1, maximum=2
+        )
+        error = prior.build_lookup_table(minimum=2, maximum=4, resolution=64)
+        self.assertLess(error, 1e-2)
+        unit = np.random.uniform(0, 1, 100)
+        conditions = np.random.uniform(2, 4, 100)
+        exact = bilby.core.prior.ConditionalPowerLaw(
+            condition_func=condition_func, alpha=2, minimum=1, maximum=2
+        )
+        np.testing.assert_allclose(
+            prior.rescale(unit, test_variable_1=conditions),
+            exact.rescale(unit, test_variable_1=conditions),
+            atol=2 * error * 3,
+        )
+        self.assertAlmostEqual(
+            prior.rescale(0.3, test_variable_1=3.0),
+            exact.rescale(0.3, test_variable_1=3.0),
+            delta=2 * error * 3,
+        )
+        self.assertAlmostEqual(
+            prior.evaluate("rescale", 0.3, test_variable_1=3.0),
+            prior.rescale(0.3, test_variable_1=3.0),
+        )
+        self.assertEqual(prior, exact)
+
+    def test_lookup_table_outside_range(self):
+        def condition_func(reference_params, test_variable_1):
+            return dict(minimum=reference_params["minimum"], maximum=test_variable_1)
+
+        prior = bilby.core.prior.ConditionalUniform(
+            condition_func=condition_func, minimum=0, maximum=1
+        )
+        prior.build_lookup_table(minimum=1, maximum=2, resolution=16)
+        self.assertEqual(prior.rescale(0.5, test_variable_1=4.0), 2.0)
+        np.testing.assert_allclose(
+            prior.rescale(np.array([0.5, 0.5]), test_variable_1=np.array([1.5, 4.0])),
+            [0.75, 2.0],
+        )
+
+    def test_lookup_table_tolerance(self):
+        def condition_func(reference_params, test_variable_1):
+            return dict(minimum=reference_params["minimum"], maximum=test_variable_1)
+
+        prior = bilby.core.prior.ConditionalPowerLaw(
+            condition_func=condition_func, alpha=-3, minimum=1, maximum=2
+        )
+        error = prior.build_lookup_table(minimum=2, maximum=4, resolution=8, tolerance=1e-4)
+        self.assertLessEqual(error, 1e-4)
+        self.assertGreater(prior._lookup_table.resolution, 8)
+        prior.build_lookup_table(
+            minimum=2, maximum=4, resolution=8, tolerance=1e-12, max_resolution=16
+        )
+        self.assertIsNone(prior._lookup_table)
+
+    def test_lookup_table_multiple_variables(self):
+        with self.assertRaises(ValueError):
+            self.prior.build_lookup_table(minimum=0, maximum=1)
+
     def test_get_instantiation_dict(self):
         expected = dict(
             minimum=0,
@@ -363,6 +440,83 @@ class TestConditionalPriorDict(unittest.TestCase):
             expected.append(expected[-1] * self.test_sample[f"var_{ii}"])
         self.assertListEqual(expected, res[0:4])
 
+    def test_batch_ln_prob(self):
+        samples = self.conditional_priors.sample(10)
+        samples["var_2"][0] = 2
+        expected = self.conditional_priors.ln_prob(samples, axis=0)
+        actual = self.conditional_priors.batch_ln_prob(pd.DataFrame(samples))
+        np.testing.assert_allclose(actual, expected)
+        self.assertEqual(actual[0], -np.inf)
+
+    def test_compiled_prior_transform(self):
+        keys = ["var_3", "var_1", "var_0", "var_2"]
+        theta = np.random.uniform(0, 1, (5, 4))
+        result = self.conditional_priors.compile_prior_transform(keys)(theta)
+        for ii in range(5):
+            np.testing.assert_allclose(
+                result[ii], self.conditional_priors.rescale(keys, theta[ii])
+            )
+        np.testing.assert_allclose(result[:, 1], theta[:, 2] * theta[:, 1])
+
+    def test_compiled_prior_transform_with_joint_prior(self):
+        names = ["mvgvar_0", "mvgvar_1"]
+        mvg = bilby.core.prior.MultivariateGaussianDist(
+            names, mus=[[0.79, -0.83]], covs=[[[0.03, 0.], [0., 0.04]]]
+        )
+        self.conditional_priors["mvgvar_0"] = bilby.core.prior.MultivariateGaussian(mvg, "mvgvar_0")
+        self.conditional_priors["mvgvar_1"] = bilby.core.prior.MultivariateGaussian(mvg, "mvgvar_1")
+        keys = ["mvgvar_1", "var_0", "var_1", "var_2", "var_3", "mvgvar_0"]
+        theta = np.random.uniform(0, 1, (5, 6))
+        result = self.conditional_priors.compile_prior_transform(keys)(theta)
+        expected = mvg.rescale(theta[:, [5, 0]])
+        np.testing.assert_allclose(result[:, [5, 0]], expected)
+
+    def test_ln_prob_does_not_modify_priors(self):
+        self.conditional_priors.sample()
+        least_recently_sampled = {
+            key: prior.least_recently_sampled for key, prior in self.conditional_priors.items()
+        }
+        maximum = self.prior_3.maximum
+        self.conditional_priors.ln_prob(self.test_sample)
+        self.conditional_priors.prob(self.test_sample)
+        self.conditional_priors.cdf(self.test_sample)
+        self.assertEqual(maximum, self.prior_3.maximum)
+        for key, prior in self.conditional_priors.items():
+            self.assertEqual(least_recently_sampled[key], prior.least_recently_sampled)
+
+    def test_ln_prob_from_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        samples = [self.conditional_priors.sample() for _ in range(200)]
+        expected = [self.conditional_priors.ln_prob(sample) for sample in samples]
+        transform = self.conditional_priors.compile_prior_transform(list(self.test_sample))
+        theta = np.random.uniform(0, 1, (200, 4))
+        expected_rescaled = [transform(row) for row in theta]
+        with ThreadPoolExecutor(4) as pool:
+            actual = list(pool.map(self.conditional_priors.ln_prob, samples))
+            rescaled = list(pool.map(transform, theta))
+        np.testing.assert_allclose(actual, expected)
+        np.testing.assert_allclose(rescaled, expected_rescaled)
+
+    def test_ln_prob_with_joint_prior(self):
+        names = ["mvgvar_0", "mvgvar_1"]
+        mvg = bilby.core.prior.MultivariateGaussianDist(
+            names, mus=[[0.79, -0.83]], covs=[[[0.03, 0.], [0., 0.04]]]
+        )
+        self.conditional_priors["mvgvar_0"] = bilby.core.prior.MultivariateGaussian(mvg, "mvgvar_0")
+        self.conditional_priors["mvgvar_1"] = bilby.core.prior.MultivariateGaussian(mvg, "mvgvar_1")
+        sample = dict(self.test_sample, mvgvar_0=0.7, mvgvar_1=-0.8)
+        self.assertAlmostEqual(
+            self.conditional_priors.ln_prob(sample),
+            np.log(self.test_value) + mvg.ln_prob([0.7, -0.8]),
+        )
+        self.assertFalse(mvg.filled_request())
+        self.assertIsNone(mvg.requested_parameters["mvgvar_0"])
+
+    def test_compiled_prior_transform_missing_key(self):
+        with self.assertRaises(ValueError):
+            self.conditional_priors.compile_prior_transform(["var_0", "var_1"])
+
     def test_cdf(self):
         """
         Test that the CDF method is the inverse of the rescale method.
@@ -1,12 +1,22 @@
+import functools
 import os
+import tempfile
 import unittest
+from unittest import mock
 from unittest.mock import Mock
 
 import numpy as np
+import pandas as pd
 
 import bilby
 
 
+def _total_conversion(sample):
+    out = sample.copy()
+    out["total"] = sample["mass"] + sample["speed"]
+    return out
+
+
 class TestPriorDict(unittest.TestCase):
     def setUp(self):
         self.first_prior = bilby.core.prior.Uniform(
@@ -256,6 +266,33 @@ class TestPriorDict(unittest.TestCase):
         self.assertTrue(isinstance(out, np.ndarray))
         self.assertTrue(out.shape == (len(keys), size))
 
+    def test_sample_subset_constrained(self):
+        priors = self._constrained_priors()
+        samples = priors.sample_subset_constrained(keys=list(priors.keys()), size=(20, 50))
+        self.assertEqual(set(samples.keys()), {"mass", "speed"})
+        self.assertEqual(samples["mass"].shape, (20, 50))
+        self.assertTrue(np.all(samples["mass"] + samples["speed"] <= 1))
+        self.assertEqual(len(np.unique(samples["mass"])), 1000)
+
+    def test_sample_subset_constrained_batch_size(self):
+        priors = self._constrained_priors()
+        sample_subset = priors.sample_subset
+        with mock.patch.object(priors, "sample_subset", side_effect=sample_subset) as mocked:
+            samples = priors._constrained_samples(["mass", "speed"], needed=1000, maximum_batch=300)
+        self.assertEqual(len(samples["mass"]), 1000)
+        self.assertTrue(all(call.kwargs["size"] <= 300 for call in mocked.call_args_list))
+
+    def test_sample_subset_constrained_parallel(self):
+        import multiprocessing
+
+        priors = self._constrained_priors()
+        # Use the spawn start method so the workers only see what is pickled
+        with mock.patch("multiprocessing.Pool", multiprocessing.get_context("spawn").Pool):
+            samples = priors.sample(size=1001, npool=2)
+        self.assertEqual(samples["mass"].shape, (1001,))
+        self.assertTrue(np.all(samples["mass"] + samples["speed"] <= 1))
+        self.assertEqual(len(np.unique(samples["mass"])), 1001)
+
     def test_sample(self):
         size = 7
         bilby.core.utils.random.seed(42)
@@ -298,6 +335,241 @@ class TestPriorDict(unittest.TestCase):
             ),
         )
 
+    def test_batch_ln_prob(self):
+        samples = self.prior_set_from_dict.sample(10)
+        samples["mass"][0] = 2
+        expected = self.prior_set_from_dict.ln_prob(samples, axis=0)
+        frame = pd.DataFrame(samples)
+        structured = frame.to_records(index=False)
+        for sample_set in [samples, frame, structured]:
+            np.testing.assert_allclose(
+                self.prior_set_from_dict.batch_ln_prob(sample_set), expected
+            )
+        self.assertEqual(expected[0], -np.inf)
+
+    def test_batch_ln_prob_with_constraint(self):
+        def conversion(sample):
+            out = sample.copy()
+            out["total"] = sample["mass"] + sample["speed"]
+            return out
+
+        priors = bilby.core.prior.PriorDict(
+            dict(
+                mass=bilby.core.prior.Uniform(0, 1),
+                speed=bilby.core.prior.Uniform(0, 1),
+                total=bilby.core.prior.Constraint(0, 1),
+            ),
+            conversion_function=conversion,
+        )
+        priors._cached_normalizations[("mass", "speed")] = 2
+        samples = dict(mass=np.array([0.2, 0.8, 1.5]), speed=np.array([0.3, 0.6, 0.1]))
+        expected = priors.ln_prob(samples, axis=0)
+        np.testing.assert_allclose(priors.batch_ln_prob(samples), expected)
+        np.testing.assert_allclose(priors.batch_ln_prob(samples), [np.log(2), -np.inf, -np.inf])
+
+    def _constrained_priors(self):
+        return bilby.core.prior.PriorDict(
+            dict(
+                mass=bilby.core.prior.Uniform(0, 1),
+                speed=bilby.core.prior.Uniform(0, 1),
+                total=bilby.core.prior.Constraint(0, 1),
+            ),
+            conversion_function=_total_conversion,
+        )
+
+    def test_normalize_constraint_factor_without_constraints(self):
+        self.prior_set_from_dict.sample_subset = Mock()
+        factor = self.prior_set_from_dict.normalize_constraint_factor(("mass", "speed"))
+        self.assertEqual(factor, 1)
+        self.prior_set_from_dict.sample_subset.assert_not_called()
+
+    def test_normalize_constraint_factor(self):
+        priors = self._constrained_priors()
+        factor = priors.normalize_constraint_factor(
+            ("mass", "speed"), min_accept=5000, sampling_chunk=2000, nrepeats=4
+        )
+        self.assertAlmostEqual(factor, 2, delta=0.1)
+
+    def test_normalization_key_depends_on_priors(self):
+        priors = self._constrained_priors()
+        key = priors._normalization_key(("mass", "speed"))
+        self.assertEqual(key, self._constrained_priors()._normalization_key(("mass", "speed")))
+        priors["mass"] = bilby.core.prior.Uniform(0, 2)
+        self.assertNotEqual(key, priors._normalization_key(("mass", "speed")))
+
+    def test_normalization_key_depends_on_conversion_code(self):
+        priors = self._constrained_priors()
+        key = priors._normalization_key(("mass", "speed"))
+
+        def conversion(parameters):
+            out = parameters.copy()
+            out["total"] = 2 * parameters["mass"] + parameters["speed"]
+            return out
+
+        priors.conversion_function = conversion
+        self.assertNotEqual(key, priors._normalization_key(("mass", "speed")))
+
+    def test_normalization_not_stored_without_function_code(self):
+        priors = self._constrained_priors()
+        priors.conversion_function = functools.partial(priors.conversion_function)
+        self.assertIsNone(priors._normalization_key(("mass", "speed")))
+        with tempfile.TemporaryDirectory() as directory:
+            priors.normalization_file = os.path.join(directory, "test.normalization.json")
+            priors.normalize_constraint_factor(
+                ("mass", "speed"), min_accept=100, sampling_chunk=1000, nrepeats=2
+            )
+            self.assertFalse(os.path.isfile(priors.normalization_file))
+
+    def test_copy_keeps_normalization_file(self):
+        self.prior_set_from_dict.normalization_file = "test.normalization.json"
+        self.assertEqual(
+            self.prior_set_from_dict.copy().normalization_file, "test.normalization.json"
+        )
+
+    def test_normalization_file_roundtrip(self):
+        priors = self._constrained_priors()
+        with tempfile.TemporaryDirectory() as directory:
+            priors.normalization_file = os.path.join(directory, "test.normalization.json")
+            factor = priors.normalize_constraint_factor(
+                ("mass", "speed"), min_accept=1000, sampling_chunk=1000, nrepeats=2
+            )
+            new_priors = self._constrained_priors()
+            new_priors.normalization_file = priors.normalization_file
+            new_priors.sample_subset = Mock()
+            self.assertEqual(new_priors.normalize_constraint_factor(("mass", "speed")), factor)
+            new_priors.sample_subset.assert_not_called()
+
+    def test_normalization_file_written_with_prior_file(self):
+        priors = self._constrained_priors()
+        priors._cached_normalizations[("mass", "speed")] = 2
+        with tempfile.TemporaryDirectory() as directory:
+            priors.to_file(directory, "test")
+            self.assertTrue(
+                os.path.isfile(os.path.join(directory, "test.prior.normalization.json"))
+            )
+            new_priors = bilby.core.prior.PriorDict(
+                dict(mass=bilby.core.prior.Uniform(0, 1))
+            )
+            new_priors.from_file(os.path.join(directory, "test.prior"))
+            self.assertEqual(
+                new_priors.normalization_file,
+                os.path.join(directory, "test.prior.normalization.json"),
+            )
+
+    def test_parsed_prior_cache_disabled_by_default(self):
+        bilby.core.prior.dict._parsed_prior_cache.clear()
+        with mock.patch.dict(os.environ):
+            os.environ.pop("BILBY_PRIOR_CACHE", None)
+            os.environ.pop("BILBY_PRIOR_CACHE_DIRECTORY", None)
+            bilby.core.prior.PriorDict(filename=self.default_prior_file)
+        self.assertEqual(len(bilby.core.prior.dict._parsed_prior_cache), 0)
+
+    @mock.patch.dict(os.environ, {"BILBY_PRIOR_CACHE": "1"})
+    def test_read_from_file_uses_parsed_prior_cache(self):
+        priors = bilby.core.prior.PriorDict(filename=self.default_prior_file)
+        new_priors = bilby.core.prior.PriorDict(filename=self.default_prior_file)
+        self.assertEqual(priors, new_priors)
+        self.assertIsNot(priors["mass_1"], new_priors["mass_1"])
+        key = new_priors._parsed_prior_key(self.default_prior_file)
+        self.assertIn(key, bilby.core.prior.dict._parsed_prior_cache)
+        bbh_priors = bilby.gw.prior.BBHPriorDict(dict())
+        self.assertNotEqual(key, bbh_priors._parsed_prior_key(self.default_prior_file))
+
+    @mock.patch.dict(os.environ, {"BILBY_PRIOR_CACHE": "1"})
+    def test_parsed_prior_cache_changed_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "test.prior")
+            with open(filename, "w") as ff:
+                ff.write("mass = Uniform(minimum=0, maximum=1)\n")
+            self.assertEqual(bilby.core.prior.PriorDict(filename)["mass"].maximum, 1)
+            with open(filename, "w") as ff:
+                ff.write("mass = Uniform(minimum=0, maximum=2)\n")
+            self.assertEqual(bilby.core.prior.PriorDict(filename)["mass"].maximum, 2)
+
+    @mock.patch.dict(os.environ, {"BILBY_PRIOR_CACHE": "1"})
+    def test_parsed_prior_cache_changed_data_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            data_file = os.path.join(directory, "mass.txt")
+            np.savetxt(data_file, np.array([[0, 1, 2], [1, 1, 1]]).T)
+            filename = os.path.join(directory, "test.prior")
+            with open(filename, "w") as ff:
+                ff.write(
+                    "mass = FromFile(file_name='{}', minimum=0, maximum=2, name='mass')\n".format(
+                        data_file
+                    )
+                )
+            self.assertAlmostEqual(bilby.core.prior.PriorDict(filename)["mass"].prob(2), 0.5)
+            np.savetxt(data_file, np.array([[0, 1, 2], [1, 1, 2]]).T)
+            os.utime(data_file, ns=(0, 10 ** 9))
+            self.assertAlmostEqual(bilby.core.prior.PriorDict(filename)["mass"].prob(2), 0.8)
+
+    @mock.patch.dict(os.environ, {"BILBY_PRIOR_CACHE": "1"})
+    def test_parsed_prior_cache_is_bounded(self):
+        bilby.core.prior.dict._parsed_prior_cache.clear()
+        size = bilby.core.prior.dict._PARSED_PRIOR_CACHE_SIZE
+        with tempfile.TemporaryDirectory() as directory:
+            for ii in range(size + 2):
+                filename = os.path.join(directory, "test_{}.prior".format(ii))
+                with open(filename, "w") as ff:
+                    ff.write("mass = Uniform(minimum=0, maximum={})\n".format(ii + 1))
+                bilby.core.prior.PriorDict(filename)
+            self.assertEqual(len(bilby.core.prior.dict._parsed_prior_cache), size)
+            first = bilby.core.prior.PriorDict(os.path.join(directory, "test_0.prior"))
+            self.assertNotIn(
+                first._parsed_prior_key(os.path.join(directory, "test_1.prior")),
+                bilby.core.prior.dict._parsed_prior_cache,
+            )
+
+    def test_parsed_prior_cache_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with mock.patch.dict(os.environ, {"BILBY_PRIOR_CACHE_DIRECTORY": directory}):
+                bilby.core.prior.dict._parsed_prior_cache.clear()
+                priors = bilby.core.prior.PriorDict(filename=self.default_prior_file)
+                key = priors._parsed_prior_key(self.default_prior_file)
+                self.assertTrue(os.path.isfile(os.path.join(directory, key + ".pkl")))
+                bilby.core.prior.dict._parsed_prior_cache.clear()
+                with mock.patch("bilby.core.prior.PriorDict.from_dictionary") as parse:
+                    new_priors = bilby.core.prior.PriorDict(filename=self.default_prior_file)
+                    parse.assert_not_called()
+                self.assertEqual(priors, new_priors)
+
+    def test_parsed_prior_cache_directory_writable_by_others(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with mock.patch.dict(os.environ, {"BILBY_PRIOR_CACHE_DIRECTORY": directory}):
+                bilby.core.prior.dict._parsed_prior_cache.clear()
+                bilby.core.prior.PriorDict(filename=self.default_prior_file)
+                os.chmod(directory, 0o777)
+                bilby.core.prior.dict._parsed_prior_cache.clear()
+                with mock.patch("bilby.core.prior.PriorDict.from_dictionary") as parse:
+                    bilby.core.prior.PriorDict(filename=self.default_prior_file)
+                    parse.assert_called_once()
+
+    def test_compiled_prior_transform(self):
+        keys = ["speed", "mass", "length"]
+        theta = np.random.uniform(0, 1, (10, 3))
+        transform = self.prior_set_from_dict.compile_prior_transform(keys)
+        result = transform(theta)
+        self.assertEqual(result.shape, (10, 3))
+        for ii in range(10):
+            np.testing.assert_allclose(
+                result[ii], self.prior_set_from_dict.rescale(keys, theta[ii])
+            )
+        np.testing.assert_allclose(result[3], transform(theta[3]))
+
+    def test_compiled_prior_transform_is_cached(self):
+        keys = ["mass", "speed"]
+        transform = self.prior_set_from_dict.compile_prior_transform(keys)
+        self.assertIs(transform, self.prior_set_from_dict.compile_prior_transform(keys))
+        self.prior_set_from_dict["mass"] = bilby.core.prior.Uniform(1, 2)
+        new_transform = self.prior_set_from_dict.compile_prior_transform(keys)
+        self.assertIsNot(transform, new_transform)
+        self.assertGreaterEqual(new_transform([0.5, 0.5])[0], 1)
+
+    def test_compiled_prior_transform_wrong_shape(self):
+        transform = self.prior_set_from_dict.compile_prior_transform(["mass"])
+        with self.assertRaises(ValueError):
+            transform(np.zeros((4, 2)))
+
     def test_cdf(self):
         """
         Test that the CDF method is the inverse of the rescale method.
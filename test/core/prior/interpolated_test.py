@@ -1,5 +1,88 @@
+import pickle
 import unittest
 
+import numpy as np
+
+import bilby
+
+
+class TestInterped(unittest.TestCase):
+    def setUp(self):
+        self.xx = np.linspace(0, 1, 1000)
+        self.yy = 1 + self.xx
+        self.prior = bilby.core.prior.Interped(xx=self.xx, yy=self.yy)
+        self.unit = np.random.uniform(0, 1, 100)
+
+    def tearDown(self):
+        del self.prior
+
+    def test_rescale_matches_interp1d(self):
+        np.testing.assert_allclose(
+            self.prior.rescale(self.unit),
+            self.prior.inverse_cumulative_distribution(self.unit),
+        )
+        self.assertIsInstance(self.prior.rescale(0.5), float)
+
+    def test_prob_and_cdf_match_interp1d(self):
+        values = np.linspace(-0.5, 1.5, 100)
+        np.testing.assert_allclose(
+            self.prior.prob(values), self.prior.probability_density(values)
+        )
+        np.testing.assert_allclose(
+            self.prior.cdf(values), self.prior.cumulative_distribution(values)
+        )
+
+    def test_rescale_out_of_bounds(self):
+        with self.assertRaises(ValueError):
+            self.prior.rescale(1.5)
+        with self.assertRaises(ValueError):
+            self.prior.rescale(np.array([0.5, -0.1]))
+
+    def test_rescale_without_lookup_attributes(self):
+        # As for priors pickled before lookup tables were added
+        del self.prior._lookup_table
+        del self.prior._lookup_settings
+        prior = pickle.loads(pickle.dumps(self.prior))
+        np.testing.assert_allclose(
+            prior.rescale(self.unit), prior.inverse_cumulative_distribution(self.unit)
+        )
+        prior.maximum = 0.5
+        self.assertAlmostEqual(prior.rescale(1.0), 0.5)
+
+    def test_lookup_table(self):
+        error = self.prior.build_lookup_table(resolution=2 ** 12)
+        self.assertLess(error, 1e-3)
+        np.testing.assert_allclose(
+            self.prior.rescale(self.unit),
+            self.prior.inverse_cumulative_distribution(self.unit),
+            atol=error,
+        )
+        self.assertAlmostEqual(self.prior.rescale(0.3), float(self.prior.rescale(np.array(0.3))))
+        self.assertEqual(self.prior.rescale(1.0), 1.0)
+        with self.assertRaises(ValueError):
+            self.prior.rescale(1.5)
+
+    def test_lookup_table_tolerance(self):
+        error = self.prior.build_lookup_table(resolution=16, tolerance=1e-5)
+        self.assertLessEqual(error, 1e-5)
+        self.assertGreater(self.prior._lookup_table.resolution, 16)
+
+    def test_lookup_table_unreachable_tolerance(self):
+        self.prior.build_lookup_table(resolution=16, tolerance=1e-12, max_resolution=64)
+        self.assertIsNone(self.prior._lookup_table)
+
+    def test_lookup_table_rebuilt_with_limits(self):
+        self.prior.build_lookup_table(resolution=2 ** 12)
+        self.prior.maximum = 0.5
+        self.assertAlmostEqual(self.prior.rescale(1.0), 0.5)
+
+    def test_remove_lookup_table(self):
+        self.prior.build_lookup_table()
+        self.prior.remove_lookup_table()
+        self.assertIsNone(self.prior._lookup_table)
+        self.prior.maximum = 0.5
+        self.assertIsNone(self.prior._lookup_table)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@ import unittest
 import bilby
 
 import numpy as np
+import scipy.stats
 
 
 class TestMultivariateGaussianDistFromRepr(unittest.TestCase):
@@ -95,5 +96,80 @@ class TestMultivariateGaussianDistParameterScales(unittest.TestCase):
         self._test_mvg_ln_prob_diff_expected(mvg, mus, sigmas, corrcoefs)
 
 
+class TestMultivariateGaussianDistBatch(unittest.TestCase):
+    def setUp(self):
+        corrcoefs = np.array([[1, 0.5, 0.2], [0.5, 1, 0.1], [0.2, 0.1, 1]])
+        self.mvg = bilby.core.prior.MultivariateGaussianDist(
+            names=["a", "b", "c"],
+            nmodes=2,
+            mus=[[0, 1, 2], [3, 4, 5]],
+            sigmas=[[1, 2, 3], [0.5, 0.5, 0.5]],
+            corrcoefs=[corrcoefs, corrcoefs],
+            weights=[1, 3],
+        )
+        self.unit = np.random.uniform(0, 1, (100, 3))
+
+    def test_batch_rescale_matches_rescale(self):
+        for mode in range(2):
+            np.testing.assert_allclose(
+                self.mvg.batch_rescale(self.unit, mode=mode),
+                self.mvg.rescale(self.unit, mode=mode),
+            )
+
+    def test_batch_rescale_modes_per_sample(self):
+        modes = np.arange(100) % 2
+        samples = self.mvg.batch_rescale(self.unit, mode=modes)
+        np.testing.assert_allclose(
+            samples[modes == 1], self.mvg.rescale(self.unit[modes == 1], mode=1)
+        )
+        np.testing.assert_allclose(
+            samples[modes == 0], self.mvg.rescale(self.unit[modes == 0], mode=0)
+        )
+
+    def test_batch_rescale_does_not_store_state(self):
+        self.mvg.batch_rescale(self.unit)
+        self.assertFalse(self.mvg.filled_rescale())
+        self.assertEqual(self.mvg.current_sample, dict())
+
+    def test_batch_rescale_wrong_shape(self):
+        with self.assertRaises(ValueError):
+            self.mvg.batch_rescale(np.zeros((10, 2)))
+
+    def test_batch_ln_prob(self):
+        samples = self.mvg.batch_rescale(self.unit)
+        expected = [
+            np.logaddexp(
+                *[
+                    scipy.stats.multivariate_normal(
+                        mean=self.mvg.mus[ii], cov=self.mvg.covs[ii]
+                    ).logpdf(sample)
+                    for ii in range(2)
+                ]
+            )
+            for sample in samples
+        ]
+        np.testing.assert_allclose(self.mvg.batch_ln_prob(samples), expected)
+        self.assertAlmostEqual(self.mvg.ln_prob(samples[0]), expected[0])
+
+    def test_cached_matrices_rebuilt_when_missing(self):
+        samples = self.mvg.batch_rescale(self.unit, mode=1)
+        expected_ln_prob = self.mvg.batch_ln_prob(samples)
+        del self.mvg.choleskys
+        del self.mvg.rescale_matrices
+        np.testing.assert_allclose(self.mvg.batch_ln_prob(samples), expected_ln_prob)
+        self.assertAlmostEqual(self.mvg.ln_prob(samples[0]), expected_ln_prob[0])
+        del self.mvg.choleskys
+        del self.mvg.rescale_matrices
+        np.testing.assert_allclose(self.mvg.batch_rescale(self.unit, mode=1), samples)
+
+    def test_batch_ln_prob_bounds(self):
+        mvg = bilby.core.prior.MultivariateGaussianDist(
+            names=["a", "b"], bounds=[(-1, 1), (-1, 1)]
+        )
+        ln_prob = mvg.batch_ln_prob(np.array([[0, 0], [2, 0], [0, 2]]))
+        self.assertTrue(np.isfinite(ln_prob[0]))
+        self.assertTrue(np.all(ln_prob[1:] == -np.inf))
+
+
 if __name__ == "__main__":
     unittest.main()
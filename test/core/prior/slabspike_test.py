@@ -200,3 +200,25 @@ class TestSlabSpikeClasses(unittest.TestCase):
                 (vals - self.spike_height) / slab_spike.slab_fraction)
             actual = slab_spike.rescale(vals)
             self.assertTrue(np.allclose(expected, actual, rtol=1e-5))
+
+    def test_rescale_scalar_matches_array(self):
+        vals = np.random.uniform(0, 1, 100)
+        for slab_spike in self.slab_spikes:
+            expected = slab_spike.rescale(vals)
+            actual = np.array([slab_spike.rescale(val) for val in vals])
+            self.assertIsInstance(slab_spike.rescale(0.5), float)
+            self.assertTrue(np.allclose(expected, actual))
+
+    def test_rescale_at_spike_boundaries(self):
+        for slab_spike in self.slab_spikes:
+            lower = slab_spike.inverse_cdf_below_spike
+            upper = lower + slab_spike.spike_height
+            self.assertEqual(self.spike_loc, slab_spike.rescale(lower))
+            self.assertEqual(self.spike_loc, slab_spike.rescale(upper))
+            self.assertLess(slab_spike.rescale(lower - 1e-6), self.spike_loc)
+            self.assertGreater(slab_spike.rescale(upper + 1e-6), self.spike_loc)
+
+    def test_rescale_only_spike(self):
+        slab_spike = SlabSpikePrior(self.slabs[0], spike_height=1, spike_location=self.spike_loc)
+        vals = np.linspace(0, 1, 10)
+        self.assertTrue(np.array_equal(np.full(10, self.spike_loc), slab_spike.rescale(vals)))
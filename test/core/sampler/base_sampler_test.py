@@ -1,7 +1,9 @@
 import copy
 import os
 import shutil
+import sys
 import unittest
+from unittest import mock
 from unittest.mock import MagicMock
 from parameterized import parameterized
 
@@ -189,6 +191,38 @@ class GenericSamplerTest(unittest.TestCase):
         sampler._close_pool()
 
 
+class TestCreatePool(unittest.TestCase):
+    def setUp(self):
+        self.likelihood = bilby.core.likelihood.Likelihood(dict())
+
+    def test_no_pool_for_single_process(self):
+        pool = bilby.core.sampler.base_sampler.create_pool(
+            likelihood=self.likelihood, npool=1
+        )
+        self.assertIsNone(pool)
+
+    def test_multiprocessing_pool(self):
+        pool = bilby.core.sampler.base_sampler.create_pool(
+            likelihood=self.likelihood, npool=2, parallel_comms="multiprocessing"
+        )
+        self.assertEqual(pool._processes, 2)
+        bilby.core.sampler.base_sampler.close_pool(pool)
+
+    def test_mpi_falls_back_without_mpi4py(self):
+        with mock.patch.dict(sys.modules, {"mpi4py.futures": None}):
+            pool = bilby.core.sampler.base_sampler.create_pool(
+                likelihood=self.likelihood, npool=2, parallel_comms="mpi"
+            )
+        self.assertNotIsInstance(pool, bilby.core.sampler.base_sampler.MPIPool)
+        self.assertEqual(pool._processes, 2)
+        bilby.core.sampler.base_sampler.close_pool(pool)
+
+    def test_parallel_comms_from_environment(self):
+        with mock.patch.dict(os.environ, {"BILBY_PARALLEL_COMMS": "unknown"}):
+            with self.assertRaises(ValueError):
+                bilby.core.sampler.base_sampler.create_pool(npool=2)
+
+
 class ReorderLikelihoodsTest(unittest.TestCase):
     def setUp(self):
         self.unsorted_ln_likelihoods = np.array([1, 5, 2, 5, 1])
@@ -1,4 +1,7 @@
+import os
+import tempfile
 import unittest
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -507,6 +510,204 @@ class TestGenerateAllParameters(unittest.TestCase):
         for key in extra_expected:
             self.assertIn(key, converted)
 
+    def test_fused_likelihood_parameters_match_sequential(self):
+        priors = bilby.gw.prior.BBHPriorDict()
+        priors["geocent_time"] = bilby.core.prior.Uniform(0.4, 0.6)
+        ifos = bilby.gw.detector.InterferometerList(["H1", "L1"])
+        ifos.set_strain_data_from_power_spectral_densities(duration=1, sampling_frequency=256)
+        wfg = bilby.gw.waveform_generator.WaveformGenerator(
+            frequency_domain_source_model=bilby.gw.source.lal_binary_black_hole,
+            parameter_conversion=bilby.gw.conversion.convert_to_lal_binary_black_hole_parameters,
+        )
+        likelihood = bilby.gw.likelihood.GravitationalWaveTransient(
+            interferometers=ifos,
+            waveform_generator=wfg,
+            priors=priors,
+            phase_marginalization=True,
+            time_marginalization=True,
+        )
+        self.parameters["time_jitter"] = 0.0
+        self.parameters["geocent_time"] = 0.5
+        samples = pd.DataFrame(self.parameters, index=range(3))
+        samples["waveform_approximant"] = "IMRPhenomPv2"
+        samples["reference_frequency"] = 50.0
+        samples["minimum_frequency"] = 20.0
+        bilby.core.utils.random.seed(10)
+        fused = bilby.gw.conversion._compute_likelihood_derived_parameters(
+            samples.copy(), likelihood, use_cache=False
+        )
+        bilby.core.utils.random.seed(10)
+        sequential = bilby.gw.conversion.compute_per_detector_log_likelihoods(
+            samples.copy(), likelihood
+        )
+        bilby.gw.conversion.generate_posterior_samples_from_marginalized_likelihood(
+            sequential, likelihood, use_cache=False
+        )
+        bilby.gw.conversion.compute_snrs(sequential, likelihood)
+        for key in [
+            "H1_log_likelihood",
+            "L1_log_likelihood",
+            "geocent_time",
+            "phase",
+            "H1_optimal_snr",
+            "L1_matched_filter_snr",
+        ]:
+            np.testing.assert_allclose(fused[key], sequential[key], rtol=1e-10)
+
+
+class TestConversionCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_filename = os.path.join(self.directory.name, "cache.pickle")
+        self.samples = pd.DataFrame(dict(a=np.arange(25.0), b=np.arange(25.0) ** 2))
+        self.fill_args = [(ii, row) for ii, row in self.samples.iterrows()]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    @staticmethod
+    def _func(args):
+        ii, row = args
+        return row["a"] + row["b"], ii
+
+    def _map(self, block=10, func=None):
+        cached_blocks, journal = conversion._read_conversion_cache(self.samples, self.cache_filename)
+        return conversion._map_in_blocks(
+            func or self._func, self.fill_args, cached_blocks, None, block, journal
+        )
+
+    def test_map_in_blocks(self):
+        expected = [list(self._func(args)) for args in self.fill_args]
+        self.assertEqual(self._map(), expected)
+
+    def test_resume_from_cache(self):
+        expected = self._map()
+        func = mock.Mock(side_effect=self._func)
+        self.assertEqual(self._map(func=func), expected)
+        func.assert_not_called()
+
+    def test_resume_with_different_block_size(self):
+        expected = self._map(block=10)
+        cached_blocks, journal = conversion._read_conversion_cache(self.samples, self.cache_filename)
+        del cached_blocks[10]
+        func = mock.Mock(side_effect=self._func)
+        new = conversion._map_in_blocks(
+            func, self.fill_args, cached_blocks, None, 3, journal
+        )
+        self.assertEqual(new, expected)
+        self.assertEqual(func.call_count, 10)
+
+    def test_cache_is_appended(self):
+        self._map(block=10)
+        size = os.path.getsize(self.cache_filename)
+        cached_blocks, journal = conversion._read_conversion_cache(self.samples, self.cache_filename)
+        self.assertEqual(sorted(cached_blocks), [0, 10, 20])
+        conversion._append_conversion_cache(journal, 25, [[0, 0]])
+        self.assertGreater(os.path.getsize(self.cache_filename), size)
+
+    def test_truncated_record_is_discarded(self):
+        expected = self._map()
+        with open(self.cache_filename, "ab") as ff:
+            ff.write(b"\x80\x04\x95")
+        size = os.path.getsize(self.cache_filename)
+        cached_blocks, journal = conversion._read_conversion_cache(self.samples, self.cache_filename)
+        self.assertEqual(sorted(cached_blocks), [0, 10, 20])
+        self.assertEqual(os.path.getsize(self.cache_filename), size)
+        conversion._append_conversion_cache(journal, 30, [])
+        cached_blocks, _ = conversion._read_conversion_cache(self.samples, self.cache_filename)
+        self.assertEqual(sorted(cached_blocks), [0, 10, 20, 30])
+        self.assertEqual(self._map(func=mock.Mock()), expected)
+
+    def test_failed_repair_stops_caching(self):
+        self._map()
+        with open(self.cache_filename, "ab") as ff:
+            ff.write(b"\x80\x04\x95")
+        size = os.path.getsize(self.cache_filename)
+        cached_blocks, journal = conversion._read_conversion_cache(self.samples, self.cache_filename)
+        del cached_blocks[10]
+        with mock.patch("os.truncate", side_effect=OSError("read-only")):
+            with self.assertLogs("bilby", level="WARNING"):
+                new = conversion._map_in_blocks(
+                    self._func, self.fill_args, cached_blocks, None, 10, journal
+                )
+        self.assertEqual(new, [list(self._func(args)) for args in self.fill_args])
+        self.assertEqual(os.path.getsize(self.cache_filename), size)
+
+    def test_cache_for_different_samples_ignored(self):
+        self._map()
+        self.samples.loc[3, "a"] = -1
+        self.fill_args = [(ii, row) for ii, row in self.samples.iterrows()]
+        size = os.path.getsize(self.cache_filename)
+        cached_blocks, _ = conversion._read_conversion_cache(self.samples, self.cache_filename)
+        self.assertEqual(cached_blocks, dict())
+        self.assertEqual(os.path.getsize(self.cache_filename), size)
+        self.assertEqual(self._map()[3], [8.0, 3])
+        cached_blocks, _ = conversion._read_conversion_cache(self.samples, self.cache_filename)
+        self.assertEqual(sorted(cached_blocks), [0, 10, 20])
+
+
+class TestPrecessingSpinTransformation(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(10)
+        n_samples = 100
+        self.samples = pd.DataFrame(dict(
+            theta_jn=rng.uniform(0, np.pi, n_samples),
+            phi_jl=rng.uniform(0, 2 * np.pi, n_samples),
+            tilt_1=np.arccos(rng.uniform(-1, 1, n_samples)),
+            tilt_2=np.arccos(rng.uniform(-1, 1, n_samples)),
+            phi_12=rng.uniform(0, 2 * np.pi, n_samples),
+            a_1=rng.uniform(0, 0.99, n_samples),
+            a_2=rng.uniform(0, 0.99, n_samples),
+            mass_1=rng.uniform(10, 50, n_samples),
+            mass_2=rng.uniform(1, 10, n_samples),
+            reference_frequency=20.0,
+            phase=rng.uniform(0, 2 * np.pi, n_samples),
+        ))
+        self.samples.loc[:4, "tilt_1"] = 0.0
+        self.samples.loc[:4, "tilt_2"] = np.pi
+        self.samples["mass_ratio"] = self.samples["mass_2"] / self.samples["mass_1"]
+        self.keys = ["iota", "spin_1x", "spin_1y", "spin_1z", "spin_2x", "spin_2y", "spin_2z"]
+
+    def test_array_matches_lalsimulation(self):
+        from bilby.gw.utils import lalsim_SimInspiralTransformPrecessingNewInitialConditions
+
+        args = [
+            self.samples[key].values for key in
+            ["theta_jn", "phi_jl", "tilt_1", "tilt_2", "phi_12", "a_1", "a_2"]
+        ] + [
+            self.samples["mass_1"].values * bilby.core.utils.solar_mass,
+            self.samples["mass_2"].values * bilby.core.utils.solar_mass,
+            self.samples["reference_frequency"].values,
+            self.samples["phase"].values,
+        ]
+        vectorized = np.array(conversion.transform_precessing_spins(*args))
+        expected = np.array([
+            lalsim_SimInspiralTransformPrecessingNewInitialConditions(
+                *[arg[ii] for arg in args]
+            ) for ii in range(len(self.samples))
+        ]).T
+        np.testing.assert_allclose(vectorized, expected, atol=1e-12)
+
+    def test_dataframe_matches_dictionaries(self):
+        converted = conversion.generate_spin_parameters(self.samples)
+        for ii in [0, 10, 50]:
+            single = conversion.generate_spin_parameters(dict(self.samples.iloc[ii]))
+            for key in self.keys + ["phi_1", "phi_2", "chi_p"]:
+                self.assertAlmostEqual(converted[key].iloc[ii], single[key], places=12)
+
+    def test_aligned_spins(self):
+        converted = conversion.generate_component_spins(self.samples.iloc[:5])
+        for key in ["spin_1x", "spin_1y", "spin_2x", "spin_2y"]:
+            self.assertTrue(np.all(converted[key] == 0))
+        np.testing.assert_array_equal(converted["iota"], self.samples["theta_jn"].iloc[:5])
+        np.testing.assert_allclose(converted["spin_2z"], -self.samples["a_2"].iloc[:5])
+
+    def test_invalid_reference_frequency(self):
+        samples = self.samples.copy()
+        samples["reference_frequency"] = 0.0
+        with self.assertRaises(ValueError):
+            conversion.generate_component_spins(samples)
+
 
 class TestDistanceTransformations(unittest.TestCase):
     def setUp(self):
@@ -868,6 +1069,85 @@ class TestEquationOfStateConversions(unittest.TestCase):
             self.assertAlmostEqual(self.lambda_2_polytrope[i], lambda_2, places=1)
             self.assertAlmostEqual(self.eos_check_polytrope[i], eos_check)
 
+    def test_spectral_params_to_lambda_1_lambda_2_array(self):
+        spectral_gammas = conversion.spectral_pca_to_spectral(
+            np.array(self.spectral_pca_gamma_0),
+            np.array(self.spectral_pca_gamma_1),
+            np.array(self.spectral_pca_gamma_2),
+            np.array(self.spectral_pca_gamma_3),
+        )
+        lambda_1, lambda_2, eos_check = conversion.spectral_params_to_lambda_1_lambda_2(
+            *spectral_gammas,
+            np.array(self.mass_1_source_spectral),
+            np.array(self.mass_2_source_spectral),
+        )
+        np.testing.assert_allclose(lambda_1, self.lambda_1_spectral, atol=0.5)
+        np.testing.assert_allclose(lambda_2, self.lambda_2_spectral, atol=0.5)
+        np.testing.assert_array_equal(eos_check, self.eos_check_spectral)
+
+    def test_polytrope_params_to_lambda_1_lambda_2_array_shares_families(self):
+        conversion._polytrope_or_causal_neutron_star_family.cache_clear()
+        args = [
+            np.array(self.polytrope_gamma_0),
+            np.array(self.polytrope_log10_pressure_1),
+            np.array(self.polytrope_gamma_1),
+            np.array(self.polytrope_log10_pressure_2),
+            np.array(self.polytrope_gamma_2),
+        ]
+        args = [np.concatenate([arg, arg]) for arg in args]
+        mass_1_source = np.concatenate([self.mass_1_source_polytrope] * 2)
+        mass_2_source = np.concatenate([self.mass_2_source_polytrope] * 2)
+        lambda_1, lambda_2, eos_check = conversion.polytrope_or_causal_params_to_lambda_1_lambda_2(
+            *args, mass_1_source, mass_2_source, 0
+        )
+        np.testing.assert_allclose(lambda_1, self.lambda_1_polytrope * 2, atol=0.01)
+        np.testing.assert_allclose(lambda_2, self.lambda_2_polytrope * 2, atol=0.1)
+        np.testing.assert_array_equal(eos_check, self.eos_check_polytrope * 2)
+        cache_info = conversion._polytrope_or_causal_neutron_star_family.cache_info()
+        self.assertEqual(cache_info.misses, len(self.mass_1_source_polytrope))
+        conversion.polytrope_or_causal_params_to_lambda_1_lambda_2(
+            *args, mass_1_source, mass_2_source, 0
+        )
+        cache_info = conversion._polytrope_or_causal_neutron_star_family.cache_info()
+        self.assertEqual(cache_info.misses, len(self.mass_1_source_polytrope))
+
+
+class TestBinaryLoveConversions(unittest.TestCase):
+    def setUp(self):
+        self.binary_love_uniform = np.array([0.3, 0.5, 0.9])
+        self.lambda_symmetric = np.array([400., 50., 2000.])
+        self.mass_ratio = np.array([0.8, 0.95, 0.6])
+
+    def test_manual_marginalisation_known_value(self):
+        lambda_1, lambda_2 = conversion.binary_love_lambda_symmetric_to_lambda_1_lambda_2_manual_marginalisation(
+            0.3, 400., 0.8)
+        self.assertAlmostEqual(lambda_1, 165.42295407680172)
+        self.assertAlmostEqual(lambda_2, 634.5770459231983)
+
+    def test_manual_marginalisation_array_matches_scalar(self):
+        lambda_1, lambda_2 = conversion.binary_love_lambda_symmetric_to_lambda_1_lambda_2_manual_marginalisation(
+            self.binary_love_uniform, self.lambda_symmetric, self.mass_ratio)
+        for ii in range(len(self.lambda_symmetric)):
+            expected = conversion.binary_love_lambda_symmetric_to_lambda_1_lambda_2_manual_marginalisation(
+                self.binary_love_uniform[ii], self.lambda_symmetric[ii], self.mass_ratio[ii])
+            self.assertAlmostEqual(lambda_1[ii], expected[0])
+            self.assertAlmostEqual(lambda_2[ii], expected[1])
+
+    def test_automatic_marginalisation_scalar_and_array(self):
+        lambda_1, lambda_2 = conversion.binary_love_lambda_symmetric_to_lambda_1_lambda_2_automatic_marginalisation(
+            400., 0.8)
+        self.assertEqual(np.shape(lambda_1), ())
+        self.assertAlmostEqual(lambda_1 + lambda_2, 800.)
+        bilby.core.utils.random.seed(10)
+        lambda_1, lambda_2 = conversion.binary_love_lambda_symmetric_to_lambda_1_lambda_2_automatic_marginalisation(
+            self.lambda_symmetric, self.mass_ratio)
+        bilby.core.utils.random.seed(10)
+        binary_love_uniform = bilby.core.utils.random.rng.uniform(0, 1, 3)
+        expected = conversion.binary_love_lambda_symmetric_to_lambda_1_lambda_2_manual_marginalisation(
+            binary_love_uniform, self.lambda_symmetric, self.mass_ratio)
+        np.testing.assert_allclose(lambda_1, expected[0])
+        np.testing.assert_allclose(lambda_2, expected[1])
+
 
 if __name__ == "__main__":
     unittest.main()
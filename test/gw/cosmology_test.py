@@ -1,6 +1,8 @@
 import unittest
 
-from astropy.cosmology import WMAP9, Planck15
+import numpy as np
+from astropy import units
+from astropy.cosmology import WMAP9, Planck15, z_at_value
 from bilby.gw import cosmology
 
 
@@ -49,5 +51,43 @@ class TestGetCosmology(unittest.TestCase):
         self.assertEqual(cosmology.get_cosmology().name, "Planck15")
 
 
+class TestRedshiftAtDistance(unittest.TestCase):
+    def setUp(self):
+        self.distances = np.geomspace(1, 1e4, 50)
+
+    def test_matches_z_at_value(self):
+        for distance_type in ["luminosity_distance", "comoving_distance"]:
+            redshifts = cosmology.redshift_at_distance(
+                self.distances, cosmology="WMAP9", distance_type=distance_type
+            )
+            distance_function = getattr(WMAP9, distance_type)
+            expected = np.array([
+                z_at_value(distance_function, distance * units.Mpc, ztol=1e-12).value
+                for distance in self.distances
+            ])
+            np.testing.assert_allclose(redshifts, expected, rtol=1e-7)
+
+    def test_interpolant_is_cached(self):
+        cosmology.redshift_at_distance(self.distances, cosmology="WMAP9")
+        key = (repr(WMAP9), "luminosity_distance")
+        interpolant = cosmology._REDSHIFT_INTERPOLANTS[key]
+        cosmology.redshift_at_distance(self.distances, cosmology="WMAP9")
+        self.assertIs(cosmology._REDSHIFT_INTERPOLANTS[key], interpolant)
+
+    def test_scalar_and_out_of_range(self):
+        redshift = cosmology.redshift_at_distance(1e3, cosmology="WMAP9")
+        self.assertIsInstance(redshift, float)
+        redshifts = cosmology.redshift_at_distance(np.array([0, 1e3, 1e6]), cosmology="WMAP9")
+        self.assertEqual(redshifts[0], 0)
+        self.assertAlmostEqual(redshifts[1], redshift)
+        self.assertAlmostEqual(
+            WMAP9.luminosity_distance(redshifts[2]).value / 1e6, 1, places=6
+        )
+
+    def test_unknown_distance_type(self):
+        with self.assertRaises(ValueError):
+            cosmology.redshift_at_distance(1e3, distance_type="redshift")
+
+
 if __name__ == "__main__":
     unittest.main()
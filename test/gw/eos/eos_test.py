@@ -1,8 +1,9 @@
 import unittest
 import numpy
 import lalsimulation as lalsim
-from bilby.gw.eos import SpectralDecompositionEOS, EOSFamily, TabularEOS
+from bilby.gw.eos import SpectralDecompositionEOS, EOSFamily, TabularEOS, IntegrateTOV
 from bilby.core import utils
+from bilby.gw.eos import eos as bilby_eos
 
 
 KNOWN_TOV_RESULT = 1
@@ -62,6 +63,86 @@ class TestEOSFamily(unittest.TestCase):
         self.assertAlmostEqual(EOS_FROM_SPRECTRAL_DECOMPOSITION.eos.pseudo_enthalpy_from_energy_density(ENERGY_DENSITY),
                                0.02420629785967365)
 
+    def test_mass_increases_to_maximum_mass(self):
+        for family in [EOS_FROM_TABLE, EOS_FROM_SPRECTRAL_DECOMPOSITION]:
+            self.assertTrue(numpy.all(numpy.diff(family.mass) > 0))
+            self.assertAlmostEqual(
+                family.maximum_mass, family.mass[-1] * bilby_eos.conversion_dict['mass']['m_sol']
+            )
+
+    def test_maximum_mass_matches_lalsimulation(self):
+        lal_eos = lalsim.SimNeutronStarEOSByName('AP4')
+        lal_family = lalsim.CreateSimNeutronStarFamily(lal_eos)
+        lal_maximum_mass = lalsim.SimNeutronStarMaximumMass(lal_family) / utils.solar_mass
+        self.assertAlmostEqual(EOS_FROM_TABLE.maximum_mass / lal_maximum_mass, 1, places=3)
+
+    def test_spline_derivatives_match_finite_differences(self):
+        eos = EOS_FROM_TABLE.eos
+        pressures = numpy.logspace(numpy.log10(eos.minimum_pressure) - 1, numpy.log10(max(eos.pressure)) - 0.1, 50)
+        enthalpies = numpy.logspace(
+            numpy.log10(eos.minimum_pseudo_enthalpy) - 1, numpy.log10(max(eos.pseudo_enthalpy)) - 0.1, 50)
+        dp = 1e-6 * pressures
+        dh = 1e-6 * enthalpies
+        numpy.testing.assert_allclose(
+            eos.dedp(pressures),
+            (eos.energy_from_pressure(pressures + dp) - eos.energy_from_pressure(pressures - dp)) / (2 * dp),
+            rtol=1e-4)
+        numpy.testing.assert_allclose(
+            eos.dedh(enthalpies),
+            (eos.energy_density_from_pseudo_enthalpy(enthalpies + dh) -
+             eos.energy_density_from_pseudo_enthalpy(enthalpies - dh)) / (2 * dh),
+            rtol=1e-4)
+
+    def test_tov_quantities_from_pseudo_enthalpy(self):
+        eos = EOS_FROM_TABLE.eos
+        enthalpies = numpy.logspace(
+            numpy.log10(eos.minimum_pseudo_enthalpy) - 1, numpy.log10(max(eos.pseudo_enthalpy)) - 0.1, 50)
+        energy_density, pressure, dedp = eos.tov_quantities_from_pseudo_enthalpy(enthalpies)
+        numpy.testing.assert_allclose(energy_density, eos.energy_density_from_pseudo_enthalpy(enthalpies))
+        numpy.testing.assert_allclose(pressure, eos.pressure_from_pseudo_enthalpy(enthalpies))
+        dh = 1e-6 * enthalpies
+        numpy.testing.assert_allclose(
+            dedp,
+            (eos.energy_density_from_pseudo_enthalpy(enthalpies + dh) -
+             eos.energy_density_from_pseudo_enthalpy(enthalpies - dh)) /
+            (eos.pressure_from_pseudo_enthalpy(enthalpies + dh) - eos.pressure_from_pseudo_enthalpy(enthalpies - dh)),
+            rtol=1e-4)
+        core = enthalpies > 1e-2
+        numpy.testing.assert_allclose(dedp[core], eos.dedp(pressure[core]), rtol=1e-2)
+        self.assertAlmostEqual(eos.tov_quantities_from_pseudo_enthalpy(ENTHALPY)[2],
+                               eos.tov_quantities_from_pseudo_enthalpy(numpy.array([ENTHALPY, ENTHALPY]))[2][0])
+
+
+class TestIntegrateTOV(unittest.TestCase):
+    def test_vectorized_matches_scalar(self):
+        eos = EOS_FROM_TABLE.eos
+        energy_densities = numpy.geomspace(2e-10, 1e-9, 5)
+        masses, radii, k2s = IntegrateTOV(eos, energy_densities).integrate_TOV()
+        self.assertEqual(masses.shape, energy_densities.shape)
+        for ii, energy_density in enumerate(energy_densities):
+            mass, radius, k2 = IntegrateTOV(eos, energy_density).integrate_TOV()
+            self.assertAlmostEqual(masses[ii] / mass, 1, places=3)
+            self.assertAlmostEqual(radii[ii] / radius, 1, places=3)
+            self.assertAlmostEqual(k2s[ii] / k2, 1, places=3)
+
+
+class TestSpectralDecompositionEOS(unittest.TestCase):
+    def test_table_matches_quadrature(self):
+        x_range = numpy.linspace(0, XMAX, BILBY_MPA1.npts)[::20]
+        energy_density = numpy.array([
+            SpectralDecompositionEOS.energy_density(BILBY_MPA1, xx, ENERGY_DENSITY_0) for xx in x_range])
+        numpy.testing.assert_allclose(
+            BILBY_MPA1.e_pdat[-BILBY_MPA1.npts:, 1][::20], energy_density * 0.1 * utils.gravitational_constant /
+            utils.speed_of_light ** 4, rtol=1e-8)
+
+    def test_table_is_cached(self):
+        bilby_eos._spectral_decomposition_table.cache_clear()
+        first = SpectralDecompositionEOS(GAMMAS, PRESSURE_0, ENERGY_DENSITY_0, XMAX)
+        second = SpectralDecompositionEOS(numpy.array(GAMMAS), PRESSURE_0, ENERGY_DENSITY_0, XMAX)
+        self.assertEqual(bilby_eos._spectral_decomposition_table.cache_info().hits, 1)
+        self.assertIs(first.e_pdat, second.e_pdat)
+        self.assertFalse(first.e_pdat.flags.writeable)
+
 
 class TestBilbyLALSimComparison(unittest.TestCase):
     def test_spectral_decomposition_MPA1(self):
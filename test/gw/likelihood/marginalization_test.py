@@ -449,6 +449,92 @@ class TestMarginalizations(unittest.TestCase):
         for key in marginalizations:
             self.assertFalse(marginalizations[key] and reference_values[key] == output[key])
 
+    @parameterized.expand(
+        itertools.product(["regular", "relbin"], *itertools.repeat([True, False], 3)),
+        name_func=lambda func, num, param: (
+            f"{func.__name__}_{num}__{param.args[0]}_" + "_".join([
+                ["D", "P", "T"][ii] for ii, val
+                in enumerate(param.args[1:]) if val
+            ])
+        )
+    )
+    def test_marginalization_reconstruction_batch(self, kind, distance, phase, time):
+        marginalizations = dict(
+            geocent_time=time,
+            luminosity_distance=distance,
+            phase=phase,
+        )
+        like = self.get_likelihood(
+            kind=kind,
+            distance_marginalization=distance,
+            time_marginalization=time,
+            phase_marginalization=phase,
+        )
+        params = self.parameters.copy()
+        reference_values = dict(
+            luminosity_distance=self.priors["luminosity_distance"].rescale(0.5),
+            geocent_time=self.interferometers.start_time,
+            phase=0.0,
+        )
+        for key in marginalizations:
+            if marginalizations[key]:
+                params[key] = reference_values[key]
+        samples = [params.copy() for _ in range(3)]
+        samples[1]["psi"] = 1.0
+        outputs = like.generate_posterior_samples_from_marginalized_likelihood(samples)
+        self.assertEqual(len(outputs), 3)
+        for output in outputs:
+            for key in marginalizations:
+                if marginalizations[key]:
+                    self.assertNotEqual(reference_values[key], output[key])
+                    self.assertGreaterEqual(output[key], like.priors[key].minimum)
+                    self.assertLessEqual(output[key], like.priors[key].maximum)
+        self.assertEqual(outputs[1]["psi"], 1.0)
+
+    def test_marginalization_reconstruction_batch_seeds(self):
+        like = self.get_likelihood(
+            kind="regular",
+            distance_marginalization=True,
+            time_marginalization=True,
+            phase_marginalization=True,
+        )
+        samples = [self.parameters.copy() for _ in range(3)]
+        samples[1]["psi"] = 1.0
+        seeds = np.random.SeedSequence(10).spawn(3)
+        outputs = like.generate_posterior_samples_from_marginalized_likelihood(
+            [sample.copy() for sample in samples], seeds=seeds
+        )
+        single = like.generate_posterior_samples_from_marginalized_likelihood(
+            [samples[1].copy()], seeds=seeds[1:2]
+        )[0]
+        for key in ["geocent_time", "luminosity_distance", "phase"]:
+            self.assertEqual(outputs[1][key], single[key])
+        self.assertNotEqual(outputs[0]["luminosity_distance"], outputs[2]["luminosity_distance"])
+
+
+class TestSampleFromGrid(unittest.TestCase):
+    def test_distribution(self):
+        from scipy.stats import kstest
+
+        from bilby.gw.likelihood.base import _sample_from_grid
+
+        xx = np.linspace(0, 1, 11)
+        samples = _sample_from_grid(xx, np.tile(xx, (10000, 1)))
+        self.assertGreater(kstest(samples, lambda x: x ** 2).pvalue, 1e-3)
+
+    def test_padded_grids(self):
+        from bilby.gw.likelihood.base import _sample_from_grid, _stack_grids
+
+        xx, yy = _stack_grids([
+            (np.array([0.0, 1.0, 2.0]), np.array([1.0, 1.0, 1.0])),
+            (np.array([5.0, 6.0]), np.array([0.0, 1.0])),
+        ])
+        self.assertEqual(xx.shape, (2, 3))
+        for _ in range(100):
+            first, second = _sample_from_grid(xx, yy)
+            self.assertTrue(0 <= first <= 2)
+            self.assertTrue(5 <= second <= 6)
+
 
 class CalibrationMarginalization(unittest.TestCase):
 
@@ -545,6 +545,133 @@ class TestConditionalChiUniformSpinMagnitude(unittest.TestCase):
         ks = ks_2samp(samples, np.random.uniform(0, priors["chi_1"].maximum, 100000))
         self.assertTrue(ks.pvalue > 0.001)
 
+    def test_lookup_table(self):
+        np.random.seed(42)
+        prior = bilby.gw.prior.ConditionalChiUniformSpinMagnitude(
+            minimum=0, maximum=0.8, name="a_1"
+        )
+        exact = bilby.gw.prior.ConditionalChiUniformSpinMagnitude(
+            minimum=0, maximum=0.8, name="a_1"
+        )
+        for resolution in [255, 256]:
+            prior.build_lookup_table(resolution=resolution)
+            unit = np.random.uniform(0, 1, 10000)
+            chi = np.random.uniform(-0.8, 0.8, 10000)
+            np.testing.assert_allclose(
+                prior.rescale(unit, chi_1=chi), exact.rescale(unit, chi_1=chi), atol=5e-3
+            )
+            rescaled = prior.rescale(unit[:10], chi_1=np.zeros(10))
+            self.assertTrue(np.all(np.isfinite(rescaled)))
+
+
+class TestConditionalChiInPlane(unittest.TestCase):
+
+    def setUp(self):
+        self.prior = bilby.gw.prior.ConditionalChiInPlane(
+            minimum=0, maximum=0.8, name="chi_1_in_plane"
+        )
+        self.exact = bilby.gw.prior.ConditionalChiInPlane(
+            minimum=0, maximum=0.8, name="chi_1_in_plane"
+        )
+
+    def test_lookup_table(self):
+        np.random.seed(42)
+        for resolution in [255, 256]:
+            error = self.prior.build_lookup_table(resolution=resolution)
+            self.assertTrue(np.isfinite(error))
+            self.assertEqual(self.prior._lookup_table.minimum, -0.8)
+            self.assertEqual(self.prior._lookup_table.maximum, 0.8)
+            unit = np.random.uniform(0, 1, 10000)
+            chi = np.random.uniform(-0.8, 0.8, 10000)
+            np.testing.assert_allclose(
+                self.prior.rescale(unit, chi_1=chi),
+                self.exact.rescale(unit, chi_1=chi),
+                atol=1e-2,
+            )
+            self.assertAlmostEqual(
+                self.prior.rescale(0.3, chi_1=0.2), self.exact.rescale(0.3, chi_1=0.2), places=2
+            )
+            self.assertAlmostEqual(
+                self.prior.rescale(0.3, chi_1=1e-4), self.exact.rescale(0.3, chi_1=1e-4), places=2
+            )
+
+    def test_lookup_table_endpoints(self):
+        self.prior.build_lookup_table(resolution=255)
+        unit = np.linspace(0, 1, 11)
+        for chi in [-0.8, 0.0, 0.8]:
+            rescaled = self.prior.rescale(unit, chi_1=np.full(11, chi))
+            self.assertTrue(np.all(np.isfinite(rescaled)))
+            self.assertTrue(np.all(rescaled >= 0))
+            self.assertTrue(np.all(rescaled <= 0.8))
+        np.testing.assert_allclose(self.prior.rescale(unit, chi_1=np.full(11, 0.8)), 0, atol=1e-12)
+
+
+class TestHealPixMapPriorDist(unittest.TestCase):
+
+    def setUp(self):
+        import healpy
+
+        np.random.seed(42)
+        bilby.core.utils.random.seed(42)
+        self.outdir = "outdir_healpix"
+        bilby.core.utils.check_directory_exists_and_if_not_mkdir(self.outdir)
+        self.nside = 8
+        npix = healpy.nside2npix(self.nside)
+        self.prob = np.random.uniform(0, 1, npix)
+        self.prob /= np.sum(self.prob)
+        self.distmu = np.random.uniform(100, 500, npix)
+        self.distsigma = np.random.uniform(20, 80, npix)
+        self.distnorm = 1 / (self.distmu ** 2 + self.distsigma ** 2)
+        self.filename = os.path.join(self.outdir, "map.fits")
+        healpy.write_map(
+            self.filename,
+            [self.prob, self.distmu, self.distsigma, self.distnorm],
+            overwrite=True,
+            dtype=[np.float64] * 4,
+        )
+        self.dist = bilby.gw.prior.HealPixMapPriorDist(
+            self.filename,
+            names=["ra", "dec", "luminosity_distance"],
+            bounds=[[0, 2 * np.pi], [-np.pi / 2, np.pi / 2], [0, 5000]],
+            distance=True,
+        )
+        self.unit = np.random.uniform(0, 1, (20, 3))
+
+    def tearDown(self):
+        import shutil
+
+        shutil.rmtree(self.outdir)
+
+    def test_batch_rescale_distance(self):
+        samples = self.dist.batch_rescale(self.unit)
+        self.assertEqual(samples.shape, (20, 3))
+        for unit, sample in zip(self.unit, samples):
+            pixel = int(round(float(self.dist.inverse_cdf(unit[0]))))
+            self.dist.update_distance(pixel)
+            self.assertAlmostEqual(sample[2], float(self.dist.distance_icdf(unit[2])))
+
+    def test_batch_ln_prob(self):
+        import healpy
+        from scipy.stats import norm
+
+        samples = self.dist.batch_rescale(self.unit)
+        pixels = healpy.ang2pix(self.nside, 0.5 * np.pi - samples[:, 1], samples[:, 0])
+        distances = samples[:, 2]
+        expected = (
+            np.log(self.prob[pixels] / self.dist.pixel_area)
+            + np.log(
+                self.distnorm[pixels]
+                * norm(loc=self.distmu[pixels], scale=self.distsigma[pixels]).pdf(distances)
+                * distances ** 2
+            )
+        )
+        outside = (
+            (samples[:, 0] < 0) | (samples[:, 0] > 2 * np.pi)
+            | (np.abs(samples[:, 1]) > np.pi / 2)
+        )
+        expected[outside] = -np.inf
+        np.testing.assert_allclose(self.dist.batch_ln_prob(samples), expected)
+
 
 if __name__ == "__main__":
     unittest.main()